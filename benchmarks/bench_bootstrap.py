@@ -0,0 +1,298 @@
+"""
+Bootstrap latency benchmarks for proboot.
+
+Measures CLI cold start, end-to-end bootstrap time per project type and the
+cost of individual steps. `npm`, `pnpm` and `npx` are replaced by the offline
+stand-ins in `node_tool_stub.py`, git identity and the proboot cache directory
+are isolated in a temporary directory, and the react-ts template store is
+seeded from a synthetic create-vite tarball, so the suite runs without network
+access and gives stable numbers.
+
+The project snapshot cache is disabled for the regular bootstrap benchmarks,
+so they measure project creation and the install. The `*_snapshot` variants
+enable it and measure restoring a cached project.
+
+Usage:
+    python benchmarks/bench_bootstrap.py [--repeat N] [--output results.json]
+        [--baseline benchmarks/baseline.json] [--threshold 0.25] [--save-baseline]
+
+Results are written as JSON. When a baseline exists, every benchmark whose
+median exceeds the baseline median by more than the threshold is reported as
+a regression and the script exits with status 1. Without a baseline the
+comparison is skipped, and the script says so.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+sys.path.insert(0, SRC_DIR)
+
+# pylint: disable=wrong-import-position
+from proboot.features.python_project.bootstrapper import bootstrap_python_project
+from proboot.features.python_project.file_creator import build_project_tree, create_venv
+from proboot.features.python_project.git_initializer import init_git_repo
+from proboot.features.react_typescript_project.bootstrapper import \
+    bootstrap_react_typescript_project
+from proboot.features.react_typescript_project.template_store import refresh_template
+from proboot.features.typescript_project.bootstrapper import bootstrap_typescript_project
+
+
+def _install_stubs(bin_dir):
+    """
+    Writes npm, pnpm and npx wrappers that run the offline stub.
+    """
+    os.makedirs(bin_dir)
+    stub = os.path.join(BENCH_DIR, "node_tool_stub.py")
+    for tool in ("npm", "pnpm", "npx"):
+        path = os.path.join(bin_dir, tool)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{stub}" {tool} "$@"\n')
+        os.chmod(path, 0o755)
+
+
+def _seed_react_template(work_dir):
+    """
+    Imports a small synthetic create-vite package into the template store.
+    """
+    files = {
+        "package/package.json": json.dumps({"name": "create-vite", "version": "0.0.0-bench"}),
+        "package/template-react-ts/package.json": json.dumps({
+            "name": "vite-react-typescript-starter", "private": True, "version": "0.0.0",
+            "type": "module", "scripts": {"dev": "vite", "build": "tsc -b && vite build"},
+            "dependencies": {"react": "^18.3.1", "react-dom": "^18.3.1"},
+            "devDependencies": {"typescript": "^5.5.3", "vite": "^5.4.1"},
+        }, indent=2),
+        "package/template-react-ts/_gitignore": "node_modules\ndist\n*.local\n",
+        "package/template-react-ts/index.html": "<div id=\"root\"></div>\n",
+        "package/template-react-ts/src/main.tsx": "import App from './App.tsx'\n",
+        "package/template-react-ts/src/App.tsx": "export default function App() { return null }\n",
+        "package/template-react-ts/tsconfig.json": "{}\n",
+    }
+    tarball = os.path.join(work_dir, "create-vite-bench.tgz")
+    with tarfile.open(tarball, "w:gz") as archive:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    refresh_template(tarball_path=tarball)
+
+
+@contextlib.contextmanager
+def _silenced_stdout():
+    """
+    Redirects stdout at the file descriptor level, including child processes.
+    """
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        os.dup2(devnull.fileno(), 1)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                yield
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved, 1)
+            os.close(saved)
+
+
+def _cli_cold_start(run_dir, index):
+    subprocess.run([sys.executable, "-m", "proboot.main", "--help"], cwd=run_dir, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def _bootstrap_python(run_dir, index):
+    bootstrap_python_project(f"py{index}", True, run_dir)
+
+
+def _bootstrap_typescript(run_dir, index):
+    bootstrap_typescript_project(f"ts{index}", True, run_dir)
+
+
+def _bootstrap_react_typescript(run_dir, index):
+    bootstrap_react_typescript_project(f"react{index}", True, run_dir)
+
+
+@contextlib.contextmanager
+def _snapshot_cache():
+    """
+    Enables the project snapshot cache, which the suite otherwise disables.
+    """
+    os.environ.pop("PROBOOT_NO_SNAPSHOT_CACHE")
+    try:
+        yield
+    finally:
+        os.environ["PROBOOT_NO_SNAPSHOT_CACHE"] = "1"
+
+
+def _bootstrap_typescript_snapshot(run_dir, index):
+    with _snapshot_cache():
+        bootstrap_typescript_project(f"ts{index}", True, run_dir)
+
+
+def _bootstrap_react_typescript_snapshot(run_dir, index):
+    with _snapshot_cache():
+        bootstrap_react_typescript_project(f"react{index}", True, run_dir)
+
+
+def _step_create_venv(run_dir, index):
+    project_dir = os.path.join(run_dir, f"venv{index}")
+    os.makedirs(project_dir)
+    create_venv(f"venv{index}", project_dir)
+
+
+def _step_git_initial_commit(run_dir, index):
+    project_dir = os.path.join(run_dir, f"git{index}")
+    tree = build_project_tree(f"git{index}")
+    tree.write(project_dir)
+    init_git_repo(project_dir, tree)
+
+
+BENCHMARKS = {
+    "cli_cold_start": _cli_cold_start,
+    "bootstrap_python": _bootstrap_python,
+    "bootstrap_typescript": _bootstrap_typescript,
+    "bootstrap_react_typescript": _bootstrap_react_typescript,
+    "bootstrap_typescript_snapshot": _bootstrap_typescript_snapshot,
+    "bootstrap_react_typescript_snapshot": _bootstrap_react_typescript_snapshot,
+    "step_create_venv": _step_create_venv,
+    "step_git_initial_commit": _step_git_initial_commit,
+}
+
+
+def run_benchmarks(names, repeat):
+    """
+    Runs the selected benchmarks in an isolated, offline environment.
+
+    Args:
+        names (list[str]): Benchmarks to run.
+        repeat (int): Timed runs per benchmark.
+
+    Returns:
+        dict: Benchmark results keyed by name.
+    """
+    work_dir = tempfile.mkdtemp(prefix="proboot-bench-")
+    saved_environ = dict(os.environ)
+    try:
+        bin_dir = os.path.join(work_dir, "bin")
+        _install_stubs(bin_dir)
+        os.environ.update({
+            "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+            "PYTHONPATH": SRC_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""),
+            "PROBOOT_CACHE_DIR": os.path.join(work_dir, "cache"),
+            "PROBOOT_NO_SNAPSHOT_CACHE": "1",
+            "GIT_AUTHOR_NAME": "proboot-bench",
+            "GIT_AUTHOR_EMAIL": "bench@proboot.invalid",
+            "GIT_COMMITTER_NAME": "proboot-bench",
+            "GIT_COMMITTER_EMAIL": "bench@proboot.invalid",
+        })
+        with _silenced_stdout():
+            _seed_react_template(work_dir)
+
+        results = {}
+        for name in names:
+            benchmark = BENCHMARKS[name]
+            run_dir = os.path.join(work_dir, name)
+            os.makedirs(run_dir)
+            timings = []
+            # The first, untimed run warms caches such as the golden venv.
+            for index in range(repeat + 1):
+                start = time.perf_counter()
+                with _silenced_stdout():
+                    benchmark(run_dir, index)
+                if index:
+                    timings.append(time.perf_counter() - start)
+            results[name] = {
+                "median_s": statistics.median(timings),
+                "min_s": min(timings),
+                "max_s": max(timings),
+                "runs": len(timings),
+            }
+            print(f"{name:<36} median {results[name]['median_s'] * 1000:9.1f} ms", file=sys.stderr)
+        return results
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Compares results with a baseline and returns the regressed benchmarks.
+
+    Args:
+        results (dict): Benchmark results keyed by name.
+        baseline (dict): Baseline results keyed by name.
+        threshold (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        list[str]: Names of benchmarks slower than the baseline by more than threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["median_s"] / baseline[name]["median_s"]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<36} {ratio:6.2f}x baseline{'  REGRESSION' if regressed else ''}",
+              file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark proboot bootstrap latency")
+    parser.add_argument("benchmarks", nargs="*", default=[],
+                        help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--output", default=None, help="Write results JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown before failing (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store the results as the new baseline")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.benchmarks) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.benchmarks or list(BENCHMARKS), args.repeat)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}; skipped the regression check. "
+              "Store one with --save-baseline.", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    if compare_to_baseline(results, baseline, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
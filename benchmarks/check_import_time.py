@@ -0,0 +1,107 @@
+"""
+Import-time budget check for the proboot entry point.
+
+Runs the CLI fast paths under `python -X importtime`, attributes to proboot
+every top-level import that the bare interpreter does not perform itself, and
+fails if
+
+- a module that the path must not need (for example a bootstrapper, `venv`
+  or `subprocess`) is imported, or
+- the cumulative import time exceeds the path's budget.
+
+Usage:
+    python benchmarks/check_import_time.py [--budget-scale 2.0]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+# Modules only needed once a project is actually bootstrapped. importlib.metadata
+# is only needed to rebuild the project type index, which the check warms first.
+BOOTSTRAP_MODULES = (
+    "proboot.features", "venv", "subprocess", "json", "tarfile", "concurrent.futures",
+    "importlib.metadata",
+)
+
+SCENARIOS = [
+    # (arguments, forbidden module prefixes, budget in milliseconds)
+    (["--version"], BOOTSTRAP_MODULES + ("argparse", "proboot.cli"), 10.0),
+    (["--help"], BOOTSTRAP_MODULES, 60.0),
+    (["--type", "unknown", "demo"], BOOTSTRAP_MODULES, 60.0),
+]
+
+
+def _imports(code):
+    """
+    Runs code under -X importtime and returns (name, depth, cumulative_us) per import.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=False,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            imports.append((name, len(indent) // 2, int(cumulative)))
+    return imports
+
+
+def check_scenario(args, forbidden, budget_ms, startup_modules):
+    """
+    Checks one CLI invocation against its forbidden modules and time budget.
+
+    Returns:
+        list[str]: Problems found; empty if the scenario passes.
+    """
+    code = (
+        f"import sys; sys.argv = ['proboot', *{args!r}]\n"
+        "from proboot.main import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass\n"
+    )
+    imports = _imports(code)
+    problems = []
+    loaded = {name for name, _, _ in imports}
+    for name in sorted(loaded):
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in forbidden):
+            problems.append(f"imports {name}")
+    total_us = sum(
+        cumulative for name, depth, cumulative in imports
+        if depth == 0 and name not in startup_modules
+    )
+    if total_us > budget_ms * 1000:
+        problems.append(f"import time {total_us / 1000:.1f} ms exceeds budget {budget_ms:.1f} ms")
+    print(f"proboot {' '.join(args):<24} {total_us / 1000:7.1f} ms "
+          f"(budget {budget_ms:.1f} ms){'  FAIL' if problems else ''}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check proboot's import-time budget")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Multiply every budget, e.g. for slow CI machines")
+    args = parser.parse_args(argv)
+
+    startup_modules = {name for name, _, _ in _imports("pass")}
+    # Build the project type index once; the scenarios measure warm starts.
+    _imports("from proboot.utils.type_registry import project_type_names; project_type_names()")
+    failed = False
+    for scenario_args, forbidden, budget_ms in SCENARIOS:
+        problems = check_scenario(
+            scenario_args, forbidden, budget_ms * args.budget_scale, startup_modules
+        )
+        for problem in problems:
+            print(f"  {problem}")
+        failed = failed or bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
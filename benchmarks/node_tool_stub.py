@@ -0,0 +1,106 @@
+"""
+Offline stand-in for npm, pnpm and npx used by the benchmark suite.
+
+The benchmark runner puts `npm`, `pnpm` and `npx` wrappers on PATH that call
+this script with the tool name as the first argument. Each command writes the
+files the real tool would produce (package.json, lockfiles, node_modules
+entries, tsconfig.json) without touching the network, so benchmark numbers
+measure proboot rather than the registry.
+
+Installs run in a directory with a `pnpm-workspace.yaml` also install the
+dependencies of every workspace package. Installing `typescript` creates a
+`node_modules/.bin/tsc` shim that supports `tsc --init`.
+
+Set `PROBOOT_STUB_DELAY` (seconds) to simulate a fixed per-command latency.
+"""
+import glob
+import json
+import os
+import sys
+import time
+
+
+def _load_package_json():
+    try:
+        with open("package.json", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"name": os.path.basename(os.getcwd()), "version": "1.0.0"}
+
+
+def _save_package_json(package_json):
+    with open("package.json", "w", encoding="utf-8") as f:
+        json.dump(package_json, f, indent=2)
+        f.write("\n")
+
+
+def _install(packages, dependency_key, lockfile):
+    package_json = _load_package_json()
+    if packages:
+        dependencies = package_json.setdefault(dependency_key, {})
+        for package in packages:
+            dependencies[package] = "^1.0.0"
+        _save_package_json(package_json)
+    manifests = [package_json]
+    if os.path.exists("pnpm-workspace.yaml"):
+        for path in sorted(glob.glob(os.path.join("packages", "*", "package.json"))):
+            with open(path, encoding="utf-8") as f:
+                manifests.append(json.load(f))
+    all_packages = sorted({
+        package for manifest in manifests
+        for kind in ("dependencies", "devDependencies") for package in manifest.get(kind, {})
+    })
+    for package in all_packages:
+        package_dir = os.path.join("node_modules", *package.split("/"))
+        os.makedirs(package_dir, exist_ok=True)
+        with open(os.path.join(package_dir, "package.json"), "w", encoding="utf-8") as f:
+            json.dump({"name": package, "version": "1.0.0"}, f)
+    if "typescript" in all_packages and sys.platform != "win32":
+        shim = os.path.join("node_modules", ".bin", "tsc")
+        os.makedirs(os.path.dirname(shim), exist_ok=True)
+        with open(shim, "w", encoding="utf-8") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{os.path.abspath(__file__)}" tsc "$@"\n')
+        os.chmod(shim, 0o755)
+    with open(lockfile, "w", encoding="utf-8") as f:
+        f.write("".join(f"{package}@1.0.0\n" for package in all_packages))
+
+
+def _write_tsconfig():
+    with open("tsconfig.json", "w", encoding="utf-8") as f:
+        json.dump({"compilerOptions": {"target": "es2016", "module": "commonjs",
+                                       "strict": True, "esModuleInterop": True}}, f, indent=2)
+
+
+def main(argv):
+    time.sleep(float(os.environ.get("PROBOOT_STUB_DELAY", "0")))
+    tool, args = argv[0], argv[1:]
+    options = [arg for arg in args if arg.startswith("-")]
+    positional = [arg for arg in args if not arg.startswith("-")]
+
+    if tool == "npm" and positional[:1] == ["init"]:
+        _save_package_json({
+            "name": os.path.basename(os.getcwd()),
+            "version": "1.0.0",
+            "description": "",
+            "main": "index.js",
+            "scripts": {"test": 'echo "Error: no test specified" && exit 1'},
+            "keywords": [],
+            "author": "",
+            "license": "ISC",
+        })
+    elif tool in ("npm", "pnpm") and positional[:1] in (["install"], ["i"], ["add"]):
+        dev = "--save-dev" in options or "-D" in options
+        lockfile = "package-lock.json" if tool == "npm" else "pnpm-lock.yaml"
+        _install(positional[1:], "devDependencies" if dev else "dependencies", lockfile)
+    elif tool == "npx" and positional[:1] == ["tsc"] and "--init" in options:
+        _write_tsconfig()
+    elif tool == "tsc" and "--init" in options:
+        _write_tsconfig()
+    else:
+        print(f"{tool} stub: unsupported command {' '.join(args)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
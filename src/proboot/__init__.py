@@ -0,0 +1,3 @@
+"""proboot: a CLI tool for bootstrapping projects."""
+
+__version__ = "0.1.2"
@@ -0,0 +1,206 @@
+"""
+Public Python API for proboot
+
+This module lets other programs, such as an orchestration service, bootstrap
+projects in-process without going through the command line:
+
+    from proboot.api import BootstrapSpec, bootstrap
+
+    result = bootstrap(
+        BootstrapSpec("billing", "python", parent_dir="/srv/projects"),
+        on_progress=lambda event: log.info("%s %s", event.step, event.message),
+    )
+
+`bootstrap` neither prints, exits nor changes the working directory: the
+project is created at an explicit path, progress is delivered to a callback
+as `ProgressEvent`s, and failures are raised as `BootstrapError` subclasses.
+It changes no process-global state, so many bootstraps can run concurrently
+on the threads of one process.
+
+Functions:
+- bootstrap: Bootstrap a project described by a BootstrapSpec
+"""
+import os
+import subprocess
+import time
+from collections import namedtuple
+
+from proboot.utils.progress import ProgressEvent, listening
+
+__all__ = [
+    "BootstrapSpec", "BootstrapResult", "ProgressEvent", "BootstrapError", "SpecError",
+    "ProjectExistsError", "CommandError", "bootstrap",
+]
+
+BootstrapSpec = namedtuple(
+    "BootstrapSpec",
+    ["name", "project_type", "parent_dir", "init_git", "template_version", "package_manager",
+     "resume", "dependencies", "wheelhouse", "template_archive", "variables", "target", "module",
+     "strict"],
+    defaults=["python", None, True, None, "pnpm", False, (), None, None, None, None, None, None],
+)
+BootstrapSpec.__doc__ = """
+Describes a project to bootstrap.
+
+Attributes:
+    name (str): The project name; the project is created in parent_dir/name.
+    project_type (str): A registered project type, e.g. "python".
+    parent_dir (str): Directory in which the project is created; required.
+        Created if missing. A relative path is resolved against the working
+        directory when `bootstrap` is called.
+    init_git (bool): Whether to create a git repository with an initial commit.
+    template_version (str): create-vite template version (react-typescript).
+    package_manager (str): "pnpm" or "npm" (typescript).
+    resume (bool): Continue a failed bootstrap of the project.
+    dependencies (Sequence[str]): Requirements to install from a wheelhouse (python).
+    wheelhouse (str): The wheelhouse directory for dependencies.
+    template_archive (str): The template archive (archive).
+    variables (dict): Extra template variables (archive).
+    target (str): The tsconfig.json compiler target, e.g. "es2022" (typescript).
+    module (str): The tsconfig.json module system, e.g. "nodenext" (typescript).
+    strict (bool): Strict type checking; None keeps the default, True (typescript).
+"""
+
+BootstrapResult = namedtuple(
+    "BootstrapResult", ["project_dir", "project_type", "elapsed", "steps", "skipped_steps", "log"]
+)
+BootstrapResult.__doc__ = """
+The outcome of a successful bootstrap.
+
+Attributes:
+    project_dir (str): Absolute path of the created project.
+    project_type (str): The project type.
+    elapsed (float): Wall time in seconds.
+    steps (tuple[str]): The steps that ran, in the order they finished.
+    skipped_steps (tuple[str]): Steps skipped because a previous run completed them.
+    log (tuple[str]): The progress messages, as the command line would print them.
+"""
+
+
+class BootstrapError(Exception):
+    """
+    Base class of the errors raised by `bootstrap`.
+
+    The original exception is available as `__cause__`.
+
+    Attributes:
+        project_dir (str): The project directory the bootstrap was creating.
+    """
+
+    def __init__(self, message, project_dir=None):
+        super().__init__(message)
+        self.project_dir = project_dir
+
+
+class SpecError(BootstrapError, ValueError):
+    """
+    Raised when a spec is invalid or cannot be satisfied, e.g. an unknown
+    project type, an option the type does not support, unresolvable
+    dependencies or nothing to resume.
+    """
+
+
+class ProjectExistsError(BootstrapError):
+    """
+    Raised when the project directory already exists.
+
+    Attributes:
+        resumable (bool): Whether the directory holds an unfinished bootstrap
+            that can be continued with `resume=True`.
+    """
+
+    def __init__(self, message, project_dir=None, resumable=False):
+        super().__init__(message, project_dir)
+        self.resumable = resumable
+
+
+class CommandError(BootstrapError):
+    """
+    Raised when an external tool (git, npm, pnpm, ...) fails or times out.
+
+    Attributes:
+        command (list[str]): The command that failed.
+        returncode (int or None): Its exit status; None if it timed out.
+    """
+
+    def __init__(self, message, project_dir=None, command=None, returncode=None):
+        super().__init__(message, project_dir)
+        self.command = command
+        self.returncode = returncode
+
+
+def _absolute(path):
+    return os.path.abspath(path) if path else path
+
+
+def bootstrap(spec, on_progress=None):
+    """
+    Bootstraps the project described by a spec.
+
+    Safe to call from several threads at once, for different projects.
+
+    Args:
+        spec (BootstrapSpec): The project to bootstrap.
+        on_progress (callable, optional): Called with a `ProgressEvent` for each
+            progress message, line of tool output and step transition. It is
+            called from the bootstrap's worker threads.
+
+    Raises:
+        SpecError: If the spec is invalid or cannot be satisfied.
+        ProjectExistsError: If the project directory already exists.
+        CommandError: If an external tool fails.
+        BootstrapError: If the bootstrap fails for another reason, e.g. a file
+            cannot be written.
+
+    Returns:
+        BootstrapResult: The created project.
+    """
+    # pylint: disable=import-outside-toplevel
+    from proboot.features.project_types import bootstrap_project
+    from proboot.utils import directory_handler
+    from proboot.utils.git_writer import GitIdentityError
+
+    if not spec.name or not spec.parent_dir:
+        raise SpecError("A bootstrap spec needs a name and a parent_dir.")
+    parent_dir = os.path.abspath(spec.parent_dir)
+    project_dir = os.path.join(parent_dir, spec.name)
+    steps, skipped, log = [], [], []
+
+    def collect(event):
+        if event.kind == "step_finished":
+            steps.append(event.step)
+        elif event.kind == "step_skipped":
+            skipped.append(event.step)
+        if event.kind in ("message", "step_skipped"):
+            log.append(event.message)
+        if on_progress is not None:
+            on_progress(event)
+
+    start = time.perf_counter()
+    try:
+        os.makedirs(parent_dir, exist_ok=True)
+        with listening(collect):
+            bootstrap_project(
+                spec.name, spec.project_type, spec.init_git, parent_dir,
+                template_version=spec.template_version, package_manager=spec.package_manager,
+                resume=spec.resume, dependencies=list(spec.dependencies or ()),
+                wheelhouse=_absolute(spec.wheelhouse),
+                template_archive=_absolute(spec.template_archive), variables=spec.variables,
+                target=spec.target, module=spec.module, strict=spec.strict,
+            )
+    except directory_handler.ProjectExistsError as e:
+        raise ProjectExistsError(str(e), project_dir, e.resumable) from e
+    except ValueError as e:
+        raise SpecError(str(e), project_dir) from e
+    except subprocess.CalledProcessError as e:
+        raise CommandError(
+            f"{' '.join(e.cmd)} exited with status {e.returncode}", project_dir, e.cmd, e.returncode
+        ) from e
+    except subprocess.TimeoutExpired as e:
+        raise CommandError(f"{' '.join(e.cmd)} timed out", project_dir, e.cmd) from e
+    except (GitIdentityError, OSError) as e:
+        raise BootstrapError(str(e), project_dir) from e
+    return BootstrapResult(
+        project_dir, spec.project_type, time.perf_counter() - start, tuple(steps), tuple(skipped),
+        tuple(log),
+    )
@@ -6,6 +6,12 @@ for handling command-line arguments when bootstrapping a new project using probo
 
 The main function in this module is `create_parser()`, which sets up the
 argument parser with the necessary options and arguments for project creation.
+`create_batch_parser()` configures the parser for the `proboot batch` command,
+`create_template_parser()` the one for `proboot template`,
+`create_serve_parser()` the one for `proboot serve`,
+`create_update_parser()` the one for `proboot update`,
+`create_stats_parser()` the one for `proboot stats` and
+`create_workspace_parser()` the one for `proboot workspace`.
 
 Usage:
     from proboot.cli.parser import create_parser
@@ -14,27 +20,280 @@ Usage:
 
 Available arguments:
     - project_name: The name of the project to create (positional argument)
-    - --type: The type of project to create (default: "python")
+    - --type: The type of project to create (default: "python", or "archive" with --from-archive)
     - --no-git: Flag to disable git repository initialization
+    - --version: Print the proboot version and exit
+    - --template-version: The create-vite template version for react-typescript projects
+    - --package-manager: The package manager for typescript projects (pnpm or npm)
+    - --profile: Write a Chrome trace of every bootstrap step to the given file
+    - --resume: Continue a failed bootstrap, re-running only unfinished steps
+    - --deps: Requirements to install into a python project's venv from a local wheelhouse
+    - --deps-file: A requirements file with more such requirements
+    - --wheelhouse: The directory of wheels the requirements are resolved against
+    - --from-archive: A template archive to create the project from
+    - --var: KEY=VALUE variables for the archive's templated files
+    - --target: The tsconfig.json compiler target for typescript projects
+    - --module: The tsconfig.json module system for typescript projects
+    - --strict / --no-strict: Strict type checking for typescript projects
+    - --archive: Write the project to a .tar.zst or .tar.gz archive instead of a directory
+    - --archive-threads: Number of compression threads for --archive
+
+Batch arguments (`proboot batch`):
+    - manifest: Path to a TOML manifest listing the projects to create
+    - --jobs: Number of projects to bootstrap concurrently
+
+Template arguments (`proboot template refresh`):
+    - --template-version: The create-vite version to fetch (default: "latest")
+    - --from-tarball: Import a create-vite package tarball instead of fetching
+
+Workspace arguments (`proboot workspace`):
+    - manifest: Path to a TOML manifest describing the workspace and its packages
+    - --resume: Continue a failed workspace bootstrap
+
+Update arguments (`proboot update`):
+    - projects: Directories of the projects to update
+    - --jobs: Number of projects to update concurrently
+    - --dry-run: Report what would change without writing anything
+
+Stats arguments (`proboot stats`):
+    - --since: Time window of the bootstraps to report, e.g. 12h, 7d or all
+    - --type: Only report bootstraps of this project type
+    - --host: Only report bootstraps recorded on this host
+
+Daemon arguments (`proboot serve`):
+    - --socket: Path of the Unix domain socket to listen on
+    - --jobs: Maximum number of requests served at once
 
 For more details on each argument, refer to the `create_parser()` function documentation.
 """
 import argparse
 
+from proboot import __version__
+from proboot.utils.type_registry import project_type_names
+
 def create_parser():
     """
     Create an ArgumentParser instance to handle command-line arguments for bootstrapping a new project.
     
     The parser supports the following arguments:
     - `project_name`: The name of the project to create.
-    - `--type`: The type of project to create, currently only supporting "python".
+    - `--type`: The type of project to create, one of the registered project types.
     - `--no-git`: If set, do not initialize a git repository for the new project.
+    - `--template-version`: The create-vite template version for react-typescript projects.
+    - `--package-manager`: The package manager used to install typescript project dependencies.
+    - `--profile`: Write a Chrome trace / Perfetto timeline to the given JSON file
+      and print a step summary to stderr.
+    - `--resume`: Continue a failed bootstrap of an existing project directory.
+    - `--deps`: Requirements to install into the venv of a python project.
+    - `--deps-file`: A requirements file listing more requirements.
+    - `--wheelhouse`: Directory of wheels the requirements are resolved against, offline.
+    - `--from-archive`: Create the project from a template archive (.tar.gz, .tar.zst, .zip).
+    - `--var`: A KEY=VALUE variable for the templated files of the archive; repeatable.
+    - `--target`, `--module`: The compiler target and module system written to
+      the tsconfig.json of a typescript project.
+    - `--strict` / `--no-strict`: Strict type checking for a typescript project (default: strict).
+    - `--archive`: Stream the project into a .tar.zst, .tar.gz or .tar archive instead
+      of leaving it in a directory.
+    - `--archive-threads`: Number of compression threads (defaults to the number of CPUs).
     
     Returns:
         argparse.ArgumentParser: The configured ArgumentParser instance.
     """
-    parser = argparse.ArgumentParser(description="Bootstrap a new project")
+    parser = argparse.ArgumentParser(
+        description="Bootstrap a new project",
+        epilog="Python venvs share unmodified files, such as pip and --deps packages, with "
+               "proboot's cache through hardlinks where reflinks are unavailable; do not edit "
+               "them in place. Set PROBOOT_NO_VENV_CACHE=1 for private copies.",
+    )
+    parser.add_argument("--version", action="version", version=f"proboot {__version__}")
     parser.add_argument("project_name", help="Name of the project")
-    parser.add_argument("--type", choices=["python"], default="python", help="Type of project to create")
+    parser.add_argument(
+        "--type", choices=project_type_names(), default=None,
+        help="Type of project to create (default: python, or archive with --from-archive)"
+    )
     parser.add_argument("--no-git", action="store_true", help="Don't initialize a git repository")
+    parser.add_argument(
+        "--template-version", default=None, help="create-vite template version (react-typescript)"
+    )
+    parser.add_argument(
+        "--package-manager", choices=["pnpm", "npm"], default="pnpm",
+        help="Package manager for typescript projects"
+    )
+    parser.add_argument(
+        "--profile", metavar="OUT.json", default=None, help="Write a Chrome trace of the bootstrap"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue a failed bootstrap, skipping completed steps"
+    )
+    parser.add_argument(
+        "--deps", nargs="+", action="extend", default=[], metavar="REQUIREMENT",
+        help="Install requirements into the venv from a local wheelhouse (python)"
+    )
+    parser.add_argument(
+        "--deps-file", default=None, metavar="FILE", help="Read more requirements from a file"
+    )
+    parser.add_argument(
+        "--wheelhouse", default=None, metavar="DIR",
+        help="Directory of wheels to install from (default: $PROBOOT_WHEELHOUSE)"
+    )
+    parser.add_argument(
+        "--from-archive", default=None, metavar="ARCHIVE",
+        help="Create the project from a template archive (.tar.gz, .tar.zst or .zip)"
+    )
+    parser.add_argument(
+        "--var", action="append", default=[], metavar="KEY=VALUE",
+        help="Variable for the templated (.tmpl) files of a template archive"
+    )
+    parser.add_argument(
+        "--target", default=None, metavar="TARGET",
+        help="tsconfig.json compiler target for typescript projects (default: es2016)"
+    )
+    parser.add_argument(
+        "--module", default=None, metavar="MODULE",
+        help="tsconfig.json module system for typescript projects (default: commonjs)"
+    )
+    parser.add_argument(
+        "--strict", action=argparse.BooleanOptionalAction, default=None,
+        help="Strict type checking for typescript projects (default: strict)"
+    )
+    parser.add_argument(
+        "--archive", default=None, metavar="OUT.tar.zst",
+        help="Write the project to a .tar.zst, .tar.gz or .tar archive instead of a directory"
+    )
+    parser.add_argument(
+        "--archive-threads", type=int, default=None, metavar="N",
+        help="Compression threads for --archive (default: number of CPUs)"
+    )
+    return parser
+
+
+def create_batch_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot batch`.
+
+    The parser supports the following arguments:
+    - `manifest`: Path to a TOML manifest listing the projects to create.
+    - `--jobs`: Number of projects to bootstrap concurrently (defaults to the CPU count).
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot batch", description="Bootstrap many projects from a manifest"
+    )
+    parser.add_argument("manifest", help="Path to the TOML manifest")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Number of projects to bootstrap concurrently"
+    )
+    return parser
+
+
+def create_template_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot template`.
+
+    The parser supports the `refresh` action with the following arguments:
+    - `--template-version`: The create-vite version to fetch (defaults to "latest").
+    - `--from-tarball`: Path to a create-vite package tarball to import instead of fetching.
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot template", description="Manage the local create-vite template store"
+    )
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    refresh = subparsers.add_parser("refresh", help="Fetch or import a template and make it current")
+    refresh.add_argument("--template-version", default="latest", help="create-vite version to fetch")
+    refresh.add_argument("--from-tarball", default=None, help="Import a create-vite package tarball")
+    return parser
+
+
+def create_serve_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot serve`.
+
+    The parser supports the following arguments:
+    - `--socket`: Path of the Unix domain socket to listen on.
+    - `--jobs`: Maximum number of requests served at once (defaults to the number of CPUs).
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot serve", description="Run a daemon that serves proboot requests from warm caches"
+    )
+    parser.add_argument("--socket", default=None, help="Unix domain socket path")
+    parser.add_argument("--jobs", type=int, default=None, help="Maximum concurrent requests")
+    return parser
+
+
+def create_update_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot update`.
+
+    The parser supports the following arguments:
+    - `projects`: Directories of the projects to update.
+    - `--jobs`: Number of projects to update concurrently.
+    - `--dry-run`: Report what would change without writing anything.
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot update", description="Apply the current templates to existing projects"
+    )
+    parser.add_argument("projects", nargs="+", metavar="PROJECT_DIR", help="Project directories")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Number of projects to update concurrently"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would change without writing anything"
+    )
+    return parser
+
+
+def create_stats_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot stats`.
+
+    The parser supports the following arguments:
+    - `--since`: Time window of the bootstraps to report (defaults to "7d").
+    - `--type`: Only report bootstraps of this project type.
+    - `--host`: Only report bootstraps recorded on this host.
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot stats", description="Report bootstrap timing percentiles from the local history"
+    )
+    parser.add_argument(
+        "--since", default="7d", metavar="WINDOW",
+        help="Time window, e.g. 90m, 12h, 7d, 2w or all (default: 7d)"
+    )
+    parser.add_argument("--type", default=None, help="Only report this project type")
+    parser.add_argument("--host", default=None, help="Only report this host")
+    return parser
+
+
+def create_workspace_parser():
+    """
+    Create an ArgumentParser instance to handle the arguments of `proboot workspace`.
+
+    The parser supports the following arguments:
+    - `manifest`: Path to a TOML manifest describing the workspace and its packages.
+    - `--resume`: Continue a failed workspace bootstrap, skipping completed steps.
+
+    Returns:
+        argparse.ArgumentParser: The configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proboot workspace",
+        description="Bootstrap related packages under one root with a shared venv and pnpm workspace",
+    )
+    parser.add_argument("manifest", help="Path to the workspace manifest (TOML)")
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue a failed bootstrap, skipping completed steps"
+    )
     return parser
@@ -0,0 +1,256 @@
+"""
+Template Archive Extractor
+
+This module creates a project from a template kept as an archive
+(`.tar.gz`, `.tgz`, `.tar.zst`, `.tar.xz`, `.tar.bz2`, `.tar` or `.zip`). The
+archive's members form the project root (a leading `./` is ignored).
+
+Archives are read member by member: tar archives are opened as streams and
+zip members are decompressed on the fly, and file contents are copied in
+fixed-size chunks. Memory use therefore does not depend on the archive size,
+only templated files are read whole.
+
+A file is templated when its name ends in `.tmpl`. The suffix is dropped and
+`{{ variable }}` placeholders in its (UTF-8) content are replaced; every other
+member is copied byte for byte. Placeholders are also replaced in member
+paths, e.g. `src/{{ package_name }}/__init__.py`.
+
+Functions:
+- archive_format: Return how an archive is read, based on its file name
+- template_variables: Return the variables available to a project's templates
+- extract_template: Extract a template archive into a project directory
+"""
+import contextlib
+import os
+import posixpath
+import re
+import shutil
+import subprocess
+import tarfile
+import zipfile
+
+from proboot.utils.npm_package import to_valid_package_name
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+
+TEMPLATED_SUFFIX = ".tmpl"
+COPY_CHUNK_SIZE = 1024 * 1024
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+TAR_MODES = {
+    (".tar.gz", ".tgz"): "r|gz",
+    (".tar.xz", ".txz"): "r|xz",
+    (".tar.bz2", ".tbz2"): "r|bz2",
+    (".tar",): "r|",
+}
+ZSTD_SUFFIXES = (".tar.zst", ".tzst")
+
+
+def archive_format(archive_path):
+    """
+    Returns how an archive is read, based on its file name.
+
+    Args:
+        archive_path (str): Path of the template archive.
+
+    Raises:
+        ValueError: If the archive type is not supported.
+
+    Returns:
+        str: "zip", "zstd" (a zstd-compressed tar) or a streaming tarfile mode.
+    """
+    lower = archive_path.lower()
+    if lower.endswith(".zip"):
+        return "zip"
+    if lower.endswith(ZSTD_SUFFIXES):
+        return "zstd"
+    for suffixes, mode in TAR_MODES.items():
+        if lower.endswith(suffixes):
+            return mode
+    raise ValueError(
+        f"Unsupported template archive {archive_path}; expected .tar.gz, .tar.zst, "
+        ".tar.xz, .tar.bz2, .tar or .zip."
+    )
+
+
+def template_variables(project_name, variables=None):
+    """
+    Returns the variables available to a project's templates.
+
+    Args:
+        project_name (str): The name of the project.
+        variables (dict, optional): Extra variables; they override the built-in ones.
+
+    Returns:
+        dict: project_name, package_name (a Python identifier), npm_name (a
+        valid npm package name) and the extra variables.
+    """
+    package_name = re.sub(r"\W+", "_", project_name.strip()).lower()
+    if package_name[:1].isdigit():
+        package_name = f"_{package_name}"
+    return {
+        "project_name": project_name,
+        "package_name": package_name,
+        "npm_name": to_valid_package_name(project_name),
+        **(variables or {}),
+    }
+
+
+def _substitute(text, variables, where):
+    def replace(match):
+        try:
+            return str(variables[match.group(1)])
+        except KeyError:
+            raise ValueError(
+                f"{where} uses the undefined template variable '{match.group(1)}'."
+            ) from None
+
+    return PLACEHOLDER.sub(replace, text)
+
+
+@contextlib.contextmanager
+def _zstd_stream(archive_path):
+    """
+    Yields a decompressed stream of a zstd file.
+
+    Python 3.14's compression.zstd is used when present, otherwise the data is
+    piped through the `zstd` command.
+    """
+    try:
+        from compression import zstd  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        zstd = None
+    if zstd is not None:
+        with zstd.open(archive_path, "rb") as stream:
+            yield stream
+        return
+    # Popen rather than the command runner, which cannot stream binary
+    # stdout to tarfile (see proboot.utils.command_runner).
+    try:
+        process = subprocess.Popen(
+            ["zstd", "-dcq", "--", archive_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    except FileNotFoundError as e:
+        raise ValueError(
+            f"Extracting {archive_path} needs the zstd command (or Python 3.14)."
+        ) from e
+    try:
+        yield process.stdout
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read().decode(errors="replace").strip()
+        process.stderr.close()
+        if process.wait() != 0:
+            raise ValueError(f"Could not decompress {archive_path}: {stderr}")
+
+
+def _tar_members(archive):
+    for member in archive:
+        if member.isdir():
+            yield member.name, "dir", member.mode, None
+        elif member.isfile():
+            yield member.name, "file", member.mode, archive.extractfile(member)
+        elif member.issym():
+            yield member.name, "symlink", member.mode, member.linkname
+        elif member.islnk():
+            yield member.name, "hardlink", member.mode, member.linkname
+
+
+def _iter_members(archive_path):
+    """
+    Yields (name, kind, mode, data) for each member of an archive, in order.
+
+    kind is "dir", "file", "symlink" or "hardlink"; data is a readable stream
+    for files, the link target for links and None for directories. A file's
+    stream is only valid until the next member is requested.
+    """
+    kind = archive_format(archive_path)
+    if kind == "zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                mode = info.external_attr >> 16
+                if info.is_dir():
+                    yield info.filename, "dir", mode & 0o7777, None
+                elif (mode & 0o170000) == 0o120000:
+                    yield info.filename, "symlink", mode, archive.read(info).decode()
+                else:
+                    with archive.open(info) as stream:
+                        yield info.filename, "file", mode & 0o7777 or 0o644, stream
+    elif kind == "zstd":
+        with _zstd_stream(archive_path) as stream, \
+                tarfile.open(fileobj=stream, mode="r|") as archive:
+            yield from _tar_members(archive)
+    else:
+        with tarfile.open(archive_path, kind) as archive:
+            yield from _tar_members(archive)
+
+
+def _target_path(name, variables, archive_path):
+    """
+    Returns the project-relative path of a member, or None for the root itself.
+    """
+    path = posixpath.normpath(_substitute(name, variables, f"{archive_path}: {name}"))
+    if posixpath.isabs(path) or path == ".." or path.startswith("../"):
+        raise ValueError(f"Unsafe path {name} in {archive_path}")
+    return None if path == "." else path
+
+
+def extract_template(archive_path, project_dir, variables):
+    """
+    Extracts a template archive into a project directory.
+
+    Args:
+        archive_path (str): Path of the template archive.
+        project_dir (str): The existing project directory.
+        variables (dict): Values for the placeholders in templated files and paths.
+
+    Raises:
+        ValueError: If the archive type is unsupported, a member path is unsafe,
+            or a templated file is not UTF-8 or uses an undefined variable.
+        OSError: If the archive cannot be read or a file cannot be written.
+        tarfile.TarError, zipfile.BadZipFile: If the archive is corrupt.
+
+    Returns:
+        tuple[int, int]: The number of files written and how many of them were templated.
+    """
+    written = {}
+    files = templated = 0
+    with span(f"extract {os.path.basename(archive_path)}", "io") as extract_span:
+        for name, kind, mode, data in _iter_members(archive_path):
+            path = _target_path(name, variables, archive_path)
+            if path is None:
+                continue
+            is_templated = kind == "file" and path.endswith(TEMPLATED_SUFFIX)
+            if is_templated:
+                path = path[:-len(TEMPLATED_SUFFIX)]
+            target = os.path.join(project_dir, *path.split("/"))
+            if kind == "dir":
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if kind == "symlink":
+                # The initial commit only records regular files.
+                report(f"Skipped symbolic link {name} in {archive_path}")
+                continue
+            if os.path.lexists(target):
+                os.unlink(target)
+            if kind == "hardlink":
+                source = written.get(posixpath.normpath(data))
+                if source is None:
+                    raise ValueError(f"Hard link {name} in {archive_path} points outside the archive")
+                shutil.copyfile(source, target)
+            elif is_templated:
+                try:
+                    text = data.read().decode("utf-8")
+                except UnicodeDecodeError as e:
+                    raise ValueError(f"Templated file {name} in {archive_path} is not UTF-8") from e
+                with open(target, "w", encoding="utf-8", newline="") as f:
+                    f.write(_substitute(text, variables, f"{archive_path}: {name}"))
+                templated += 1
+            else:
+                with open(target, "wb") as f:
+                    shutil.copyfileobj(data, f, COPY_CHUNK_SIZE)
+            os.chmod(target, 0o755 if mode & 0o111 else 0o644)
+            written[posixpath.normpath(name)] = target
+            files += 1
+        extract_span.set(files=files, templated=templated)
+    return files, templated
@@ -0,0 +1,95 @@
+"""
+Bootstrap a new project from a template archive
+
+This module creates a project from a local template archive, such as a
+versioned company template kept as `.tar.gz`, `.tar.zst` or `.zip`, instead
+of one of the built-in templates.
+
+The main function `bootstrap_archive_project` orchestrates the creation of:
+- Project directory
+- Project files, streamed out of the archive with templated files rendered
+- Git repository (optional)
+
+The steps are declared as a dependency graph, so the git repository is created
+while the archive is extracted. Completed steps are journaled, so a failed
+bootstrap can be resumed without redoing them. The initial commit reads the
+extracted files one at a time, so large templates are never held in memory.
+
+Functions:
+- bootstrap_archive_project: Main function to create a project from a template archive
+"""
+
+import os
+
+from proboot.features.archive_project.archive_extractor import (archive_format, extract_template,
+                                                               template_variables)
+from proboot.utils.directory_handler import create_project_directory
+from proboot.utils.git_writer import init_repository, iter_files, write_initial_commit
+from proboot.utils.progress import report
+from proboot.utils.step_graph import Step, run_steps
+from proboot.utils.step_journal import JOURNAL_DIR, StepJournal
+
+
+def bootstrap_archive_project(project_name, init_git, parent_dir=None, template_archive=None,
+                              variables=None, resume=False):
+    """
+    Bootstraps a new project from a local template archive.
+
+    Args:
+        project_name (str): The name of the new project.
+        init_git (bool): Whether to initialize a Git repository for the new project.
+        parent_dir (str, optional): Directory in which the project is created.
+            Defaults to the current working directory.
+        template_archive (str): Path of the template archive.
+        variables (dict, optional): Template variables in addition to
+            project_name, package_name and npm_name.
+        resume (bool, optional): Continue a failed bootstrap of the project,
+            re-running only the steps that did not complete.
+
+    Raises:
+        ValueError: If no archive is given, it does not exist or its type is
+            not supported, the archive cannot be extracted (see
+            `extract_template`), or if resuming a project directory without a
+            bootstrap journal.
+
+    Returns:
+        None
+    """
+    if not template_archive:
+        raise ValueError("A template archive is required for archive projects (--from-archive).")
+    if not os.path.isfile(template_archive):
+        raise ValueError(f"Template archive {template_archive} does not exist.")
+    archive_format(template_archive)
+    project_dir = os.path.join(parent_dir, project_name) if parent_dir else project_name
+    journal = StepJournal.open(project_dir, resume)
+    variables = template_variables(project_name, variables)
+    archive_stat = os.stat(template_archive)
+
+    def extract():
+        files, templated = extract_template(template_archive, project_dir, variables)
+        report(f"Extracted {files} files from {os.path.basename(template_archive)} "
+              f"({templated} templated)")
+
+    steps = [
+        Step("directory", lambda: create_project_directory(project_dir, exist_ok=resume)),
+        Step(
+            "files", extract, ("directory",),
+            [os.path.abspath(template_archive), archive_stat.st_size, archive_stat.st_mtime_ns,
+             variables],
+        ),
+    ]
+    if init_git:
+        steps.append(Step("git_init", lambda: init_repository(project_dir), ("directory",)))
+        steps.append(
+            Step(
+                "git_commit",
+                lambda: write_initial_commit(
+                    project_dir, iter_files(project_dir, ignored_dirs=(JOURNAL_DIR,))
+                ),
+                ("git_init", "files"),
+            )
+        )
+    run_steps(steps, journal=journal)
+    journal.discard()
+
+    report(f"Project '{project_name}' has been created from {template_archive} successfully.")
@@ -0,0 +1,84 @@
+"""
+Batch Manifest Loader
+
+This module reads a TOML manifest describing many projects to bootstrap in one
+proboot invocation. Each project is declared as a `[[project]]` table:
+
+    [[project]]
+    name = "billing-service"
+    type = "python"          # optional, defaults to "python"
+    git = true               # optional, defaults to true
+    target_dir = "services"  # optional, defaults to the manifest's directory
+    template_version = "5.5.2"  # optional, create-vite version for react-typescript
+    package_manager = "npm"  # optional, "pnpm" (default) or "npm" for typescript
+
+Relative target directories are resolved against the directory containing the
+manifest, so a manifest produces the same layout regardless of where proboot
+is invoked from.
+
+Functions:
+- load_manifest: Parse and validate a batch manifest into a list of jobs
+"""
+import os
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+from proboot.utils.type_registry import project_type_names
+
+
+def load_manifest(manifest_path):
+    """
+    Load a batch manifest and return the projects it declares.
+
+    Args:
+        manifest_path (str): Path to the TOML manifest file.
+
+    Raises:
+        OSError: If the manifest cannot be read.
+        ValueError: If the manifest is malformed or declares an invalid project.
+
+    Returns:
+        list[dict]: One job per project, each with the keys `name`, `type`,
+        `git`, `target_dir` (an absolute path), `template_version` and
+        `package_manager`.
+    """
+    with open(manifest_path, "rb") as f:
+        try:
+            manifest = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid manifest {manifest_path}: {e}") from e
+
+    projects = manifest.get("project", [])
+    if not isinstance(projects, list) or not projects:
+        raise ValueError(f"Manifest {manifest_path} does not declare any [[project]] entries.")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    seen = set()
+    for index, entry in enumerate(projects, 1):
+        name = entry.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Project #{index} in {manifest_path} is missing a name.")
+        project_type = entry.get("type", "python")
+        if project_type not in project_type_names():
+            raise ValueError(f"Project '{name}' has unsupported type '{project_type}'.")
+        package_manager = entry.get("package_manager", "pnpm")
+        if package_manager not in ("pnpm", "npm"):
+            raise ValueError(f"Project '{name}' has unsupported package manager '{package_manager}'.")
+        target_dir = os.path.normpath(os.path.join(base_dir, entry.get("target_dir", ".")))
+        project_path = os.path.join(target_dir, name)
+        if project_path in seen:
+            raise ValueError(f"Project '{name}' is declared more than once for {target_dir}.")
+        seen.add(project_path)
+        jobs.append({
+            "name": name,
+            "type": project_type,
+            "git": bool(entry.get("git", True)),
+            "target_dir": target_dir,
+            "template_version": entry.get("template_version"),
+            "package_manager": package_manager,
+        })
+    return jobs
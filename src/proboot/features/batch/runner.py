@@ -0,0 +1,94 @@
+"""
+Batch Runner
+
+This module bootstraps many projects concurrently on a thread pool. Each job
+receives its own target directory, and the bootstrappers never change the
+working directory or exit the process, so jobs share one interpreter instead
+of each paying for a worker process.
+
+Functions:
+- run_batch: Bootstrap every job on a worker pool and collect the results
+- print_report: Print a per-project summary of a batch run
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from proboot.features.project_types import bootstrap_project
+
+
+def _run_job(job):
+    """
+    Bootstrap a single batch job on a worker thread.
+
+    Failures are captured and returned rather than raised, so one failing
+    project does not stop the others.
+
+    Args:
+        job (dict): A job as returned by `load_manifest`.
+
+    Returns:
+        dict: The job's name, type, success flag, error message and elapsed seconds.
+    """
+    start = time.perf_counter()
+    error = None
+    try:
+        os.makedirs(job["target_dir"], exist_ok=True)
+        bootstrap_project(
+            job["name"], job["type"], job["git"], job["target_dir"], job["template_version"],
+            job["package_manager"],
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "name": job["name"],
+        "type": job["type"],
+        "ok": error is None,
+        "error": error,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def run_batch(jobs, max_workers=None):
+    """
+    Bootstrap all jobs concurrently on a thread pool.
+
+    Args:
+        jobs (list[dict]): Jobs as returned by `load_manifest`.
+        max_workers (int, optional): Number of worker threads. Defaults to
+            the number of CPUs.
+
+    Returns:
+        tuple: A tuple containing:
+            - results (list[dict]): Per-job results in manifest order.
+            - elapsed (float): Total wall time in seconds.
+    """
+    start = time.perf_counter()
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results, time.perf_counter() - start
+
+
+def print_report(results, elapsed):
+    """
+    Print a per-project summary of a batch run.
+
+    Args:
+        results (list[dict]): Results as returned by `run_batch`.
+        elapsed (float): Total wall time in seconds.
+
+    Returns:
+        None
+    """
+    print("\nBatch summary:")
+    for result in results:
+        status = "ok" if result["ok"] else "FAILED"
+        line = f"  [{status}] {result['name']} ({result['type']}) in {result['elapsed']:.2f}s"
+        if result["error"]:
+            line += f": {result['error']}"
+        print(line)
+    failed = sum(1 for result in results if not result["ok"])
+    print(f"{len(results) - failed} succeeded, {failed} failed in {elapsed:.2f}s total")
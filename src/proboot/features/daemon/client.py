@@ -0,0 +1,111 @@
+"""
+Daemon Client
+
+This module forwards a bootstrap request from the `proboot` command to a
+running `proboot serve` daemon and relays the daemon's output. When no daemon
+is running, or it cannot serve the request (for example because it runs with
+a different environment or umask), the caller bootstraps the project in its
+own process instead.
+
+The module deliberately imports nothing but the protocol, so that forwarded
+invocations do not pay for loading the bootstrappers.
+
+Functions:
+- daemon_available: Whether requests would be forwarded to a daemon
+- forward_bootstrap: Bootstrap a project through the daemon, if one is running
+"""
+import os
+import socket
+import sys
+
+from proboot import __version__
+from proboot.features.daemon.protocol import (current_umask, daemon_supported, read_messages,
+                                              request_environment, send_message, socket_path)
+
+
+def daemon_available():
+    """
+    Returns whether bootstrap requests would be forwarded to a daemon.
+
+    Only checks that forwarding is enabled and the daemon's socket exists; a
+    stale socket is detected when connecting.
+
+    Returns:
+        bool: True if a daemon appears to be running.
+    """
+    if os.environ.get("PROBOOT_NO_DAEMON") or not daemon_supported():
+        return False
+    return os.path.exists(socket_path())
+
+
+def forward_bootstrap(project_name, project_type, init_git, template_version=None,
+                      package_manager="pnpm", resume=False, dependencies=None, wheelhouse=None,
+                      template_archive=None, variables=None, target=None, module=None,
+                      strict=None):
+    """
+    Bootstrap a project through the daemon, if one is running.
+
+    The project is created in the current working directory. Setting the
+    `PROBOOT_NO_DAEMON` environment variable disables forwarding.
+
+    Args:
+        project_name (str): The name of the new project.
+        project_type (str): The type of the project.
+        init_git (bool): Whether to initialize a Git repository for the new project.
+        template_version (str, optional): The create-vite template version.
+        package_manager (str, optional): The package manager for typescript projects.
+        resume (bool, optional): Continue a failed bootstrap of the project.
+        dependencies (list[str], optional): Requirements to install from a wheelhouse.
+        wheelhouse (str, optional): Absolute path of the wheelhouse directory.
+        template_archive (str, optional): Absolute path of a template archive.
+        variables (dict, optional): Extra variables for the template archive.
+        target (str, optional): The tsconfig.json compiler target.
+        module (str, optional): The tsconfig.json module system.
+        strict (bool, optional): Strict type checking for typescript projects.
+
+    Returns:
+        int or None: The daemon's exit status, or None if no daemon handled
+        the request and the caller should bootstrap the project itself.
+    """
+    if not daemon_available():
+        return None
+    path = socket_path()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        send_message(sock, {
+            "version": __version__,
+            "project_name": project_name,
+            "project_type": project_type,
+            "init_git": init_git,
+            "parent_dir": os.getcwd(),
+            "template_version": template_version,
+            "package_manager": package_manager,
+            "resume": resume,
+            "dependencies": dependencies,
+            "wheelhouse": wheelhouse,
+            "template_archive": template_archive,
+            "variables": variables,
+            "target": target,
+            "module": module,
+            "strict": strict,
+            "environment": request_environment(),
+            "umask": current_umask(),
+        })
+        for message in read_messages(sock):
+            if "rejected" in message:
+                return None
+            if "stream" in message:
+                stream = sys.stderr if message["stream"] == "stderr" else sys.stdout
+                stream.write(message["text"])
+                stream.flush()
+            elif "exit" in message:
+                return message["exit"]
+    print("The proboot daemon closed the connection before finishing the project.", file=sys.stderr)
+    return 1
@@ -0,0 +1,126 @@
+"""
+Daemon Protocol
+
+This module defines where the proboot daemon listens and how messages are
+framed. The client and the daemon exchange JSON objects, one per line, over a
+Unix domain socket:
+
+- The client sends a single request describing the project to bootstrap.
+- The daemon answers with any number of `{"stream": ..., "text": ...}` output
+  messages followed by `{"exit": code}`, or with `{"rejected": reason}` if it
+  cannot serve the request (for example because its version differs).
+
+The daemon runs tools with its own environment and umask, which are shared by
+all requests it serves. Every request therefore carries the client's
+environment variables that affect a bootstrap and its umask, and the daemon
+rejects requests whose values differ from its own, so they are bootstrapped
+in-process exactly as they would be without a daemon.
+
+Functions:
+- daemon_supported: Check whether the platform has Unix domain sockets
+- socket_path: Return the path of the daemon socket
+- request_environment: Return the environment variables that affect a bootstrap
+- current_umask: Return the umask of the process
+- send_message: Write one message to a socket
+- read_messages: Iterate over the messages read from a socket
+"""
+import json
+import os
+import socket
+
+from proboot.utils.cache_dir import get_cache_dir
+
+SOCKET_NAME = "proboot.sock"
+# Environment variables that affect a bootstrap, besides every GIT_* variable.
+ENVIRONMENT_VARIABLES = (
+    "PATH", "HOME", "XDG_CACHE_HOME", "LOCALAPPDATA", "PROBOOT_CACHE_DIR",
+    "PROBOOT_NO_HISTORY", "PROBOOT_NO_SNAPSHOT_CACHE", "PROBOOT_NO_VENV_CACHE",
+    "PROBOOT_SNAPSHOT_CACHE_MB", "PROBOOT_GIT_OBJECTS_CACHE_MB", "PROBOOT_WHEELHOUSE",
+    "PROBOOT_PNPM_STORE",
+)
+
+
+def daemon_supported():
+    """
+    Check whether the platform has Unix domain sockets.
+
+    Returns:
+        bool: True if the daemon can run on this platform.
+    """
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path():
+    """
+    Return the path of the daemon socket.
+
+    The socket lives in `$PROBOOT_SOCKET` if set and in the `daemon` directory
+    of the proboot cache otherwise.
+
+    Returns:
+        str: The absolute socket path.
+    """
+    override = os.environ.get("PROBOOT_SOCKET")
+    if override:
+        return os.path.abspath(override)
+    return os.path.join(get_cache_dir("daemon"), SOCKET_NAME)
+
+
+def request_environment():
+    """
+    Return the environment variables that affect a bootstrap.
+
+    These are the tool search path, the git identity and configuration, and
+    the proboot cache settings.
+
+    Returns:
+        dict: The variables that are set, by name.
+    """
+    return {
+        name: value for name, value in os.environ.items()
+        if name in ENVIRONMENT_VARIABLES or name.startswith("GIT_")
+    }
+
+
+def current_umask():
+    """
+    Return the umask of the process.
+
+    The umask can only be read by setting it, so this must not run while
+    other threads create files.
+
+    Returns:
+        int: The umask.
+    """
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def send_message(sock, message):
+    """
+    Write one message to a socket.
+
+    Args:
+        sock (socket.socket): The connected socket.
+        message (dict): A JSON-serializable message.
+
+    Returns:
+        None
+    """
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def read_messages(sock):
+    """
+    Iterate over the messages read from a socket until the peer closes it.
+
+    Args:
+        sock (socket.socket): The connected socket.
+
+    Yields:
+        dict: The decoded messages.
+    """
+    with sock.makefile("rb") as reader:
+        for line in reader:
+            yield json.loads(line)
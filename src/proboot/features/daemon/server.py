@@ -0,0 +1,280 @@
+"""
+Daemon Server
+
+This module implements `proboot serve`, a long-running process that accepts
+bootstrap requests from the `proboot` command over a Unix domain socket.
+
+Each short-lived `proboot` invocation pays for interpreter start-up, imports
+and discovering its tools. The daemon pays those costs once: at start-up it
+imports every bootstrapper, resolves the external tools, builds the golden
+virtual environment and looks up the current React template, and then keeps
+that state in memory for all requests. Requests run concurrently on a
+bounded thread pool, which is safe because the bootstrappers take explicit
+paths and never change the working directory.
+
+The output of a request, including the output of the tools it runs, is sent
+back to the client that made it. The daemon runs tools with the environment
+and umask it was started with, so it only serves clients whose environment
+variables that affect a bootstrap and umask are the same (see
+`proboot.features.daemon.protocol`); the others bootstrap in-process.
+
+Functions:
+- serve: Accept and run bootstrap requests until interrupted
+"""
+import contextvars
+import importlib
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from proboot import __version__
+from proboot.features.daemon.protocol import (current_umask, read_messages,
+                                              request_environment, send_message, socket_path)
+from proboot.features.project_types import bootstrap_project
+from proboot.utils.command_runner import resolve_executable
+from proboot.utils.directory_handler import ProjectExistsError
+from proboot.utils.git_writer import GitIdentityError
+
+BOOTSTRAPPER_MODULES = (
+    "proboot.features.python_project.bootstrapper",
+    "proboot.features.react_typescript_project.bootstrapper",
+    "proboot.features.typescript_project.bootstrapper",
+)
+TOOLS = ("git", "npm", "pnpm", "npx")
+
+# The output callback of the request running in the current context, if any.
+_request_output = contextvars.ContextVar("proboot_request_output", default=None)
+# The environment and umask of the daemon, set before it accepts requests.
+_daemon_environment = None
+_daemon_umask = None
+
+
+class _RequestStream:
+    """
+    A stand-in for sys.stdout or sys.stderr that sends writes made while
+    serving a request to that request's client and all other writes to the
+    daemon's own stream.
+    """
+
+    def __init__(self, name, fallback):
+        self._name = name
+        self._fallback = fallback
+
+    def write(self, text):
+        send = _request_output.get()
+        if send is None:
+            return self._fallback.write(text)
+        if text:
+            send({"stream": self._name, "text": text})
+        return len(text)
+
+    def flush(self):
+        if _request_output.get() is None:
+            self._fallback.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._fallback, name)
+
+
+def _warm_caches():
+    """
+    Loads the state every request needs so that requests do not pay for it.
+
+    Returns:
+        None
+    """
+    # pylint: disable=import-outside-toplevel
+    from proboot.features.python_project.venv_cache import get_golden_venv, venv_cache_enabled
+    from proboot.features.react_typescript_project.template_store import (TemplateNotFoundError,
+                                                                          resolve_template)
+
+    for module in BOOTSTRAPPER_MODULES:
+        importlib.import_module(module)
+    for tool in TOOLS:
+        resolve_executable(tool)
+    if venv_cache_enabled():
+        try:
+            get_golden_venv()
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not build the cached virtual environment: {e}")
+    try:
+        version, _ = resolve_template()
+        print(f"Using create-vite {version} react-ts template.")
+    except TemplateNotFoundError:
+        pass
+
+
+def _run_request(request):
+    """
+    Bootstraps the project described by a request.
+
+    Mirrors the error handling of the `proboot` command, so a forwarded
+    invocation exits with the status it would have had in-process.
+
+    Args:
+        request (dict): The decoded request message.
+
+    Returns:
+        int: The exit status for the client.
+    """
+    try:
+        bootstrap_project(
+            request["project_name"], request["project_type"], request["init_git"],
+            request["parent_dir"], request.get("template_version"),
+            request.get("package_manager", "pnpm"), request.get("resume", False),
+            request.get("dependencies"), request.get("wheelhouse"),
+            request.get("template_archive"), request.get("variables"), request.get("target"),
+            request.get("module"), request.get("strict"),
+        )
+    except ValueError as e:
+        print(e)
+        return 1
+    except (ProjectExistsError, GitIdentityError) as e:
+        print(e)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _rejection(request):
+    """
+    Returns why the daemon cannot serve a request, or None if it can.
+
+    Args:
+        request (dict): The decoded request message.
+
+    Returns:
+        str or None: The reason for rejecting the request.
+    """
+    if request.get("version") != __version__:
+        return f"daemon runs proboot {__version__}"
+    environment = request.get("environment")
+    if environment != _daemon_environment:
+        names = sorted(
+            name for name in set(environment or {}) | set(_daemon_environment)
+            if (environment or {}).get(name) != _daemon_environment.get(name)
+        )
+        return f"daemon runs with a different {', '.join(names) or 'environment'}"
+    if request.get("umask") != _daemon_umask:
+        return f"daemon runs with umask {_daemon_umask:03o}"
+    return None
+
+
+def _handle_connection(conn):
+    """
+    Serves a single client connection.
+
+    Args:
+        conn (socket.socket): The accepted connection.
+
+    Returns:
+        None
+    """
+    lock = threading.Lock()
+    connected = True
+
+    def send(message):
+        nonlocal connected
+        with lock:
+            if not connected:
+                return
+            try:
+                send_message(conn, message)
+            except OSError:
+                # The client went away; finish the project regardless.
+                connected = False
+
+    with conn:
+        try:
+            request = next(read_messages(conn), None)
+        except ValueError:
+            request = None
+        if request is None:
+            return
+        rejection = _rejection(request)
+        if rejection is not None:
+            send({"rejected": rejection})
+            return
+        token = _request_output.set(send)
+        try:
+            code = _run_request(request)
+        finally:
+            _request_output.reset(token)
+        send({"exit": code})
+
+
+def _claim_socket(path):
+    """
+    Removes a stale socket left behind by a daemon that did not shut down cleanly.
+
+    Raises:
+        OSError: If another daemon is already listening on the socket.
+    """
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise OSError(f"A proboot daemon is already listening on {path}.")
+    finally:
+        probe.close()
+
+
+def serve(path=None, max_workers=None):
+    """
+    Accept and run bootstrap requests until interrupted.
+
+    Args:
+        path (str, optional): The socket path. Defaults to `socket_path()`.
+        max_workers (int, optional): Maximum number of requests served at
+            once. Defaults to the number of CPUs.
+
+    Raises:
+        OSError: If the socket cannot be created or another daemon is running.
+
+    Returns:
+        None
+    """
+    global _daemon_environment, _daemon_umask  # pylint: disable=global-statement
+    path = path or socket_path()
+    max_workers = max_workers or os.cpu_count() or 1
+    _daemon_environment = request_environment()
+    _daemon_umask = current_umask()
+    _claim_socket(path)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        os.chmod(path, 0o600)
+        # Listen before warming up, so that clients starting meanwhile wait
+        # for the warm daemon instead of bootstrapping cold in-process.
+        listener.listen()
+        _warm_caches()
+        sys.stdout = _RequestStream("stdout", sys.stdout)
+        sys.stderr = _RequestStream("stderr", sys.stderr)
+        print(f"proboot {__version__} daemon listening on {path} with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while True:
+                    conn, _ = listener.accept()
+                    executor.submit(_handle_connection, conn)
+            except KeyboardInterrupt:
+                pass
+            print("Stopping proboot daemon; finishing running requests.")
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
@@ -0,0 +1,152 @@
+"""
+Speculative Pre-work for Interactive Mode
+
+Interactive mode spends most of its wall time waiting for the user to answer
+prompts. This module uses that time for preparatory work that is safe to do
+before all answers are in, because it only fills caches or writes outside the
+project directory:
+
+- Once the project type is known: import that type's bootstrapper, resolve
+  the external tools it runs and, for react-typescript, make sure the
+  create-vite template is in the store. For python, also build the golden
+  virtual environment if needed and stage a clone of it for the project's
+  future `venv/` (see `stage_venv`).
+
+Nothing is started for the name alone: building the golden environment can
+take seconds on a cold cache, and the bootstrap would wait for it even when
+another type is chosen.
+
+When the answers are complete the bootstrap waits for the pre-work still
+running and then consumes its results: a staged environment is moved into the
+new project with one rename. Anything left unused, e.g. a staged environment
+of a bootstrap that fails early, is discarded.
+
+Pre-work is best-effort: failures are ignored, since the bootstrap repeats
+any step whose pre-work did not finish. The progress messages of successful
+pre-work are held back while the prompts are shown and reported before the
+bootstrap's own output.
+
+Classes:
+- Prework: Background preparation driven by the interactive answers
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from proboot.utils.progress import listening, report
+
+TYPE_TOOLS = {
+    "python": ("git",),
+    "typescript": ("git", "npm", "pnpm"),
+    "react-typescript": ("git", "npm", "pnpm"),
+}
+
+
+class Prework:
+    """
+    Background preparation for a bootstrap whose details are still being asked.
+
+    Call `name_entered` and `type_selected` as the answers arrive, `finish`
+    before bootstrapping and `discard` once the bootstrap is over.
+
+    Args:
+        parent_dir (str, optional): Directory in which the project will be
+            created. Defaults to the current working directory.
+    """
+
+    def __init__(self, parent_dir=None):
+        self._parent_dir = parent_dir
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="proboot-prework")
+        self._futures = []
+        self._events = []
+        self._project_dir = None
+
+    def _submit(self, func, *args):
+        def run():
+            events = []
+            with listening(events.append):
+                try:
+                    func(*args)
+                except Exception:  # pylint: disable=broad-except
+                    # The bootstrap does this work again and reports the error.
+                    return
+            self._events.extend(events)
+
+        self._futures.append(self._executor.submit(run))
+
+    def name_entered(self, project_name):
+        """
+        Records the project name for the pre-work started once the type is known.
+
+        Args:
+            project_name (str): The project name.
+
+        Returns:
+            None
+        """
+        self._project_dir = os.path.join(self._parent_dir, project_name) if self._parent_dir \
+            else project_name
+
+    def type_selected(self, project_type):
+        """
+        Starts the pre-work that needs the project type.
+
+        Args:
+            project_type (str): The selected project type.
+
+        Returns:
+            None
+        """
+        self._submit(_prepare_type, project_type)
+        if (project_type == "python" and self._project_dir is not None
+                and not os.path.lexists(self._project_dir)):
+            self._submit(_stage_python_venv, os.path.join(self._project_dir, "venv"))
+
+    def finish(self):
+        """
+        Waits for the pre-work and reports the progress it held back.
+
+        Returns:
+            None
+        """
+        wait(self._futures)
+        self._executor.shutdown()
+        for event in self._events:
+            report(event.message, event.kind, event.stream)
+        self._events.clear()
+
+    def discard(self):
+        """
+        Discards the results of pre-work that the bootstrap did not use.
+
+        Returns:
+            None
+        """
+        # pylint: disable=import-outside-toplevel
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        from proboot.features.python_project.venv_cache import discard_staged_venvs
+
+        discard_staged_venvs()
+
+
+def _stage_python_venv(venv_dir):
+    # pylint: disable=import-outside-toplevel
+    from proboot.features.python_project.venv_cache import stage_venv, venv_cache_enabled
+    from proboot.utils.type_registry import load_bootstrapper
+
+    load_bootstrapper("python")
+    if venv_cache_enabled():
+        stage_venv(venv_dir)
+
+
+def _prepare_type(project_type):
+    # pylint: disable=import-outside-toplevel
+    from proboot.utils.command_runner import resolve_executable
+    from proboot.utils.type_registry import load_bootstrapper
+
+    load_bootstrapper(project_type)
+    for tool in TYPE_TOOLS.get(project_type, ("git",)):
+        resolve_executable(tool)
+    if project_type == "react-typescript":
+        from proboot.features.react_typescript_project.project_creator import ensure_template
+
+        ensure_template()
@@ -0,0 +1,93 @@
+"""
+Project type dispatch for proboot
+
+This module maps project type names to their bootstrapping functions so that
+the command-line entry point and the batch runner share a single dispatch path.
+Types come from the registry in proboot.utils.type_registry, and a project
+type's bootstrapper is imported only when that type is selected.
+
+Functions:
+- bootstrap_project: Bootstrap a project of the given type
+"""
+import inspect
+
+from proboot.utils.timing_history import recording
+from proboot.utils.type_registry import load_bootstrapper
+
+# Options forwarded to a bootstrapper whose signature accepts them, with the
+# values that mean "not requested" for types that do not.
+OPTION_DEFAULTS = {
+    "template_version": None,
+    "package_manager": "pnpm",
+    "dependencies": None,
+    "wheelhouse": None,
+    "template_archive": None,
+    "variables": None,
+    "target": None,
+    "module": None,
+    "strict": None,
+}
+
+
+def bootstrap_project(project_name, project_type, init_git, parent_dir=None, template_version=None,
+                      package_manager="pnpm", resume=False, dependencies=None, wheelhouse=None,
+                      template_archive=None, variables=None, target=None, module=None,
+                      strict=None):
+    """
+    Bootstraps a new project of the given type.
+
+    Args:
+        project_name (str): The name of the new project.
+        project_type (str): The type of the project, e.g. python, react-typescript
+            or typescript, or a type registered by a plugin.
+        init_git (bool): Whether to initialize a Git repository for the new project.
+        parent_dir (str, optional): Directory in which the project is created.
+            Defaults to the current working directory.
+        template_version (str, optional): The create-vite template version for
+            react-typescript projects.
+        package_manager (str, optional): The package manager for typescript
+            projects, "pnpm" (default) or "npm".
+        resume (bool, optional): Continue a failed bootstrap of the project,
+            re-running only the steps that did not complete.
+        dependencies (list[str], optional): Requirement strings to install from
+            a local wheelhouse into a python project's virtual environment.
+        wheelhouse (str, optional): The wheelhouse directory for dependencies.
+        template_archive (str, optional): The template archive of an archive project.
+        variables (dict, optional): Extra variables for a template archive.
+        target (str, optional): The tsconfig.json compiler target of typescript projects.
+        module (str, optional): The tsconfig.json module system of typescript projects.
+        strict (bool, optional): Strict type checking for typescript projects.
+
+    Raises:
+        ValueError: If the project type is not supported, an option is given
+            that the type does not accept (e.g. dependencies for a type other
+            than python), dependencies cannot be resolved, or if resuming a
+            project directory without a bootstrap journal.
+
+    Returns:
+        None
+    """
+    bootstrapper = load_bootstrapper(project_type)
+    parameters = inspect.signature(bootstrapper).parameters
+    accepts_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+    requested = {
+        "template_version": template_version,
+        "package_manager": package_manager,
+        "dependencies": dependencies or None,
+        "wheelhouse": wheelhouse,
+        "template_archive": template_archive,
+        "variables": variables or None,
+        "target": target,
+        "module": module,
+        "strict": strict,
+    }
+    options = {}
+    for option, value in requested.items():
+        if accepts_any or option in parameters:
+            options[option] = value
+        elif value != OPTION_DEFAULTS[option]:
+            raise ValueError(
+                f"The {option.replace('_', ' ')} option is not supported for {project_type} projects."
+            )
+    with recording(project_type):
+        bootstrapper(project_name, init_git, parent_dir=parent_dir, resume=resume, **options)
@@ -12,21 +12,39 @@ The main function `bootstrap_python_project` orchestrates the creation of:
 - .gitignore file
 - pyproject.toml file
 - setup.py file
-- Virtual environment
+- Virtual environment, optionally seeded with dependencies from a local wheelhouse
 - Git repository (optional)
 
+The project files are rendered in memory, together with the template baseline
+that lets `proboot update` roll out later template changes, and written in one
+pass. The steps are declared as a dependency graph and run concurrently where
+they are independent, so file generation and git overlap with venv creation.
+Completed steps are journaled, so a failed bootstrap can be resumed without
+redoing them. Requested dependencies are resolved against the wheelhouse before
+anything is created and installed from the shared extracted-wheel cache
+without pip or network access.
+
 Functions:
 - bootstrap_python_project: Main function to create a new Python project
 """
 
+import os
+import sys
+
 from proboot.features.python_project.file_creator import (
-    activate_venv, create_gitignore, create_main_py, create_project_structure,
-    create_pyproject_toml, create_readme, create_setup_py, create_venv)
+    activate_venv, build_project_tree, create_project_files, create_venv)
 from proboot.features.python_project.git_initializer import init_git_repo
+from proboot.features.python_project.wheel_installer import install_wheels
+from proboot.features.python_project.wheelhouse import resolve_requirements
 from proboot.utils.directory_handler import create_project_directory
+from proboot.utils.progress import report
+from proboot.utils.step_graph import Step, run_steps
+from proboot.utils.step_journal import StepJournal
+from proboot.utils.template_baseline import add_baseline
 
 
-def bootstrap_python_project(project_name, init_git):
+def bootstrap_python_project(project_name, init_git, parent_dir=None, resume=False,
+                             dependencies=None, wheelhouse=None):
     """
     Bootstraps a new Python project by creating the necessary files and directories, 
     setting up a virtual environment, and optionally initializing a Git repository.
@@ -34,21 +52,49 @@ def bootstrap_python_project(project_name, init_git):
     Args:
         project_name (str): The name of the new Python project.
         init_git (bool): Whether to initialize a Git repository for the new project.
+        parent_dir (str, optional): Directory in which the project is created.
+            Defaults to the current working directory.
+        resume (bool, optional): Continue a failed bootstrap of the project,
+            re-running only the steps that did not complete.
+        dependencies (list[str], optional): Requirement strings to install into
+            the virtual environment and list in pyproject.toml.
+        wheelhouse (str, optional): Directory of wheels the dependencies are
+            resolved against. Defaults to `default_wheelhouse()`.
+
+    Raises:
+        ValueError: If resuming a project directory without a bootstrap journal.
+        WheelhouseError: If the dependencies cannot be resolved from the wheelhouse.
 
     Returns:
         None
     """
-    create_project_directory(project_name)
-    create_project_structure(project_name)
-    create_main_py(project_name)
-    create_readme(project_name)
-    create_gitignore(project_name)
-    create_pyproject_toml(project_name)
-    create_setup_py(project_name)
-    create_venv(project_name)
-    activate_venv(project_name)
+    project_dir = os.path.join(parent_dir, project_name) if parent_dir else project_name
+    dependencies = list(dependencies or ())
+    wheels = resolve_requirements(dependencies, wheelhouse) if dependencies else []
+    tree = build_project_tree(project_name, dependencies)
+    add_baseline(tree, "python", project_name, {"dependencies": dependencies} if dependencies else None)
+    tree_digest = tree.digest()
+    journal = StepJournal.open(project_dir, resume)
+    steps = [
+        Step("directory", lambda: create_project_directory(project_dir, exist_ok=resume)),
+        Step("files", lambda: create_project_files(project_name, project_dir, tree), ("directory",),
+             tree_digest),
+        Step("venv", lambda: create_venv(project_name, project_dir), ("directory",), sys.executable),
+        Step("activate", lambda: activate_venv(project_name, project_dir), ("venv",)),
+    ]
+    if wheels:
+        def install_dependencies():
+            results = install_wheels(wheels, os.path.join(project_dir, "venv"))
+            files = sum(result[2] for result in results)
+            linked = sum(result[3] for result in results)
+            report(f"Installed {len(results)} package{'s' if len(results) != 1 else ''} from the wheelhouse "
+                   f"({linked} of {files} files linked from the wheel cache)")
+
+        steps.append(Step("dependencies", install_dependencies, ("venv",),
+                          [os.path.basename(wheel) for wheel in wheels]))
     if init_git:
-        init_git_repo(project_name)
-        #os.chdir(project_name)
-        #subprocess.run(["git", "add", "."], check=True)
-        #subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
+        # The initial commit is built from the rendered tree; venv/ is ignored
+        # by the generated .gitignore, so git overlaps with venv creation.
+        steps.append(Step("git", lambda: init_git_repo(project_dir, tree), ("files",), tree_digest))
+    run_steps(steps, journal=journal)
+    journal.discard()
@@ -11,44 +11,49 @@ It provides functionality to:
 - Create setup.py
 - Set up and activate a virtual environment
 
+File generators (`add_*`) contribute their files to an in-memory `ProjectTree`;
+`create_project_files` renders all of them and writes the tree in one pass.
+
 These functions are used to bootstrap a new Python project with a standardized
 structure and common configuration files.
 """
 
+import json
 import os
+import shutil
+import subprocess
 import sys
 import venv
 
+from proboot.features.python_project.venv_cache import (
+    adopt_staged_venv, clone_golden_venv, get_golden_venv, venv_cache_enabled)
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+from proboot.utils.project_tree import ProjectTree
+from proboot.utils.timing_history import record_cache
+
 
-def create_project_structure(project_name):
+def add_project_structure(tree, project_name):
     """
-    Creates the basic project structure for a new Python project.
+    Adds the basic package structure of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
 
     Returns:
         None
     """
-    os.makedirs(os.path.join(project_name, "src", "features"), exist_ok=True)
-    open(
-        os.path.join(project_name, "src", "__init__.py"),
-        "a",
-        encoding="utf-8",
-    ).close()
-    open(
-        os.path.join(project_name, "src", "features", "__init__.py"),
-        "a",
-        encoding="utf-8",
-    ).close()
-    print(f"Created project structure for {project_name}")
+    tree.add_file("src/__init__.py", b"")
+    tree.add_file("src/features/__init__.py", b"")
 
 
-def create_main_py(project_name):
+def add_main_py(tree, project_name):
     """
-    Creates the main.py file for a new Python project.
+    Adds the main.py file of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
 
     Returns:
@@ -61,20 +66,15 @@ def main():
 if __name__ == "__main__":
     main()
 """
-    with open(
-        os.path.join(project_name, "src", "main.py"),
-        "w",
-        encoding="utf-8",
-    ) as f:
-        f.write(main_py_content.strip())
-    print("Created main.py")
+    tree.add_file("src/main.py", main_py_content.strip())
 
 
-def create_readme(project_name):
+def add_readme(tree, project_name):
     """
-    Creates the README.md file for a new Python project.
+    Adds the README.md file of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
 
     Returns:
@@ -100,16 +100,15 @@ This project was created using proboot.
 
 This project is open source and available under the [MIT License](LICENSE).
 """
-    with open(os.path.join(project_name, "README.md"), "w", encoding="utf-8") as f:
-        f.write(readme_content.strip())
-    print("Created README.md")
+    tree.add_file("README.md", readme_content.strip())
 
 
-def create_gitignore(project_name):
+def add_gitignore(tree, project_name):
     """
-    Creates a .gitignore file for a new Python project.
+    Adds the .gitignore file of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
 
     Returns:
@@ -148,21 +147,26 @@ wheels/
 .installed.cfg
 *.egg
 """
-    with open(os.path.join(project_name, ".gitignore"), "w", encoding="utf-8") as f:
-        f.write(gitignore_content.strip())
-    print("Created .gitignore")
+    tree.add_file(".gitignore", gitignore_content.strip())
 
 
-def create_pyproject_toml(project_name):
+def add_pyproject_toml(tree, project_name, dependencies=()):
     """
-    Creates a pyproject.toml file for a new Python project.
+    Adds the pyproject.toml file of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
+        dependencies (Iterable[str], optional): Requirement strings listed in
+            `[project] dependencies`.
 
     Returns:
         None
     """
+    dependency_lines = ""
+    if dependencies:
+        entries = "".join(f"    {json.dumps(requirement)},\n" for requirement in dependencies)
+        dependency_lines = f"dependencies = [\n{entries}]\n"
     pyproject_content = f"""
 [build-system]
 requires = ["setuptools>=45", "wheel"]
@@ -175,20 +179,19 @@ description = "A project created with proboot"
 authors = [{{name = "Your Name", email = "your.email@example.com"}}]
 readme = "README.md"
 requires-python = ">=3.7"
-
+{dependency_lines}
 [project.scripts]
 {project_name} = "{project_name}.main:main"
 """
-    with open(os.path.join(project_name, "pyproject.toml"), "w", encoding="utf-8") as f:
-        f.write(pyproject_content.strip())
-    print("Created pyproject.toml")
+    tree.add_file("pyproject.toml", pyproject_content.strip())
 
 
-def create_setup_py(project_name):
+def add_setup_py(tree, project_name):
     """
-    Creates a setup.py file for a new Python project.
+    Adds the setup.py file of a new Python project to the tree.
 
     Args:
+        tree (ProjectTree): The project tree to add files to.
         project_name (str): The name of the new Python project.
 
     Returns:
@@ -202,36 +205,111 @@ setup(
     package_dir={"": "src"},
 )
 """
-    with open(os.path.join(project_name, "setup.py"), "w", encoding="utf-8") as f:
-        f.write(setup_content.strip())
-    print("Created setup.py")
+    tree.add_file("setup.py", setup_content.strip())
+
 
+FILE_GENERATORS = [
+    add_project_structure,
+    add_main_py,
+    add_readme,
+    add_gitignore,
+    add_pyproject_toml,
+    add_setup_py,
+]
 
-def create_venv(project_name):
+
+def build_project_tree(project_name, dependencies=()):
     """
-    Creates a new virtual environment for the Python project.
+    Renders every project file of a new Python project into an in-memory tree.
 
     Args:
         project_name (str): The name of the new Python project.
+        dependencies (Iterable[str], optional): Requirement strings to list in
+            pyproject.toml.
 
     Returns:
-        None
+        ProjectTree: The rendered project files.
+    """
+    tree = ProjectTree()
+    for generator in FILE_GENERATORS:
+        generator(tree, project_name)
+    if dependencies:
+        add_pyproject_toml(tree, project_name, dependencies)
+    return tree
+
+
+def create_project_files(project_name, project_dir=None, tree=None):
+    """
+    Writes the project structure and files of a new Python project in one pass.
+
+    Args:
+        project_name (str): The name of the new Python project.
+        project_dir (str, optional): Directory of the project. Defaults to project_name.
+        tree (ProjectTree, optional): Pre-rendered project files. Defaults to
+            the result of `build_project_tree`.
+
+    Returns:
+        ProjectTree: The files that were written.
     """
-    venv.create(os.path.join(project_name, "venv"), with_pip=True)
-    print("Created virtual environment")
+    project_dir = project_dir or project_name
+    tree = tree or build_project_tree(project_name)
+    tree.write(project_dir)
+    report(f"Created project structure for {project_name}")
+    report("Created " + ", ".join(path for path, _, _ in tree if not path.endswith("__init__.py")))
+    return tree
+
+
+def create_venv(project_name, project_dir=None):
+    """
+    Creates a new virtual environment for the Python project.
 
+    The environment is cloned from the golden venv cache when possible and
+    created with `venv.create` otherwise.
 
-def activate_venv(project_name):
+    Args:
+        project_name (str): The name of the new Python project.
+        project_dir (str, optional): Directory of the project. Defaults to project_name.
+
+    Returns:
+        None
+    """
+    project_dir = project_dir or project_name
+    venv_dir = os.path.join(project_dir, "venv")
+    if os.path.lexists(venv_dir):
+        # Left behind by an interrupted bootstrap that is being resumed.
+        shutil.rmtree(venv_dir)
+    if venv_cache_enabled():
+        if adopt_staged_venv(venv_dir):
+            record_cache("venv", True)
+            report("Created virtual environment (staged ahead of time)")
+            return
+        try:
+            golden_venv = get_golden_venv()
+            with span("clone golden venv", "io"):
+                clone_golden_venv(golden_venv, venv_dir)
+            report("Created virtual environment (from cache)")
+            return
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            report(f"Virtual environment cache unavailable ({e}), creating from scratch")
+            shutil.rmtree(venv_dir, ignore_errors=True)
+    with span("venv.create", "command"):
+        venv.create(venv_dir, with_pip=True)
+    report("Created virtual environment")
+
+
+def activate_venv(project_name, project_dir=None):
     """
     Activates the virtual environment for the specified Python project.
 
     Args:
         project_name (str): The name of the Python project.
+        project_dir (str, optional): Directory of the project. Defaults to project_name.
 
     Returns:
         None
     """
-    venv_path = os.path.join(project_name, "venv")
+    project_dir = project_dir or project_name
+    venv_path = os.path.join(project_dir, "venv")
     if os.path.exists(venv_path):
         if sys.platform == "win32":
             activate_script = os.path.join(venv_path, "Scripts", "activate.bat")
@@ -239,9 +317,9 @@ def activate_venv(project_name):
             activate_script = os.path.join(venv_path, "bin", "activate")
 
         if os.path.exists(activate_script):
-            print("To activate the virtual environment, run:")
-            print(f"source {activate_script}")
+            report("To activate the virtual environment, run:")
+            report(f"source {activate_script}")
         else:
-            print("Virtual environment exists but activation script not found.")
+            report("Virtual environment exists but activation script not found.")
     else:
-        print("Virtual environment not found.")
+        report("Virtual environment not found.")
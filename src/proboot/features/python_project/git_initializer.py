@@ -3,38 +3,43 @@
 Git Initializer Module
 
 This module provides functionality to initialize a Git repository
-for a new Python project. It includes a function to run the 'git init'
-command with appropriate flags to set up a new repository with the
-main branch as the initial branch.
+for a new Python project. It runs 'git init' with the main branch as the
+initial branch and writes the initial commit in-process from the files
+proboot generated, instead of running 'git add' and 'git commit'.
 
 Functions:
-    init_git_repo(project_name): Initialize a new Git repository in the
-                                 specified project directory.
+    init_git_repo(project_name, files): Initialize a new Git repository in the
+                                        specified project directory.
 """
-import os
-import subprocess
+from proboot.utils.git_writer import collect_files, init_repository, write_initial_commit
+from proboot.utils.progress import report
 
 
-def init_git_repo(project_name):
+def init_git_repo(project_name, files=None):
     """
     Initialize a new Git repository in the specified project directory.
     
         This function runs the 'git init' command with the '--initial-branch=main' flag
-        to create a new Git repository in the given project directory. It sets the
-        initial branch name to 'main'.
+        to create a new Git repository in the given project directory and then
+        writes the initial commit directly into the repository.
     
         Args:
-            project_name (str): The name of the project directory where the Git
-                                repository will be initialized.
+            project_name (str): The path of the project directory where the Git
+                                repository will be initialized. The process working
+                                directory is left unchanged.
+            files (Iterable[tuple], optional): (path, content, mode) of the files to
+                                commit, e.g. the generated ProjectTree. Defaults to
+                                every file on disk outside venv/.
     
         Raises:
             subprocess.CalledProcessError: If the 'git init' command fails.
+            GitIdentityError: If no git author identity is configured.
     
         Returns:
             None
     """
-    subprocess.run(['git', 'init', '--initial-branch=main'], cwd=project_name, check=True)
-    os.chdir(project_name)
-    subprocess.run(["git", "add", "."], check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-    print("Initialized git repository")
+    init_repository(project_name)
+    if files is None:
+        files = collect_files(project_name, ignored_dirs=("venv",))
+    write_initial_commit(project_name, files)
+    report("Initialized git repository")
@@ -0,0 +1,278 @@
+"""
+Golden virtual environment cache
+
+Creating a virtual environment with pip runs ensurepip, which takes several
+seconds. This module builds one "golden" virtual environment per base
+interpreter under the user cache directory and clones it into new projects
+with reflinks or hardlinks, rewriting the files that embed the environment's
+absolute path (script shebangs, activation scripts and `pyvenv.cfg`).
+
+A golden environment is keyed by a fingerprint of the base interpreter (path,
+version, size and modification time of the executable) and of the pip version
+bundled with ensurepip. When either changes a new golden environment is built
+and the stale ones for that interpreter are removed.
+
+Where the filesystem cannot reflink, the files of a cloned environment, such
+as pip in site-packages, are hardlinks to the golden environment: editing one
+in place changes it for every environment cloned from the cache. Set
+`PROBOOT_NO_VENV_CACHE=1` to always create virtual environments from scratch,
+with private files (this also makes wheel installs copy instead of hardlink).
+
+An environment can also be staged ahead of time, while it is not yet certain
+that it will be needed: it is cloned into the cache's staging directory with
+its final path already written into it, and later moved into place with a
+single rename, or discarded.
+
+Functions:
+- venv_cache_enabled: Whether the golden venv cache should be used
+- get_golden_venv: Return the golden environment for the running interpreter, building it if needed
+- clone_golden_venv: Materialize a golden environment at a new location
+- stage_venv: Clone an environment for a future location into the staging directory
+- adopt_staged_venv: Move a staged environment into place
+- discard_staged_venvs: Remove the environments staged by this process
+"""
+
+import ensurepip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+import venv
+
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.file_cloner import clone_file
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+from proboot.utils.timing_history import record_cache
+
+MARKER_FILE = "golden.json"
+# Staged environments left behind by a process that died are removed after this.
+STALE_STAGING_SECONDS = 3600
+
+# Staged environments of this process: final venv path -> staging directory.
+_staged = {}
+_staged_lock = threading.Lock()
+
+
+def venv_cache_enabled():
+    """
+    Returns whether virtual environments should be cloned from the golden cache.
+
+    The cache is disabled on Windows, where pip's launcher executables embed
+    the interpreter path in a way that cannot be rewritten safely.
+
+    Returns:
+        bool: True if the cache should be used.
+    """
+    if sys.platform == "win32":
+        return False
+    return os.environ.get("PROBOOT_NO_VENV_CACHE", "") in ("", "0")
+
+
+def _interpreter_fingerprint():
+    """
+    Describes the base interpreter and bundled pip that a new venv would use.
+
+    Returns:
+        dict: Values that change whenever the interpreter or pip is upgraded.
+    """
+    executable = os.path.realpath(getattr(sys, "_base_executable", sys.executable))
+    stat = os.stat(executable)
+    return {
+        "executable": executable,
+        "version": sys.version,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "pip": ensurepip.version(),
+    }
+
+
+def _hash(value):
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def get_golden_venv():
+    """
+    Returns the golden virtual environment for the running interpreter.
+
+    The environment is built in a private staging directory and renamed into
+    place, so concurrent proboot processes never observe a half-built cache
+    entry.
+
+    Raises:
+        OSError: If the cache directory cannot be written.
+        subprocess.CalledProcessError: If ensurepip fails.
+
+    Returns:
+        str: The cache entry directory, containing `venv/` and the marker file.
+    """
+    fingerprint = _interpreter_fingerprint()
+    interpreter_dir = get_cache_dir("venvs", _hash(fingerprint["executable"]))
+    entry_key = _hash(json.dumps(fingerprint, sort_keys=True))
+    entry_dir = os.path.join(interpreter_dir, entry_key)
+    if os.path.isfile(os.path.join(entry_dir, MARKER_FILE)):
+        record_cache("venv", True)
+        return entry_dir
+
+    record_cache("venv", False)
+    report("Building cached virtual environment (one-time)")
+    staging_dir = os.path.join(interpreter_dir, f".build-{uuid.uuid4().hex}")
+    try:
+        prefix = os.path.join(staging_dir, "venv")
+        with span("venv.create (golden)", "command"):
+            venv.create(prefix, with_pip=True)
+        with open(os.path.join(staging_dir, MARKER_FILE), "w", encoding="utf-8") as f:
+            json.dump({"prefix": prefix, "fingerprint": fingerprint}, f, indent=2)
+        try:
+            os.rename(staging_dir, entry_dir)
+        except OSError:
+            # Another process published the same entry first.
+            if not os.path.isfile(os.path.join(entry_dir, MARKER_FILE)):
+                raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    for name in os.listdir(interpreter_dir):
+        if name != entry_key and not name.startswith("."):
+            shutil.rmtree(os.path.join(interpreter_dir, name), ignore_errors=True)
+    return entry_dir
+
+
+def clone_golden_venv(entry_dir, target_dir, prefix=None):
+    """
+    Materializes a golden virtual environment at target_dir.
+
+    Regular files are reflinked or hardlinked from the cache. Files in the
+    environment root and its scripts directory that mention the golden
+    environment's path are rewritten to point at the environment's prefix instead.
+
+    Args:
+        entry_dir (str): A cache entry as returned by `get_golden_venv`.
+        target_dir (str): The new virtual environment directory. It must not exist.
+        prefix (str, optional): The path the environment will be used at, if
+            it is moved there later. Defaults to target_dir.
+
+    Raises:
+        OSError: If the environment cannot be cloned.
+        ValueError: If the cache entry is corrupt.
+
+    Returns:
+        None
+    """
+    try:
+        with open(os.path.join(entry_dir, MARKER_FILE), encoding="utf-8") as f:
+            old_prefix = json.load(f)["prefix"]
+    except (KeyError, json.JSONDecodeError) as e:
+        raise ValueError(f"corrupt venv cache entry {entry_dir}") from e
+
+    source_dir = os.path.join(entry_dir, "venv")
+    target_dir = os.path.abspath(target_dir)
+    new_prefix = os.path.abspath(prefix or target_dir)
+    old_bytes, new_bytes = old_prefix.encode(), new_prefix.encode()
+    rewrite_dirs = {source_dir, os.path.join(source_dir, "bin")}
+
+    for root, dirs, files in os.walk(source_dir):
+        dest_root = os.path.join(target_dir, os.path.relpath(root, source_dir))
+        os.makedirs(dest_root, exist_ok=True)
+        for name in dirs + files:
+            src = os.path.join(root, name)
+            dst = os.path.join(dest_root, name)
+            if os.path.islink(src):
+                link = os.readlink(src)
+                if link.startswith(old_prefix):
+                    link = new_prefix + link[len(old_prefix):]
+                os.symlink(link, dst)
+                if name in dirs:
+                    dirs.remove(name)
+            elif name in files:
+                if root in rewrite_dirs:
+                    with open(src, "rb") as f:
+                        content = f.read()
+                    if old_bytes in content:
+                        with open(dst, "wb") as f:
+                            f.write(content.replace(old_bytes, new_bytes))
+                        shutil.copymode(src, dst)
+                        continue
+                clone_file(src, dst)
+
+
+def stage_venv(venv_dir):
+    """
+    Clones the golden environment for a future location into the staging directory.
+
+    Args:
+        venv_dir (str): Where the environment will be used; it is moved there
+            by `adopt_staged_venv`.
+
+    Raises:
+        OSError: If the environment cannot be cloned.
+        ValueError: If the cache entry is corrupt.
+        subprocess.CalledProcessError: If the golden environment cannot be built.
+
+    Returns:
+        None
+    """
+    venv_dir = os.path.abspath(venv_dir)
+    entry_dir = get_golden_venv()
+    staging_root = get_cache_dir("venvs", "staging")
+    now = time.time()
+    for name in os.listdir(staging_root):
+        path = os.path.join(staging_root, name)
+        try:
+            if now - os.stat(path).st_mtime > STALE_STAGING_SECONDS:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+    staging_dir = os.path.join(staging_root, uuid.uuid4().hex)
+    try:
+        with span("stage golden venv", "io"):
+            clone_golden_venv(entry_dir, staging_dir, prefix=venv_dir)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    with _staged_lock:
+        previous = _staged.pop(venv_dir, None)
+        _staged[venv_dir] = staging_dir
+    if previous:
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def adopt_staged_venv(venv_dir):
+    """
+    Moves an environment staged for venv_dir into place.
+
+    Args:
+        venv_dir (str): The virtual environment directory. It must not exist.
+
+    Returns:
+        bool: True if a staged environment was moved into place; False if
+        none was staged or it cannot be renamed there (e.g. another file system).
+    """
+    with _staged_lock:
+        staging_dir = _staged.pop(os.path.abspath(venv_dir), None)
+    if staging_dir is None:
+        return False
+    try:
+        os.rename(staging_dir, venv_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return False
+    return True
+
+
+def discard_staged_venvs():
+    """
+    Removes the environments staged by this process that were not adopted.
+
+    Returns:
+        None
+    """
+    with _staged_lock:
+        staging_dirs = list(_staged.values())
+        _staged.clear()
+    for staging_dir in staging_dirs:
+        shutil.rmtree(staging_dir, ignore_errors=True)
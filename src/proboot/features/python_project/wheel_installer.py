@@ -0,0 +1,268 @@
+"""
+This module installs wheels into a virtual environment without pip.
+
+Each wheel is unpacked once into the shared wheel cache of proboot (keyed by
+the wheel's SHA-256) and byte-compiled there. Installing it into an
+environment then only creates directories and hardlinks (or reflinks) the
+cached files into site-packages, so installing the same wheels into many
+environments costs little more than the directory walk. The cached `.pyc`
+files stay valid because hardlinks share the source's modification time.
+Hardlinked files are shared with the cache and every environment they were
+installed into, so they must not be edited in place; with
+`PROBOOT_NO_VENV_CACHE=1` files are reflinked or copied instead.
+
+Installation follows the wheel spec: `.data/purelib` and `.data/platlib` go
+to site-packages, `.data/scripts` to the scripts directory (with `#!python`
+shebangs rewritten), `.data/headers` and `.data/data` to their scheme
+locations, console and GUI entry points get wrapper scripts, and the
+`.dist-info` gets a fresh RECORD and an INSTALLER so pip can list and
+uninstall the package. A version already installed in the environment is
+removed first. Wheels are installed concurrently.
+
+Functions:
+- install_wheels: Install wheels into a virtual environment
+"""
+import compileall
+import configparser
+import csv
+import hashlib
+import os
+import shutil
+import sys
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from packaging.utils import canonicalize_name, parse_wheel_filename
+
+from proboot.features.python_project.venv_cache import venv_cache_enabled
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.file_cloner import clone_file
+from proboot.utils.profiler import span
+from proboot.utils.venv_paths import scripts_dir, site_packages_dir
+
+# Files of the .dist-info directory that are written per environment.
+GENERATED_DIST_INFO_FILES = ("RECORD", "INSTALLER", "REQUESTED")
+SCRIPT_TEMPLATE = """#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+from {module} import {attribute}
+if __name__ == "__main__":
+    sys.argv[0] = re.sub(r"(-script\\.pyw|\\.exe)?$", "", sys.argv[0])
+    sys.exit({call}())
+"""
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _extracted_wheel(wheel_path):
+    """
+    Returns the cache directory holding the unpacked and compiled wheel.
+
+    The wheel is extracted into a staging directory that is renamed into
+    place, so concurrent proboot processes never see a partial entry.
+    """
+    wheels_dir = get_cache_dir("wheels")
+    entry_dir = os.path.join(wheels_dir, _file_hash(wheel_path))
+    if os.path.isdir(entry_dir):
+        return entry_dir
+
+    staging_dir = os.path.join(wheels_dir, f".extract-{uuid.uuid4().hex}")
+    try:
+        with span(f"extract {os.path.basename(wheel_path)}", "io"):
+            with zipfile.ZipFile(wheel_path) as wheel:
+                for info in wheel.infolist():
+                    path = wheel.extract(info, staging_dir)
+                    mode = info.external_attr >> 16
+                    if mode and not info.is_dir():
+                        os.chmod(path, mode & 0o777 | 0o600)
+            compileall.compile_dir(staging_dir, quiet=2)
+        try:
+            os.rename(staging_dir, entry_dir)
+        except OSError:
+            # Another process extracted the same wheel first.
+            if not os.path.isdir(entry_dir):
+                raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return entry_dir
+
+
+def _scheme_dirs(venv_dir, site_packages, name):
+    python = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    return {
+        "purelib": site_packages,
+        "platlib": site_packages,
+        "scripts": scripts_dir(venv_dir),
+        "headers": os.path.join(venv_dir, "include", "site", python, name),
+        "data": venv_dir,
+    }
+
+
+def _has_python_shebang(path):
+    with open(path, "rb") as f:
+        return f.read(8) == b"#!python"
+
+
+def _link_tree(source_dir, target_dir, exclude=(), scripts=False, python=None,
+               allow_hardlink=True):
+    """
+    Mirrors source_dir into target_dir with cloned files, leaving out the
+    relative paths in exclude. With scripts set, `#!python` shebangs are
+    rewritten to python, in a copy of the file. Without allow_hardlink, files
+    are reflinked or copied.
+
+    Returns:
+        tuple: The created file paths and how many were hardlinked or reflinked.
+    """
+    created = []
+    linked = 0
+    for root, dirs, files in os.walk(source_dir):
+        relative_root = os.path.relpath(root, source_dir)
+        dirs[:] = [d for d in dirs if os.path.normpath(os.path.join(relative_root, d)) not in exclude]
+        dest_root = os.path.normpath(os.path.join(target_dir, relative_root))
+        os.makedirs(dest_root, exist_ok=True)
+        for name in files:
+            if os.path.normpath(os.path.join(relative_root, name)) in exclude:
+                continue
+            src = os.path.join(root, name)
+            dst = os.path.join(dest_root, name)
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            if scripts and _has_python_shebang(src):
+                with open(src, "rb") as f:
+                    first_line, _, rest = f.read().partition(b"\n")
+                with open(dst, "wb") as f:
+                    f.write(b"#!" + python.encode() + first_line[len(b"#!python"):] + b"\n" + rest)
+                os.chmod(dst, 0o755)
+            elif clone_file(src, dst, allow_hardlink) != "copy":
+                linked += 1
+            created.append(dst)
+    return created, linked
+
+
+def _write_entry_points(dist_info_dir, scripts_dir, python):
+    parser = configparser.ConfigParser(delimiters=("=",))
+    parser.optionxform = str
+    parser.read(os.path.join(dist_info_dir, "entry_points.txt"), encoding="utf-8")
+    created = []
+    if sys.platform == "win32":
+        return created
+    for section in ("console_scripts", "gui_scripts"):
+        if not parser.has_section(section):
+            continue
+        for script, target in parser.items(section):
+            module, _, attribute = target.split("[", 1)[0].strip().partition(":")
+            attribute = attribute.strip()
+            path = os.path.join(scripts_dir, script)
+            os.makedirs(scripts_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(SCRIPT_TEMPLATE.format(python=python, module=module.strip(),
+                                               attribute=attribute.split(".")[0], call=attribute))
+            os.chmod(path, 0o755)
+            created.append(path)
+    return created
+
+
+def _remove_installed(site_packages, name):
+    """
+    Removes an installed distribution (for example pip from the base venv).
+    """
+    for entry in os.listdir(site_packages):
+        if not entry.endswith(".dist-info"):
+            continue
+        if canonicalize_name(entry[:-len(".dist-info")].rsplit("-", 1)[0]) != name:
+            continue
+        dist_info_dir = os.path.join(site_packages, entry)
+        try:
+            with open(os.path.join(dist_info_dir, "RECORD"), encoding="utf-8", newline="") as f:
+                paths = [row[0] for row in csv.reader(f) if row]
+        except FileNotFoundError:
+            paths = []
+        for path in paths:
+            full_path = os.path.normpath(os.path.join(site_packages, path))
+            if os.path.isfile(full_path) or os.path.islink(full_path):
+                os.unlink(full_path)
+        shutil.rmtree(dist_info_dir, ignore_errors=True)
+
+
+def _install_wheel(wheel_path, venv_dir, site_packages, allow_hardlink):
+    """
+    Installs one wheel from the extracted-wheel cache.
+
+    Returns:
+        tuple: The project name, version, number of files and number of linked files.
+    """
+    name, version, _, _ = parse_wheel_filename(os.path.basename(wheel_path))
+    entry_dir = _extracted_wheel(wheel_path)
+    top_level = os.listdir(entry_dir)
+    dist_info = next(d for d in top_level if d.endswith(".dist-info"))
+    data_dir = next((d for d in top_level if d.endswith(".data")), None)
+    python = os.path.join(scripts_dir(os.path.abspath(venv_dir)), "python")
+
+    exclude = {os.path.join(dist_info, name) for name in GENERATED_DIST_INFO_FILES}
+    if data_dir:
+        exclude.add(data_dir)
+    created, linked = _link_tree(entry_dir, site_packages, exclude,
+                                 allow_hardlink=allow_hardlink)
+    schemes = _scheme_dirs(venv_dir, site_packages, name)
+    if data_dir:
+        for scheme in os.listdir(os.path.join(entry_dir, data_dir)):
+            if scheme not in schemes:
+                raise ValueError(f"{os.path.basename(wheel_path)} has unknown data scheme {scheme}")
+            files, count = _link_tree(os.path.join(entry_dir, data_dir, scheme), schemes[scheme],
+                                      scripts=scheme == "scripts", python=python,
+                                      allow_hardlink=allow_hardlink)
+            created += files
+            linked += count
+    dist_info_dir = os.path.join(site_packages, dist_info)
+    created += _write_entry_points(dist_info_dir, schemes["scripts"], python)
+
+    with open(os.path.join(dist_info_dir, "INSTALLER"), "w", encoding="utf-8") as f:
+        f.write("proboot\n")
+    record = [os.path.relpath(path, site_packages) for path in created]
+    record += [os.path.join(dist_info, "INSTALLER"), os.path.join(dist_info, "RECORD")]
+    with open(os.path.join(dist_info_dir, "RECORD"), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerows([path.replace(os.sep, "/"), "", ""] for path in record)
+    return name, version, len(created), linked
+
+
+def install_wheels(wheel_paths, venv_dir, max_workers=None):
+    """
+    Install wheels into a virtual environment.
+
+    Files are hardlinked from the wheel cache unless the golden venv cache is
+    disabled (see `venv_cache_enabled`), in which case they are reflinked or
+    copied so the environment does not share them.
+
+    Args:
+        wheel_paths (list[str]): The wheels to install, e.g. from `resolve_requirements`.
+        venv_dir (str): The virtual environment directory.
+        max_workers (int, optional): Number of wheels installed at once.
+            Defaults to the executor's default.
+
+    Raises:
+        OSError: If a wheel cannot be read or the environment cannot be written.
+        zipfile.BadZipFile: If a wheel is corrupt.
+        ValueError: If a wheel is malformed.
+
+    Returns:
+        list[tuple]: (name, version, files, linked files) per installed wheel.
+    """
+    site_packages = site_packages_dir(venv_dir)
+    allow_hardlink = venv_cache_enabled()
+    for wheel_path in wheel_paths:
+        _remove_installed(site_packages, parse_wheel_filename(os.path.basename(wheel_path))[0])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda wheel_path: _install_wheel(wheel_path, venv_dir, site_packages, allow_hardlink),
+            wheel_paths
+        ))
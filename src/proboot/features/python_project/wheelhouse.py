@@ -0,0 +1,185 @@
+"""
+This module resolves Python requirements against a local wheelhouse.
+
+A wheelhouse is a directory of `.whl` files, for example filled with
+`pip download -d wheelhouse <packages>`. Requirements are resolved without
+network access: every requirement, and every dependency declared in a chosen
+wheel's metadata, is matched against the wheels that are compatible with the
+running interpreter, picking the highest version that satisfies all
+specifiers seen so far for that project. When a later requirement excludes an
+already chosen version, the project is re-chosen and resolution repeats until
+nothing changes. There is no deeper backtracking; a requirement no wheel
+satisfies is an error.
+
+Pre-releases are only chosen when a specifier explicitly asks for one.
+
+The wheelhouse is `$PROBOOT_WHEELHOUSE` or the `wheelhouse` directory of the
+proboot cache unless given explicitly.
+
+Functions:
+- WheelhouseError: Raised when requirements cannot be resolved
+- default_wheelhouse: Return the wheelhouse used when none is given
+- read_requirements_file: Read requirement strings from a requirements file
+- resolve_requirements: Resolve requirements to wheel files
+"""
+import email.parser
+import os
+import zipfile
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.tags import sys_tags
+from packaging.utils import InvalidWheelFilename, canonicalize_name, parse_wheel_filename
+
+from proboot.utils.cache_dir import get_cache_dir
+
+
+class WheelhouseError(ValueError):
+    """Raised when requirements cannot be resolved against the wheelhouse."""
+
+
+def default_wheelhouse():
+    """
+    Return the wheelhouse used when none is given.
+
+    Returns:
+        str: `$PROBOOT_WHEELHOUSE`, or the `wheelhouse` directory of the proboot cache.
+    """
+    return os.environ.get("PROBOOT_WHEELHOUSE") or get_cache_dir("wheelhouse")
+
+
+def read_requirements_file(path):
+    """
+    Read requirement strings from a requirements file.
+
+    Blank lines, comments and pip options (lines starting with `-`) are skipped.
+
+    Args:
+        path (str): Path to the requirements file.
+
+    Raises:
+        OSError: If the file cannot be read.
+
+    Returns:
+        list[str]: The requirement strings in file order.
+    """
+    requirements = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split(" #", 1)[0].strip()
+            if line and not line.startswith(("#", "-")):
+                requirements.append(line)
+    return requirements
+
+
+def _index_wheelhouse(wheelhouse):
+    """
+    Lists the wheels compatible with the running interpreter by project name.
+
+    Returns:
+        dict: Canonical project name to a list of (version, tag priority, path),
+        best candidates first.
+    """
+    priorities = {tag: index for index, tag in enumerate(sys_tags())}
+    index = {}
+    try:
+        names = os.listdir(wheelhouse)
+    except FileNotFoundError:
+        raise WheelhouseError(f"Wheelhouse {wheelhouse} does not exist.") from None
+    for filename in names:
+        if not filename.endswith(".whl"):
+            continue
+        try:
+            name, version, _, tags = parse_wheel_filename(filename)
+        except InvalidWheelFilename:
+            continue
+        compatible = [priorities[tag] for tag in tags if tag in priorities]
+        if compatible:
+            index.setdefault(name, []).append(
+                (version, min(compatible), os.path.join(wheelhouse, filename))
+            )
+    for candidates in index.values():
+        # Highest version first; among equal versions, the most specific tag.
+        candidates.sort(key=lambda candidate: (candidate[0], -candidate[1]), reverse=True)
+    return index
+
+
+def _wheel_dependencies(path):
+    """
+    Reads the Requires-Dist entries of a wheel.
+
+    Returns:
+        list[Requirement]: The declared dependencies.
+    """
+    with zipfile.ZipFile(path) as wheel:
+        metadata_name = next(
+            (name for name in wheel.namelist()
+             if name.count("/") == 1 and name.endswith(".dist-info/METADATA")),
+            None,
+        )
+        if metadata_name is None:
+            raise WheelhouseError(f"{os.path.basename(path)} has no METADATA.")
+        metadata = email.parser.BytesParser().parsebytes(wheel.read(metadata_name), headersonly=True)
+    return [Requirement(value) for value in metadata.get_all("Requires-Dist") or []]
+
+
+def resolve_requirements(requirements, wheelhouse=None):
+    """
+    Resolve requirements to wheel files.
+
+    Args:
+        requirements (list[str]): PEP 508 requirement strings.
+        wheelhouse (str, optional): The wheelhouse directory. Defaults to
+            `default_wheelhouse()`.
+
+    Raises:
+        WheelhouseError: If a requirement is invalid or no compatible wheel satisfies it.
+
+    Returns:
+        list[str]: Paths of the wheels to install, sorted by file name.
+    """
+    wheelhouse = wheelhouse or default_wheelhouse()
+    index = _index_wheelhouse(wheelhouse)
+    environment = default_environment()
+    try:
+        pending = [(Requirement(requirement), None) for requirement in requirements]
+    except InvalidRequirement as e:
+        raise WheelhouseError(f"Invalid requirement: {e}") from e
+
+    specifiers = {}
+    extras = {}
+    chosen = {}
+    dependency_cache = {}
+    while pending:
+        requirement, parent = pending.pop(0)
+        marker_environment = dict(environment, extra=parent[1] if parent else "")
+        if requirement.marker is not None and not requirement.marker.evaluate(marker_environment):
+            continue
+        name = canonicalize_name(requirement.name)
+        specifiers.setdefault(name, []).append(requirement.specifier)
+        extras.setdefault(name, set())
+        new_extras = set(requirement.extras) - extras[name]
+        extras[name] |= new_extras
+
+        current = chosen.get(name)
+        if current is not None and all(spec.contains(current[0], prereleases=True)
+                                       for spec in specifiers[name]) and not new_extras:
+            continue
+        candidate = next(
+            (c for c in index.get(name, ())
+             if all(spec.contains(c[0]) for spec in specifiers[name])),
+            None,
+        )
+        if candidate is None:
+            wanted = ", ".join(str(spec) for spec in specifiers[name] if str(spec)) or "any version"
+            required_by = f", required by {parent[0]}" if parent else ""
+            raise WheelhouseError(
+                f"No wheel in {wheelhouse} satisfies {requirement.name} ({wanted}{required_by})."
+            )
+        chosen[name] = candidate
+        if candidate[2] not in dependency_cache:
+            dependency_cache[candidate[2]] = _wheel_dependencies(candidate[2])
+        # Requirements with an extra marker only apply for the requested extras.
+        for extra in ("", *sorted(extras[name])):
+            pending.extend((dependency, (name, extra)) for dependency in dependency_cache[candidate[2]])
+    return sorted((candidate[2] for candidate in chosen.values()), key=os.path.basename)
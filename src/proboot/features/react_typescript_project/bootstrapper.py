@@ -6,45 +6,120 @@ including necessary files, directories, and optionally initializing a Git reposi
 
 The main function `bootstrap_react_typescript_project` orchestrates the creation of:
 - Project directory
-- React TypeScript project using pnpm and Vite
-- Installation of dependencies
+- React TypeScript project from a stored create-vite template
+- Installation of dependencies (frozen and offline from a cached lockfile when possible)
 - Git repository (optional)
 
+Completed steps are journaled, so a failed bootstrap can be resumed without
+redoing them. A generated project is stored in the snapshot cache, keyed by the create-vite
+template version; later bootstraps restore it instead of installing again.
+
+The steps are declared as a dependency graph; the git repository is created
+while the project is set up and dependencies are installed.
+
 Functions:
 - bootstrap_react_typescript_project: Main function to create a new React TypeScript project
 """
 import os
-import subprocess
 
+from proboot import __version__
 from proboot.features.react_typescript_project.dependency_installer import \
     install_dependencies
 from proboot.features.react_typescript_project.project_creator import \
     create_react_typescript_project
+from proboot.features.react_typescript_project.template_store import (TemplateNotFoundError,
+                                                                      resolve_template)
 from proboot.utils.directory_handler import create_project_directory
+from proboot.utils.git_writer import collect_files, init_repository, write_initial_commit
+from proboot.utils.npm_package import set_package_name
+from proboot.utils.progress import report
+from proboot.utils.snapshot_cache import (find_snapshot, restore_snapshot, snapshot_cache_enabled,
+                                          snapshot_key, store_snapshot)
+from proboot.utils.step_graph import Step, run_steps
+from proboot.utils.step_journal import JOURNAL_DIR, StepJournal
 
 
-def bootstrap_react_typescript_project(project_name, init_git):
+def bootstrap_react_typescript_project(project_name, init_git, parent_dir=None, template_version=None,
+                                       resume=False):
     """
     Bootstraps a new React TypeScript project by creating the necessary files and directories, 
-    setting up the project using pnpm and Vite, and optionally initializing a Git repository.
+    setting up the project from the create-vite template store, and optionally initializing a Git repository.
 
     Args:
         project_name (str): The name of the new React TypeScript project.
         init_git (bool): Whether to initialize a Git repository for the new project.
+        parent_dir (str, optional): Directory in which the project is created.
+            Defaults to the current working directory.
+        resume (bool, optional): Continue a failed bootstrap of the project,
+            re-running only the steps that did not complete.
+        template_version (str, optional): The create-vite template version to use.
+            Defaults to the template store's current version.
+
+    Raises:
+        ValueError: If resuming a project directory without a bootstrap journal.
 
     Returns:
         None
     """
-    create_project_directory(project_name)
-    os.chdir(project_name)
-    create_react_typescript_project(project_name)
-    install_dependencies()
+    project_dir = os.path.join(parent_dir, project_name) if parent_dir else project_name
+    journal = StepJournal.open(project_dir, resume)
+    key = None
+    if snapshot_cache_enabled():
+        try:
+            resolved_version, _ = resolve_template(template_version)
+            key = snapshot_key("react-typescript", __version__, resolved_version)
+        except TemplateNotFoundError:
+            pass
+    # A resumed project keeps its partial files, so it is never restored over.
+    snapshot = find_snapshot(key) if key and not resume else None
+
+    restored = []
+
+    def create_project():
+        create_react_typescript_project(project_name, project_dir, template_version)
+
+    def restore_project():
+        if restore_snapshot(snapshot, project_dir):
+            set_package_name(project_dir, project_name)
+            restored.append(key)
+            report(f"Restored React TypeScript project {project_name} from the snapshot cache")
+            return
+        report("The snapshot cache entry is incomplete, creating the project instead")
+        create_project()
+        install_dependencies(project_dir)
+
+    steps = [Step("directory", lambda: create_project_directory(project_dir, exist_ok=resume))]
+    if snapshot:
+        steps.append(Step("project", restore_project, ("directory",), ["snapshot", key]))
+        last_step = "project"
+    else:
+        steps += [
+            Step("project", create_project, ("directory",), ["create", project_name, template_version]),
+            Step("dependencies", lambda: install_dependencies(project_dir), ("project",)),
+        ]
+        last_step = "dependencies"
     if init_git:
-        subprocess.run(['git', 'init', '--initial-branch=main'], check=True)
-        subprocess.run(["git", "add", "."], check=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-
-    print(f"React TypeScript project '{project_name}' has been created successfully.")
-    print("To start the development server, run:")
-    print(f"cd {project_name}")
-    print("pnpm run dev")
+        # The repository is created while the project is set up; the initial
+        # commit waits for the install so it includes the lockfile.
+        steps.append(Step("git_init", lambda: init_repository(project_dir), ("directory",)))
+        steps.append(
+            Step(
+                "git_commit",
+                lambda: write_initial_commit(
+                    project_dir, collect_files(project_dir, ignored_dirs=("node_modules", JOURNAL_DIR))
+                ),
+                ("git_init", last_step),
+            )
+        )
+    run_steps(steps, journal=journal)
+    journal.discard()
+    if key and not restored:
+        try:
+            store_snapshot(key, project_dir)
+        except OSError as e:
+            report(f"Snapshot cache unavailable ({e}), project not stored")
+
+    report(f"React TypeScript project '{project_name}' has been created successfully.")
+    report("To start the development server, run:")
+    report(f"cd {project_dir}")
+    report("pnpm run dev")
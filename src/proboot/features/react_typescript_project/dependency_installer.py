@@ -2,13 +2,104 @@
 React TypeScript Project Dependency Installer
 
 This module contains the function to install dependencies for a React TypeScript project using pnpm.
-"""
 
+Resolving the dependency graph of the Vite template is most of the install
+time, and every project created from the same template resolves to the same
+graph. The resolved `pnpm-lock.yaml` is therefore cached, keyed by a hash of
+the template's `package.json` (ignoring the project name, which is the only
+part that differs between projects). On a cache hit the lockfile is installed
+frozen and offline from the pnpm store; if the store lacks some packages they
+are fetched without resolving again, and only if the cached lockfile no longer
+installs at all is it discarded and the graph resolved from scratch.
+
+Set `PROBOOT_PNPM_STORE` to install against a specific pnpm store directory,
+e.g. one shared by CI jobs.
+
+Functions:
+- install_dependencies: Install a React TypeScript project's dependencies
+"""
+import hashlib
+import json
+import os
 import subprocess
 
-def install_dependencies():
+from proboot.utils.command_runner import run_command
+from proboot.utils.lockfile_cache import (discard_cached_lockfile, load_cached_lockfile,
+                                          lockfile_cache_key, store_cached_lockfile)
+from proboot.utils.progress import report
+from proboot.utils.timing_history import record_cache
+
+LOCKFILE = "pnpm-lock.yaml"
+
+
+def _store_args():
+    store_dir = os.environ.get("PROBOOT_PNPM_STORE")
+    return [f"--store-dir={os.path.abspath(store_dir)}"] if store_dir else []
+
+
+def _lockfile_key(project_dir):
+    """
+    Returns the lockfile cache key of a project's package.json, without its name.
+    """
+    with open(os.path.join(project_dir, "package.json"), encoding="utf-8") as f:
+        package_json = json.load(f)
+    package_json.pop("name", None)
+    content = json.dumps(package_json, sort_keys=True).encode("utf-8")
+    return lockfile_cache_key("react-typescript", "pnpm", hashlib.sha256(content).hexdigest())
+
+
+def _install_cached(project_dir, lockfile, store_args):
+    """
+    Installs a cached lockfile frozen, offline first; returns False if it no longer installs.
+    """
+    with open(os.path.join(project_dir, LOCKFILE), "wb") as f:
+        f.write(lockfile)
+    frozen = ["pnpm", "install", "--frozen-lockfile", *store_args]
+    try:
+        run_command(frozen + ["--offline"], cwd=project_dir)
+        return True
+    except subprocess.CalledProcessError:
+        report("The pnpm store lacks packages of the cached lockfile, fetching them.")
+    try:
+        run_command(frozen + ["--prefer-offline"], cwd=project_dir)
+        return True
+    except subprocess.CalledProcessError:
+        report("Cached lockfile is stale, resolving dependencies again.")
+        os.remove(os.path.join(project_dir, LOCKFILE))
+        return False
+
+
+def install_dependencies(project_dir="."):
     """
     Installs project dependencies using pnpm.
+
+    Uses the cached lockfile of the project's template when there is one;
+    otherwise resolves the dependencies and caches the resulting lockfile.
+
+    Args:
+        project_dir (str, optional): Directory of the project. Defaults to the
+            current working directory.
+
+    Raises:
+        subprocess.CalledProcessError: If the install fails.
+
+    Returns:
+        None
     """
-    subprocess.run(["pnpm", "install"], check=True)
-    print("Dependencies installed successfully.")
+    store_args = _store_args()
+    key = _lockfile_key(project_dir)
+    cached = load_cached_lockfile(key)
+    if cached and LOCKFILE in cached:
+        if _install_cached(project_dir, cached[LOCKFILE], store_args):
+            record_cache("lockfile", True)
+            report("Dependencies installed successfully (cached lockfile, frozen).")
+            return
+        discard_cached_lockfile(key)
+
+    run_command(["pnpm", "install", *store_args], cwd=project_dir, check=True)
+    lockfile_path = os.path.join(project_dir, LOCKFILE)
+    if os.path.exists(lockfile_path):
+        with open(lockfile_path, "rb") as f:
+            store_cached_lockfile(key, {LOCKFILE: f.read()})
+    record_cache("lockfile", False)
+    report("Dependencies installed successfully (fresh resolution).")
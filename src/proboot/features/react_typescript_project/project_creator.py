@@ -1,17 +1,58 @@
 """
 React TypeScript Project Creator
 
-This module contains the function to create a new React TypeScript project using pnpm and Vite.
+This module contains the function to create a new React TypeScript project from
+a locally stored snapshot of the create-vite react-ts template.
 """
 
-import subprocess
+from proboot.features.react_typescript_project.template_store import (
+    TemplateNotFoundError, fetch_template, materialize_template, resolve_template,
+    set_current_template)
+from proboot.utils.progress import report
+from proboot.utils.timing_history import record_cache
 
-def create_react_typescript_project(project_name):
+def ensure_template(template_version=None):
     """
-    Creates a new React TypeScript project using pnpm and Vite.
+    Returns a template snapshot, fetching it with `npm pack` if the store lacks it.
+
+    Args:
+        template_version (str, optional): The create-vite version to use.
+            Defaults to the store's current version.
+
+    Raises:
+        subprocess.CalledProcessError: If the template cannot be fetched.
+        ValueError: If the fetched package is not a create-vite package.
+
+    Returns:
+        tuple: (version, template_dir) as returned by `resolve_template`.
+    """
+    try:
+        template = resolve_template(template_version)
+        record_cache("template", True)
+        return template
+    except TemplateNotFoundError:
+        record_cache("template", False)
+        report(f"Fetching create-vite {template_version or 'latest'} template (one-time)")
+        version = fetch_template(template_version or "latest")
+        if template_version is None:
+            set_current_template(version)
+        return resolve_template(version)
+
+
+def create_react_typescript_project(project_name, project_dir=".", template_version=None):
+    """
+    Creates a new React TypeScript project from the create-vite template store.
+
+    The template is fetched once with `npm pack` if the store does not contain
+    it yet; afterwards projects are created from disk without network access.
 
     Args:
         project_name (str): The name of the new React TypeScript project.
+        project_dir (str, optional): Directory of the project. Defaults to the
+            current working directory.
+        template_version (str, optional): The create-vite version to use.
+            Defaults to the store's current version.
     """
-    subprocess.run(["pnpm", "create", "vite@latest", ".", "--template", "react-ts"], check=True)
-    print(f"React TypeScript project '{project_name}' has been created successfully.")
+    version, template_dir = ensure_template(template_version)
+    materialize_template(template_dir, project_name, project_dir)
+    report(f"React TypeScript project '{project_name}' has been created from create-vite {version}.")
@@ -0,0 +1,225 @@
+"""
+React TypeScript Template Store
+
+This module keeps pinned snapshots of the `create-vite` react-ts template in
+the user cache directory, so React TypeScript projects can be created without
+network access and without spawning `pnpm create vite`.
+
+A snapshot is imported once from a `create-vite` package tarball, either
+fetched with `npm pack` or supplied by the user (for air-gapped hosts), and is
+then materialized directly from disk. Snapshots live under
+`<cache>/templates/create-vite/<version>/`; the `current` file in the store
+records the version used when none is requested explicitly.
+
+Functions:
+- fetch_template: Fetch or import a create-vite version into the store
+- refresh_template: Fetch or import a create-vite version and make it current
+- import_template_tarball: Import a create-vite package tarball into the store
+- set_current_template: Record the version used when none is requested
+- resolve_template: Return the snapshot directory for a template version
+- materialize_template: Copy a snapshot into a new project directory
+"""
+
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import uuid
+
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.command_runner import run_command
+from proboot.utils.file_cloner import clone_file
+from proboot.utils.npm_package import to_valid_package_name
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+
+TEMPLATE_NAME = "template-react-ts"
+CURRENT_FILE = "current"
+# create-vite ships these files under different names so npm does not drop them.
+RENAMED_FILES = {"_gitignore": ".gitignore"}
+
+
+class TemplateNotFoundError(Exception):
+    """Raised when a requested template version is not in the store."""
+
+
+def _store_dir():
+    return get_cache_dir("templates", "create-vite")
+
+
+def set_current_template(version):
+    """
+    Records the template version used when none is requested explicitly.
+
+    Args:
+        version (str): A create-vite version present in the store.
+
+    Returns:
+        None
+    """
+    with open(os.path.join(_store_dir(), CURRENT_FILE), "w", encoding="utf-8") as f:
+        f.write(version)
+
+
+def import_template_tarball(tarball_path):
+    """
+    Imports the react-ts template from a create-vite package tarball.
+
+    Args:
+        tarball_path (str): Path to a `create-vite-<version>.tgz` package tarball.
+
+    Raises:
+        ValueError: If the tarball is not a create-vite package or lacks the template.
+
+    Returns:
+        str: The imported create-vite version.
+    """
+    store_dir = _store_dir()
+    staging_dir = os.path.join(store_dir, f".import-{uuid.uuid4().hex}")
+    prefix = f"package/{TEMPLATE_NAME}/"
+    try:
+        with tarfile.open(tarball_path, "r:*") as archive:
+            try:
+                package_json = json.load(archive.extractfile("package/package.json"))
+            except (KeyError, json.JSONDecodeError) as e:
+                raise ValueError(f"{tarball_path} is not an npm package tarball") from e
+            if package_json.get("name") != "create-vite":
+                raise ValueError(f"{tarball_path} contains {package_json.get('name')}, not create-vite")
+            version = package_json["version"]
+
+            members = []
+            for member in archive.getmembers():
+                if not member.name.startswith(prefix) or not member.isfile():
+                    continue
+                relative = member.name[len(prefix):]
+                if os.path.isabs(relative) or ".." in relative.split("/"):
+                    raise ValueError(f"Unsafe path {member.name} in {tarball_path}")
+                member.name = relative
+                members.append(member)
+            if not members:
+                raise ValueError(f"{tarball_path} does not contain {TEMPLATE_NAME}")
+            archive.extractall(staging_dir, members=members)
+
+        version_dir = os.path.join(store_dir, version)
+        shutil.rmtree(version_dir, ignore_errors=True)
+        os.rename(staging_dir, version_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return version
+
+
+def fetch_template(version="latest", tarball_path=None):
+    """
+    Fetches or imports a create-vite template into the store.
+
+    Args:
+        version (str): The create-vite version or dist-tag to fetch with `npm pack`.
+        tarball_path (str, optional): Import this tarball instead of fetching.
+
+    Raises:
+        subprocess.CalledProcessError: If `npm pack` fails.
+        ValueError: If the tarball is not a valid create-vite package.
+
+    Returns:
+        str: The stored create-vite version.
+    """
+    if tarball_path is not None:
+        return import_template_tarball(tarball_path)
+    with tempfile.TemporaryDirectory() as download_dir:
+        run_command(
+            ["npm", "pack", f"create-vite@{version}", "--pack-destination", download_dir],
+            check=True,
+            quiet=True,
+        )
+        tarballs = [name for name in os.listdir(download_dir) if name.endswith(".tgz")]
+        if not tarballs:
+            raise ValueError("npm pack did not produce a tarball")
+        return import_template_tarball(os.path.join(download_dir, tarballs[0]))
+
+
+def refresh_template(version="latest", tarball_path=None):
+    """
+    Fetches or imports a create-vite template and makes it the current version.
+
+    Args:
+        version (str): The create-vite version or dist-tag to fetch with `npm pack`.
+        tarball_path (str, optional): Import this tarball instead of fetching.
+
+    Raises:
+        subprocess.CalledProcessError: If `npm pack` fails.
+        ValueError: If the tarball is not a valid create-vite package.
+
+    Returns:
+        str: The version now stored as current.
+    """
+    stored = fetch_template(version, tarball_path)
+    set_current_template(stored)
+    report(f"Stored create-vite {stored} react-ts template.")
+    return stored
+
+
+def resolve_template(version=None):
+    """
+    Returns the snapshot directory for a template version.
+
+    Args:
+        version (str, optional): The create-vite version. Defaults to the current version.
+
+    Raises:
+        TemplateNotFoundError: If the version is not in the store.
+
+    Returns:
+        tuple: A tuple containing the resolved version and its snapshot directory.
+    """
+    store_dir = _store_dir()
+    if version is None:
+        try:
+            with open(os.path.join(store_dir, CURRENT_FILE), encoding="utf-8") as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            raise TemplateNotFoundError("No react-ts template has been stored yet.") from None
+    version_dir = os.path.join(store_dir, version)
+    if not os.path.isdir(version_dir):
+        raise TemplateNotFoundError(f"create-vite {version} is not in the template store.")
+    return version, version_dir
+
+
+def materialize_template(template_dir, project_name, project_dir):
+    """
+    Copies a template snapshot into a project directory.
+
+    Files are reflinked where the filesystem supports it and copied otherwise,
+    so the project never shares data blocks with the store that later edits
+    could corrupt. `package.json` is given the project's package name.
+
+    Args:
+        template_dir (str): A snapshot directory as returned by `resolve_template`.
+        project_name (str): The name of the new project.
+        project_dir (str): The existing project directory.
+
+    Returns:
+        None
+    """
+    with span("materialize template", "io") as materialize_span:
+        bytes_written = 0
+        for root, _, files in os.walk(template_dir):
+            relative_root = os.path.relpath(root, template_dir)
+            dest_root = os.path.normpath(os.path.join(project_dir, relative_root))
+            os.makedirs(dest_root, exist_ok=True)
+            for name in files:
+                src = os.path.join(root, name)
+                dst = os.path.join(dest_root, RENAMED_FILES.get(name, name))
+                if relative_root == "." and name == "package.json":
+                    with open(src, encoding="utf-8") as f:
+                        package_json = json.load(f)
+                    package_json["name"] = to_valid_package_name(project_name)
+                    with open(dst, "w", encoding="utf-8") as f:
+                        bytes_written += f.write(json.dumps(package_json, indent=2) + "\n")
+                else:
+                    if os.path.lexists(dst):
+                        # Left behind by an interrupted bootstrap that is being resumed.
+                        os.unlink(dst)
+                    clone_file(src, dst, allow_hardlink=False)
+                    bytes_written += os.path.getsize(dst)
+        materialize_span.set(bytes_written=bytes_written)
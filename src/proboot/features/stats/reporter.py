@@ -0,0 +1,146 @@
+"""
+Timing Statistics
+
+This module implements `proboot stats`, which summarizes the local timing
+history (see `proboot.utils.timing_history`) over a time window.
+
+For every project type it reports the p50, p95 and p99 of the total bootstrap
+time and of each step, and for every cache the number of hits and misses with
+the median total time of the bootstraps that hit and that missed. The
+difference between the two medians is what a miss of that cache costs.
+
+Percentiles use the nearest-rank method, so they are always observed values.
+
+Functions:
+- parse_window: Parse a time window such as "7d" into seconds
+- percentile: Return the nearest-rank percentile of sorted values
+- summarize: Aggregate history records per project type, step and cache
+- print_report: Print a summary as tables
+"""
+import math
+import re
+
+WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+PERCENTILES = (50, 95, 99)
+TOTAL_STEP = "(total)"
+
+
+def parse_window(window):
+    """
+    Parses a time window such as "90m", "12h", "7d" or "2w" into seconds.
+
+    Args:
+        window (str): A positive number followed by s, m, h, d or w, or "all".
+
+    Raises:
+        ValueError: If the window is malformed.
+
+    Returns:
+        float or None: The window in seconds; None for "all".
+    """
+    if window == "all":
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhdw])", window.strip())
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid time window {window}; expected e.g. 30m, 12h, 7d, 2w or all.")
+    return float(match.group(1)) * WINDOW_UNITS[match.group(2)]
+
+
+def percentile(values, q):
+    """
+    Returns the nearest-rank percentile of sorted values.
+
+    Args:
+        values (list[float]): The values, sorted ascending; not empty.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The smallest value such that at least q percent of the values
+        are less than or equal to it.
+    """
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def summarize(records):
+    """
+    Aggregates history records per project type, step and cache.
+
+    Step times include only the steps that completed; total times include
+    only successful bootstraps.
+
+    Args:
+        records (list[dict]): Records as returned by `read_history`.
+
+    Returns:
+        dict: {project type: {"count": int, "failed": int,
+        "steps": {step: sorted durations}, "cache": {cache: {"hit": sorted
+        totals, "miss": sorted totals}}}}, with the total time under the step
+        name "(total)".
+    """
+    summary = {}
+    for record in records:
+        entry = summary.setdefault(record.get("type", "?"),
+                                   {"count": 0, "failed": 0, "steps": {}, "cache": {}})
+        entry["count"] += 1
+        ok = record.get("ok") and record.get("total") is not None
+        if not ok:
+            entry["failed"] += 1
+        else:
+            entry["steps"].setdefault(TOTAL_STEP, []).append(record["total"])
+        for step, seconds in record.get("steps", {}).items():
+            entry["steps"].setdefault(step, []).append(seconds)
+        for cache, outcome in record.get("cache", {}).items():
+            outcomes = entry["cache"].setdefault(cache, {"hit": [], "miss": []})
+            if outcome in outcomes and ok:
+                outcomes[outcome].append(record["total"])
+    for entry in summary.values():
+        for durations in entry["steps"].values():
+            durations.sort()
+        for outcomes in entry["cache"].values():
+            for totals in outcomes.values():
+                totals.sort()
+    return summary
+
+
+def _seconds(value):
+    return f"{value:.3f}s" if value is not None else "-"
+
+
+def print_report(summary, window_label):
+    """
+    Prints a summary as one table of step percentiles and one of cache outcomes.
+
+    Args:
+        summary (dict): A summary as returned by `summarize`.
+        window_label (str): Description of the time window, e.g. "last 7d".
+
+    Returns:
+        None
+    """
+    count = sum(entry["count"] for entry in summary.values())
+    failed = sum(entry["failed"] for entry in summary.values())
+    print(f"{count} bootstraps ({failed} failed), {window_label}")
+    if not summary:
+        return
+
+    print(f"\n{'Type':<18} {'Step':<28} {'Count':>6} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for project_type in sorted(summary):
+        steps = summary[project_type]["steps"]
+        names = sorted(steps, key=lambda name: (name != TOTAL_STEP, -percentile(steps[name], 50)))
+        for name in names:
+            durations = steps[name]
+            values = " ".join(f"{_seconds(percentile(durations, q)):>9}" for q in PERCENTILES)
+            print(f"{project_type[:18]:<18} {name[:28]:<28} {len(durations):>6} {values}")
+
+    if not any(entry["cache"] for entry in summary.values()):
+        return
+    print(f"\n{'Type':<18} {'Cache':<12} {'Hits':>6} {'Misses':>6} {'p50 hit':>9} {'p50 miss':>9}")
+    for project_type in sorted(summary):
+        for cache, outcomes in sorted(summary[project_type]["cache"].items()):
+            hit, miss = outcomes["hit"], outcomes["miss"]
+            print(
+                f"{project_type[:18]:<18} {cache[:12]:<12} {len(hit):>6} {len(miss):>6} "
+                f"{_seconds(percentile(hit, 50) if hit else None):>9} "
+                f"{_seconds(percentile(miss, 50) if miss else None):>9}"
+            )
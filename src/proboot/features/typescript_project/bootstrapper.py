@@ -6,27 +6,42 @@ including necessary files, directories, and optionally initializing a Git reposi
 
 The main function `bootstrap_typescript_project` orchestrates the creation of:
 - Project directory
-- Standalone TypeScript project setup
-- Installation of dependencies
+- Standalone TypeScript project setup, with package.json and tsconfig.json
+  generated natively
+- Installation of dependencies (one resolved install plan)
 - Git repository (optional)
 
+Completed steps are journaled, so a failed bootstrap can be resumed without
+redoing them. A generated project is stored in the snapshot cache; later bootstraps with the
+same options restore it instead of running npm and the install.
+
+The steps are declared as a dependency graph; the git repository is created
+while the project is set up and dependencies are installed.
+
 Functions:
 - bootstrap_typescript_project: Main function to create a new standalone TypeScript project
 """
 
 import os
-import subprocess
 
+from proboot import __version__
 from proboot.features.typescript_project.dependency_installer import (
     install_dependencies,
 )
-from proboot.features.typescript_project.project_creator import (
-    create_typescript_project,
-)
+from proboot.features.typescript_project.config_generator import compiler_options
+from proboot.features.typescript_project.project_creator import create_typescript_project
 from proboot.utils.directory_handler import create_project_directory
+from proboot.utils.git_writer import collect_files, init_repository, write_initial_commit
+from proboot.utils.npm_package import set_package_name
+from proboot.utils.progress import report
+from proboot.utils.snapshot_cache import (find_snapshot, restore_snapshot, snapshot_cache_enabled,
+                                          snapshot_key, store_snapshot)
+from proboot.utils.step_graph import Step, run_steps
+from proboot.utils.step_journal import JOURNAL_DIR, StepJournal
 
 
-def bootstrap_typescript_project(project_name, init_git):
+def bootstrap_typescript_project(project_name, init_git, parent_dir=None, package_manager="pnpm",
+                                 resume=False, target=None, module=None, strict=None):
     """
     Bootstraps a new standalone TypeScript project by creating the necessary files and directories,
     setting up the project, and optionally initializing a Git repository.
@@ -34,22 +49,85 @@ def bootstrap_typescript_project(project_name, init_git):
     Args:
         project_name (str): The name of the new TypeScript project.
         init_git (bool): Whether to initialize a Git repository for the new project.
+        parent_dir (str, optional): Directory in which the project is created.
+            Defaults to the current working directory.
+        resume (bool, optional): Continue a failed bootstrap of the project,
+            re-running only the steps that did not complete.
+        package_manager (str, optional): Package manager used for the single
+            dependency install, "pnpm" (default) or "npm".
+        target (str, optional): The tsconfig.json compiler target. Defaults to es2016.
+        module (str, optional): The tsconfig.json module system. Defaults to commonjs.
+        strict (bool, optional): Enable strict type checking. Defaults to True.
+
+    Raises:
+        ValueError: If the target or module is not one tsc accepts, or if
+            resuming a project directory without a bootstrap journal.
 
     Returns:
         None
     """
-    create_project_directory(project_name)
-    os.chdir(project_name)
-    create_typescript_project(project_name)
-    install_dependencies()
+    options = compiler_options(target, module, strict)
+    project_dir = os.path.join(parent_dir, project_name) if parent_dir else project_name
+    journal = StepJournal.open(project_dir, resume)
+    use_snapshots = snapshot_cache_enabled()
+    key = snapshot_key("typescript", __version__, package_manager, options)
+    # A resumed project keeps its partial files, so it is never restored over.
+    snapshot = find_snapshot(key) if use_snapshots and not resume else None
+
+    restored = []
+
+    def create_project():
+        create_typescript_project(project_name, project_dir, target, module, strict)
+
+    def restore_project():
+        if restore_snapshot(snapshot, project_dir):
+            set_package_name(project_dir, project_name)
+            restored.append(key)
+            report(f"Restored TypeScript project {project_name} from the snapshot cache")
+            return
+        report("The snapshot cache entry is incomplete, creating the project instead")
+        create_project()
+        install_dependencies(project_dir, package_manager)
+
+    steps = [Step("directory", lambda: create_project_directory(project_dir, exist_ok=resume))]
+    if snapshot:
+        steps.append(Step("project", restore_project, ("directory",), ["snapshot", key]))
+        last_step = "project"
+    else:
+        steps += [
+            Step("project", create_project, ("directory",), ["create", project_name, options]),
+            Step(
+                "dependencies",
+                lambda: install_dependencies(project_dir, package_manager),
+                ("project",),
+                package_manager,
+            ),
+        ]
+        last_step = "dependencies"
     if init_git:
-        subprocess.run(["git", "init", "--initial-branch=main"], check=True)
-        subprocess.run(["git", "add", "."], check=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
+        # The repository is created while the project is set up; the initial
+        # commit waits for the install so it includes the lockfile.
+        steps.append(Step("git_init", lambda: init_repository(project_dir), ("directory",)))
+        steps.append(
+            Step(
+                "git_commit",
+                lambda: write_initial_commit(
+                    project_dir, collect_files(project_dir, ignored_dirs=("node_modules", JOURNAL_DIR))
+                ),
+                ("git_init", last_step),
+            )
+        )
+    run_steps(steps, journal=journal)
+    journal.discard()
+    if use_snapshots and not restored:
+        try:
+            store_snapshot(key, project_dir)
+        except OSError as e:
+            report(f"Snapshot cache unavailable ({e}), project not stored")
 
-    print(
+    report(
         f"Standalone TypeScript project '{project_name}' has been created successfully."
     )
-    print("To build the project, run:")
-    print(f"cd {project_name}")
-    print("npm run build")
+    report("To build the project, run:")
+    report(f"cd {project_dir}")
+    report(f"{package_manager} run build")
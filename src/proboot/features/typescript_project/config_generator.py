@@ -0,0 +1,106 @@
+"""
+Generate the package.json and tsconfig.json of a TypeScript project
+
+These files used to come from `npm init -y` and `npx tsc --init`, which start
+Node, and for npx resolve the TypeScript package, only to write two small JSON
+files. They are rendered here instead, with the same content those commands
+produce, so a project's files exist before Node is needed to install its
+dependencies.
+
+Functions:
+- render_package_json: Render the package.json `npm init -y` would write
+- compiler_options: Build the compiler options of tsconfig.json
+- render_tsconfig: Render the tsconfig.json `tsc --init` would write
+"""
+import json
+
+from proboot.utils.npm_package import to_valid_package_name
+
+# Values accepted for --target and --module, as tsc spells them.
+TS_TARGETS = (
+    "es5", "es6", "es2015", "es2016", "es2017", "es2018", "es2019", "es2020", "es2021", "es2022",
+    "es2023", "es2024", "esnext",
+)
+TS_MODULES = (
+    "none", "commonjs", "amd", "umd", "system", "es6", "es2015", "es2020", "es2022", "esnext",
+    "node16", "node18", "nodenext", "preserve",
+)
+
+# The options `tsc --init` enables; the rest of its output is commented out.
+DEFAULT_TARGET = "es2016"
+DEFAULT_MODULE = "commonjs"
+
+
+def render_package_json(project_name, scripts=None):
+    """
+    Renders the package.json that `npm init -y` writes for a project.
+
+    Args:
+        project_name (str): The name of the project; converted with `to_valid_package_name`.
+        scripts (dict, optional): Scripts added to npm's default test script.
+
+    Returns:
+        str: The package.json content.
+    """
+    package_json = {
+        "name": to_valid_package_name(project_name),
+        "version": "1.0.0",
+        "main": "index.js",
+        "scripts": {"test": 'echo "Error: no test specified" && exit 1', **(scripts or {})},
+        "keywords": [],
+        "author": "",
+        "license": "ISC",
+        "description": "",
+    }
+    return json.dumps(package_json, indent=2) + "\n"
+
+
+def compiler_options(target=None, module=None, strict=None):
+    """
+    Builds the compiler options of tsconfig.json.
+
+    Args:
+        target (str, optional): The ECMAScript target. Defaults to es2016, as with `tsc --init`.
+        module (str, optional): The module system. Defaults to commonjs.
+        strict (bool, optional): Enable all strict type checks. Defaults to True.
+
+    Raises:
+        ValueError: If the target or module is not one tsc accepts.
+
+    Returns:
+        dict: The compiler options.
+    """
+    target = (target or DEFAULT_TARGET).lower()
+    module = (module or DEFAULT_MODULE).lower()
+    if target not in TS_TARGETS:
+        raise ValueError(f"Unsupported TypeScript target {target}; expected one of "
+                         f"{', '.join(TS_TARGETS)}.")
+    if module not in TS_MODULES:
+        raise ValueError(f"Unsupported TypeScript module {module}; expected one of "
+                         f"{', '.join(TS_MODULES)}.")
+    return {
+        "target": target,
+        "module": module,
+        "esModuleInterop": True,
+        "forceConsistentCasingInFileNames": True,
+        "strict": True if strict is None else bool(strict),
+        "skipLibCheck": True,
+    }
+
+
+def render_tsconfig(target=None, module=None, strict=None):
+    """
+    Renders the tsconfig.json that `tsc --init` writes, without its comments.
+
+    Args:
+        target (str, optional): The ECMAScript target, see `compiler_options`.
+        module (str, optional): The module system.
+        strict (bool, optional): Enable all strict type checks.
+
+    Raises:
+        ValueError: If the target or module is not one tsc accepts.
+
+    Returns:
+        str: The tsconfig.json content.
+    """
+    return json.dumps({"compilerOptions": compiler_options(target, module, strict)}, indent=2) + "\n"
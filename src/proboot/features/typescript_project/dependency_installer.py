@@ -2,19 +2,34 @@
 Install dependencies for a standalone TypeScript project
 
 This module provides functionality to install necessary dependencies
-for a standalone TypeScript project.
+for a standalone TypeScript project. The packages required by every
+TypeScript bootstrap step are merged into one install plan and installed
+with a single package manager command.
 
 Functions:
 - install_dependencies: Install TypeScript and other necessary dependencies
 """
-import subprocess
+from proboot.features.typescript_project.install_plan import (build_install_plan,
+                                                              execute_install_plan)
+from proboot.features.typescript_project.project_creator import REQUIREMENTS as PROJECT_REQUIREMENTS
+from proboot.utils.progress import report
 
-def install_dependencies():
+REQUIREMENTS = {"devDependencies": ["typescript", "@types/node"]}
+
+
+def install_dependencies(project_dir=".", package_manager="pnpm"):
     """
     Install TypeScript and other necessary dependencies for the project.
 
+    Args:
+        project_dir (str, optional): Directory of the project. Defaults to the
+            current working directory.
+        package_manager (str, optional): "pnpm" (default) or "npm".
+
     Returns:
         None
     """
-    subprocess.run(["pnpm", "install", "--save-dev", "typescript", "@types/node"], check=True)
-    print("Installed TypeScript and dependencies.")
+    plan = build_install_plan(PROJECT_REQUIREMENTS, REQUIREMENTS)
+    cache_hit = execute_install_plan(plan, project_dir, package_manager)
+    source = "cached lockfile" if cache_hit else "fresh resolution"
+    report(f"Installed TypeScript and dependencies with {package_manager} ({source}).")
@@ -0,0 +1,168 @@
+"""
+Resolve and run a single dependency install for a standalone TypeScript project
+
+Each step of the TypeScript bootstrap declares the packages it needs. This
+module merges those requirements into one install plan and runs it with a
+single package manager command, instead of installing TypeScript once with
+npm and again with pnpm.
+
+The resolved lockfile and version specifiers are cached, keyed by the package
+manager and the planned dependency set. On a cache hit the plan is installed
+frozen and offline-first against the package manager's store, skipping
+resolution entirely; if that fails the cache entry is discarded and the
+dependencies are resolved from scratch.
+
+In a pnpm workspace the plan is installed at the workspace root, and the same
+single command installs the dependencies of every workspace package; their
+package.json dependency sections become part of the cache key.
+
+Functions:
+- build_install_plan: Merge the dependency requirements of several steps
+- execute_install_plan: Install a plan with the chosen package manager
+"""
+import json
+import os
+import subprocess
+
+from proboot.utils.command_runner import run_command
+from proboot.utils.lockfile_cache import (discard_cached_lockfile, load_cached_lockfile,
+                                          lockfile_cache_key, store_cached_lockfile)
+from proboot.utils.progress import report
+from proboot.utils.timing_history import record_cache
+
+PACKAGE_MANAGERS = {
+    "pnpm": {
+        "lockfile": "pnpm-lock.yaml",
+        "add": ["pnpm", "add"],
+        "dev_flag": "--save-dev",
+        "install": ["pnpm", "install"],
+        "workspace_flag": "--workspace-root",
+        "frozen": ["pnpm", "install", "--frozen-lockfile", "--prefer-offline"],
+    },
+    "npm": {
+        "lockfile": "package-lock.json",
+        "add": ["npm", "install"],
+        "dev_flag": "--save-dev",
+        "install": ["npm", "install"],
+        "workspace_flag": None,
+        "frozen": ["npm", "ci", "--prefer-offline"],
+    },
+}
+DEPENDENCY_KINDS = ("dependencies", "devDependencies")
+SPECS_FILE = "specs.json"
+
+
+def build_install_plan(*requirements):
+    """
+    Merges the dependency requirements of several bootstrap steps.
+
+    Args:
+        *requirements (dict): Mappings of "dependencies" and/or "devDependencies"
+            to lists of package names.
+
+    Returns:
+        dict: Sorted, de-duplicated package names per dependency kind. A package
+        required both at runtime and for development is installed at runtime only.
+    """
+    plan = {kind: set() for kind in DEPENDENCY_KINDS}
+    for requirement in requirements:
+        for kind in DEPENDENCY_KINDS:
+            plan[kind].update(requirement.get(kind, ()))
+    plan["devDependencies"] -= plan["dependencies"]
+    return {kind: sorted(packages) for kind, packages in plan.items()}
+
+
+def _update_package_json(project_dir, specs):
+    path = os.path.join(project_dir, "package.json")
+    with open(path, encoding="utf-8") as f:
+        package_json = json.load(f)
+    for kind, packages in specs.items():
+        if packages:
+            package_json.setdefault(kind, {}).update(packages)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(package_json, f, indent=2)
+        f.write("\n")
+
+
+def _resolved_specs(project_dir, plan):
+    with open(os.path.join(project_dir, "package.json"), encoding="utf-8") as f:
+        package_json = json.load(f)
+    return {
+        kind: {name: package_json.get(kind, {})[name] for name in plan[kind]}
+        for kind in DEPENDENCY_KINDS
+    }
+
+
+def _workspace_dependencies(package_dirs):
+    dependencies = {}
+    for package_dir in package_dirs:
+        with open(os.path.join(package_dir, "package.json"), encoding="utf-8") as f:
+            package_json = json.load(f)
+        dependencies[os.path.basename(package_dir)] = {
+            kind: package_json.get(kind, {}) for kind in DEPENDENCY_KINDS
+        }
+    return dependencies
+
+
+def execute_install_plan(plan, project_dir, package_manager="pnpm", workspace_packages=None):
+    """
+    Installs every package of a plan with one package manager.
+
+    Args:
+        plan (dict): A plan as returned by `build_install_plan`.
+        project_dir (str): Directory of the project containing package.json.
+        package_manager (str): "pnpm" or "npm".
+        workspace_packages (list[str], optional): Package directories of the
+            workspace rooted at project_dir. The plan is then added to the
+            workspace root and the packages are installed along with it.
+
+    Raises:
+        ValueError: If the package manager is not supported, or does not
+            support workspaces and workspace_packages is given.
+        subprocess.CalledProcessError: If the install fails.
+
+    Returns:
+        bool: True if the install used a cached lockfile.
+    """
+    if package_manager not in PACKAGE_MANAGERS:
+        raise ValueError(f"Unsupported package manager: {package_manager}")
+    manager = PACKAGE_MANAGERS[package_manager]
+    add_command = manager["add"]
+    key_parts = [package_manager, json.dumps(plan, sort_keys=True)]
+    if workspace_packages is not None:
+        if not manager["workspace_flag"]:
+            raise ValueError(f"{package_manager} workspaces are not supported; use pnpm.")
+        add_command = add_command + [manager["workspace_flag"]]
+        key_parts.append(json.dumps(_workspace_dependencies(workspace_packages), sort_keys=True))
+    lockfile_path = os.path.join(project_dir, manager["lockfile"])
+    key = lockfile_cache_key(*key_parts)
+
+    cached = load_cached_lockfile(key)
+    if cached and SPECS_FILE in cached and manager["lockfile"] in cached:
+        _update_package_json(project_dir, json.loads(cached[SPECS_FILE]))
+        with open(lockfile_path, "wb") as f:
+            f.write(cached[manager["lockfile"]])
+        try:
+            run_command(manager["frozen"], cwd=project_dir)
+            record_cache("lockfile", True)
+            return True
+        except subprocess.CalledProcessError:
+            report("Cached lockfile is stale, resolving dependencies again.")
+            discard_cached_lockfile(key)
+            os.remove(lockfile_path)
+
+    for kind in DEPENDENCY_KINDS:
+        if plan[kind]:
+            flags = [manager["dev_flag"]] if kind == "devDependencies" else []
+            run_command(add_command + flags + plan[kind], cwd=project_dir)
+    if not any(plan.values()):
+        # Nothing to add; resolve the dependencies already declared.
+        run_command(manager["install"], cwd=project_dir)
+
+    if os.path.exists(lockfile_path):
+        with open(lockfile_path, "rb") as f:
+            lockfile = f.read()
+        specs = json.dumps(_resolved_specs(project_dir, plan)).encode("utf-8")
+        store_cached_lockfile(key, {manager["lockfile"]: lockfile, SPECS_FILE: specs})
+    record_cache("lockfile", False)
+    return False
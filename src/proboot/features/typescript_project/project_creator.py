@@ -7,43 +7,42 @@ for a new standalone TypeScript project.
 Functions:
 - create_typescript_project: Set up the basic structure and files for a TypeScript project
 """
-import os
-import json
-import subprocess
+from proboot.features.typescript_project.config_generator import (render_package_json,
+                                                                  render_tsconfig)
+from proboot.utils.progress import report
+from proboot.utils.project_tree import ProjectTree
 
-def create_typescript_project(project_name):
+# Packages the project files rely on; installed by the dependency installer's plan.
+REQUIREMENTS = {"devDependencies": ["typescript"]}
+
+
+def create_typescript_project(project_name, project_dir=".", target=None, module=None, strict=None):
     """
     Set up the basic structure and files for a standalone TypeScript project.
 
+    package.json and tsconfig.json are generated without running npm or tsc.
+    TypeScript itself is not installed here; it is part of the single install
+    plan run by the dependency installer.
+
     Args:
         project_name (str): The name of the new TypeScript project.
+        project_dir (str, optional): Directory of the project. Defaults to the
+            current working directory.
+        target (str, optional): The compiler target. Defaults to es2016.
+        module (str, optional): The compiler module system. Defaults to commonjs.
+        strict (bool, optional): Enable strict type checking. Defaults to True.
+
+    Raises:
+        ValueError: If the target or module is not one tsc accepts.
 
     Returns:
         None
     """
-    # Initialize npm project
-    subprocess.run(["npm", "init", "-y"], check=True)
-
-    # Create src directory
-    os.makedirs("src", exist_ok=True)
-
-    # Create a simple TypeScript file
-    with open("src/index.ts", "w") as f:
-        f.write('console.log("Hello, TypeScript!");')
-
-    # Install TypeScript
-    subprocess.run(["npm", "install", "typescript"], check=True)
-
-    # Create tsconfig.json
-    subprocess.run(["npx", "tsc", "--init"], check=True)
-
-    # Update package.json with build script
-    with open("package.json", "r+") as f:
-        package_json = json.load(f)
-        package_json["scripts"] = package_json.get("scripts", {})
-        package_json["scripts"]["build"] = "tsc"
-        f.seek(0)
-        json.dump(package_json, f, indent=2)
-        f.truncate()
-
-    print(f"Created TypeScript project structure for {project_name}")
+    tree = ProjectTree()
+    tree.add_file("package.json", render_package_json(project_name, {"build": "tsc"}))
+    tree.add_file("tsconfig.json", render_tsconfig(target, module, strict))
+    tree.add_file("src/index.ts", 'console.log("Hello, TypeScript!");')
+    tree.add_file(".gitignore", "node_modules/\ndist/\n")
+    tree.write(project_dir)
+
+    report(f"Created TypeScript project structure for {project_name}")
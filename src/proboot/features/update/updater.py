@@ -0,0 +1,285 @@
+"""
+Project Updater
+
+This module implements `proboot update`, which rolls template changes out to
+projects proboot generated earlier without regenerating them.
+
+For every file the current templates produce, the rendered content is
+compared by hash with the file on disk and with the project's template
+baseline (see `proboot.utils.template_baseline`):
+
+- Template unchanged since the baseline: the file is left alone.
+- File untouched by the user, or new in the templates: the new content is written.
+- File edited by the user: the template change is three-way merged into it.
+  If the merge conflicts, the file is left alone and the merge result, with
+  conflict markers, is written next to it as `<file>.proboot-conflict`.
+- File deleted by the user: it stays deleted.
+
+Files the templates no longer produce are removed if the user never edited
+them. Only changed files are written, and the baseline is then advanced to
+the templates that were applied. Projects without a baseline (created before
+proboot stored one) are adopted: matching files are recorded, missing ones
+are added, and differing ones are reported as diverged with the template
+version written to `<file>.proboot-new`.
+
+Many projects are updated concurrently on a thread pool; the work is small
+file I/O and the occasional `git merge-file`.
+
+Functions:
+- update_project: Apply the current templates to one project
+- update_projects: Update many projects concurrently and collect the results
+- print_report: Print a per-project summary of an update run
+"""
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from proboot import __version__
+from proboot.utils.template_baseline import (baseline_entry, content_hash, entry_content,
+                                             load_baseline, write_baseline)
+from proboot.utils.three_way_merge import merge_three_way
+
+CONFLICT_SUFFIX = ".proboot-conflict"
+NEW_SUFFIX = ".proboot-new"
+# Actions that need the user's attention, with the file written next to theirs.
+CONFLICT_ACTIONS = {"conflict": CONFLICT_SUFFIX, "diverged": NEW_SUFFIX}
+
+
+def _render(project_type, project_name, options):
+    """
+    Renders the current templates of a project type with the options the
+    project was created with.
+
+    Raises:
+        ValueError: If the project type has no renderable templates.
+
+    Returns:
+        ProjectTree: The rendered project files.
+    """
+    # pylint: disable=import-outside-toplevel
+    if project_type == "python":
+        from proboot.features.python_project.file_creator import build_project_tree
+
+        return build_project_tree(project_name, options.get("dependencies", ()))
+    raise ValueError(f"Project type {project_type} cannot be updated.")
+
+
+def _detect_project(project_dir):
+    """
+    Guesses the type and name of a project that has no baseline.
+
+    Raises:
+        ValueError: If the directory does not look like a proboot project.
+
+    Returns:
+        tuple: The project type and name.
+    """
+    if any(os.path.isfile(os.path.join(project_dir, name)) for name in ("pyproject.toml", "setup.py")):
+        return "python", os.path.basename(os.path.abspath(project_dir))
+    raise ValueError(f"{project_dir} has no proboot baseline and is not a Python project.")
+
+
+def _read(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write(path, content, mode):
+    """
+    Replaces a file atomically, keeping the permissions of an existing file.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.chmod(temp_path, mode)
+    os.replace(temp_path, path)
+
+
+def _apply_file(project_dir, path, new, mode, base_entry, dry_run):
+    """
+    Applies the rendered content of one file.
+
+    Returns:
+        tuple: The action taken (or None if nothing changed) and whether the
+        baseline may advance to the rendered content.
+    """
+    full_path = os.path.join(project_dir, path)
+    current = _read(full_path)
+    new_hash = content_hash(new)
+    if base_entry is not None and base_entry["sha256"] == new_hash:
+        return None, True
+    if current is None:
+        if base_entry is not None:
+            return "kept deleted", True
+        if not dry_run:
+            _write(full_path, new, mode)
+        return "added", True
+    current_hash = content_hash(current)
+    if current_hash == new_hash:
+        return None, True
+    if base_entry is None:
+        if not dry_run:
+            _write(full_path + NEW_SUFFIX, new, mode)
+        return "diverged", False
+    if current_hash == base_entry["sha256"]:
+        if not dry_run:
+            _write(full_path, new, mode)
+        return "updated", True
+    merged, conflicts = merge_three_way(
+        current, entry_content(base_entry), new,
+        labels=(f"{path} (local)", f"{path} (baseline)", f"{path} (proboot {__version__})"),
+    )
+    if conflicts:
+        if not dry_run:
+            _write(full_path + CONFLICT_SUFFIX, merged, mode)
+        return "conflict", False
+    if not dry_run:
+        _write(full_path, merged, mode)
+    return "merged", True
+
+
+def update_project(project_dir, dry_run=False):
+    """
+    Apply the current templates to one project.
+
+    Args:
+        project_dir (str): The project directory.
+        dry_run (bool, optional): Report what would change without writing anything.
+
+    Raises:
+        ValueError: If the project cannot be updated.
+        OSError: If a file cannot be read or written.
+        subprocess.CalledProcessError: If a merge fails to run.
+
+    Returns:
+        list[tuple]: (path, action) for every file that changed or conflicted,
+        where action is "added", "updated", "merged", "removed",
+        "kept deleted", "conflict" (merge conflict) or "diverged" (edited
+        file in a project without a baseline).
+    """
+    if not os.path.isdir(project_dir):
+        raise ValueError(f"{project_dir} is not a directory.")
+    baseline = load_baseline(project_dir)
+    if baseline is not None:
+        project_type, project_name = baseline.get("type"), baseline.get("project_name")
+        options = baseline.get("options", {})
+        base_files = baseline["files"]
+    else:
+        project_type, project_name = _detect_project(project_dir)
+        options = {}
+        base_files = {}
+    tree = _render(project_type, project_name, options)
+
+    changes = []
+    new_files = {}
+    for path, content, mode in tree:
+        action, advance = _apply_file(project_dir, path, content, mode, base_files.get(path), dry_run)
+        if action:
+            changes.append((path, action))
+        if advance:
+            new_files[path] = baseline_entry(content)
+        elif path in base_files:
+            new_files[path] = base_files[path]
+    for path in sorted(set(base_files) - set(new_files)):
+        full_path = os.path.join(project_dir, path)
+        current = _read(full_path)
+        if current is not None and content_hash(current) == base_files[path]["sha256"]:
+            if not dry_run:
+                os.unlink(full_path)
+            changes.append((path, "removed"))
+
+    if not dry_run and (new_files != base_files or baseline is None
+                        or baseline.get("version") != __version__):
+        write_baseline(project_dir, project_type, project_name, new_files, options)
+    return changes
+
+
+def _update_job(project_dir, dry_run):
+    """
+    Update a single project, capturing failures in the result.
+
+    Returns:
+        dict: The project, success flag, error message, changes and elapsed seconds.
+    """
+    start = time.perf_counter()
+    changes = []
+    error = None
+    try:
+        changes = update_project(project_dir, dry_run)
+    except Exception as e:  # pylint: disable=broad-except
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "project": project_dir,
+        "ok": error is None,
+        "error": error,
+        "changes": changes,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def update_projects(project_dirs, max_workers=None, dry_run=False):
+    """
+    Update many projects concurrently and collect the results.
+
+    Args:
+        project_dirs (list[str]): The project directories.
+        max_workers (int, optional): Number of projects updated at once.
+            Defaults to the executor's default.
+        dry_run (bool, optional): Report what would change without writing anything.
+
+    Returns:
+        tuple: A tuple containing:
+            - results (list[dict]): Per-project results in input order.
+            - elapsed (float): Total wall time in seconds.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda project_dir: _update_job(project_dir, dry_run),
+                                    project_dirs))
+    return results, time.perf_counter() - start
+
+
+def print_report(results, elapsed):
+    """
+    Print a per-project summary of an update run.
+
+    Args:
+        results (list[dict]): Results as returned by `update_projects`.
+        elapsed (float): Total wall time in seconds.
+
+    Returns:
+        None
+    """
+    print("\nUpdate summary:")
+    counts = {"updated": 0, "up to date": 0, "conflict": 0, "failed": 0}
+    for result in results:
+        if not result["ok"]:
+            status = "failed"
+        elif any(action in CONFLICT_ACTIONS for _, action in result["changes"]):
+            status = "conflict"
+        elif result["changes"]:
+            status = "updated"
+        else:
+            status = "up to date"
+        counts[status] += 1
+        label = status.upper() if status in ("conflict", "failed") else status
+        line = f"  [{label}] {result['project']}"
+        if result["error"]:
+            line += f": {result['error']}"
+        print(line)
+        for path, action in result["changes"]:
+            line = f"      {action:<12} {path}"
+            if action in CONFLICT_ACTIONS:
+                line += f" (see {path}{CONFLICT_ACTIONS[action]})"
+            print(line)
+    print(f"{counts['updated']} updated, {counts['up to date']} up to date, "
+          f"{counts['conflict']} with conflicts, {counts['failed']} failed in {elapsed:.2f}s total")
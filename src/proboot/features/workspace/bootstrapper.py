@@ -0,0 +1,190 @@
+"""
+Bootstrap a workspace of related packages under one root
+
+Bootstrapping N packages separately creates N virtual environments and N
+`node_modules` trees. A workspace shares them instead:
+
+    <root>/
+        venv/                 shared by every Python package (editable installs)
+        package.json          private workspace root
+        pnpm-workspace.yaml   lists packages/*
+        pnpm-lock.yaml        one lockfile for every Node package
+        node_modules/
+        packages/<name>/      one directory per package
+
+Python packages are rendered from the same templates as standalone projects
+(including the template baseline, so `proboot update packages/<name>` works)
+and installed into the shared venv in editable mode. TypeScript and React
+packages form one pnpm workspace; the shared TypeScript toolchain is added to
+the workspace root, and a single install resolves and links the dependencies
+of every package through pnpm's content-addressable store. Disk usage and
+install time therefore grow with the number of unique dependencies rather
+than with the number of packages.
+
+The workspace gets one git repository. Completed steps are journaled, so a
+failed bootstrap can be resumed.
+
+Functions:
+- bootstrap_workspace: Bootstrap every package of a workspace
+"""
+import json
+import os
+import sys
+
+from proboot.features.python_project.file_creator import (build_project_tree, create_project_files,
+                                                          create_venv)
+from proboot.features.react_typescript_project.project_creator import \
+    create_react_typescript_project
+from proboot.features.typescript_project.dependency_installer import \
+    REQUIREMENTS as DEPENDENCY_REQUIREMENTS
+from proboot.features.typescript_project.install_plan import (build_install_plan,
+                                                              execute_install_plan)
+from proboot.features.typescript_project.project_creator import REQUIREMENTS as PROJECT_REQUIREMENTS
+from proboot.features.typescript_project.project_creator import create_typescript_project
+from proboot.features.workspace.editable_installer import install_editable
+from proboot.utils.directory_handler import create_project_directory
+from proboot.utils.git_writer import collect_files, init_repository, write_initial_commit
+from proboot.utils.npm_package import to_valid_package_name
+from proboot.utils.progress import report
+from proboot.utils.project_tree import ProjectTree
+from proboot.utils.step_graph import Step, run_steps
+from proboot.utils.step_journal import JOURNAL_DIR, JOURNAL_FILE, StepJournal
+from proboot.utils.template_baseline import add_baseline
+
+PACKAGES_DIR = "packages"
+NODE_TYPES = ("typescript", "react-typescript")
+
+
+def _root_tree(workspace):
+    """
+    Renders the files at the workspace root.
+
+    Returns:
+        ProjectTree: The root files.
+    """
+    tree = ProjectTree()
+    packages = workspace["packages"]
+    listing = "\n".join(f"- `{PACKAGES_DIR}/{p['name']}` ({p['type']})" for p in packages)
+    tree.add_file("README.md", f"""# {workspace['name']}
+
+This workspace was created using proboot.
+
+## Packages
+
+{listing}
+""")
+    tree.add_file(".gitignore", "venv/\nnode_modules/\ndist/\n__pycache__/\n*.py[cod]\n")
+    if any(p["type"] in NODE_TYPES for p in packages):
+        package_json = {
+            "name": to_valid_package_name(workspace["name"]),
+            "private": True,
+            "scripts": {"build": "pnpm -r run build"},
+        }
+        tree.add_file("package.json", json.dumps(package_json, indent=2) + "\n")
+        tree.add_file("pnpm-workspace.yaml", f'packages:\n  - "{PACKAGES_DIR}/*"\n')
+    return tree
+
+
+def _package_step(package, package_dir):
+    """
+    Returns the step that creates the files of one package.
+    """
+    name = package["name"]
+    step_name = f"package:{name}"
+    if package["type"] == "python":
+        tree = build_project_tree(name)
+        add_baseline(tree, "python", name)
+        return Step(step_name, lambda: create_project_files(name, package_dir, tree), ("directory",),
+                    tree.digest())
+
+    def create_package():
+        os.makedirs(package_dir, exist_ok=True)
+        if package["type"] == "typescript":
+            create_typescript_project(name, package_dir)
+        else:
+            create_react_typescript_project(name, package_dir, package["template_version"])
+
+    return Step(step_name, create_package, ("directory",),
+                [package["type"], name, package["template_version"]])
+
+
+def bootstrap_workspace(workspace, resume=False):
+    """
+    Bootstrap every package of a workspace under its root directory.
+
+    Args:
+        workspace (dict): A workspace as returned by `load_workspace_manifest`.
+        resume (bool, optional): Continue a failed bootstrap of the workspace,
+            re-running only the steps that did not complete.
+
+    Raises:
+        ValueError: If resuming a workspace without a bootstrap journal.
+
+    Returns:
+        None
+    """
+    root_dir = workspace["root_dir"]
+    journal = StepJournal.open(root_dir, resume)
+    root_tree = _root_tree(workspace)
+    package_dirs = {
+        package["name"]: os.path.join(root_dir, PACKAGES_DIR, package["name"])
+        for package in workspace["packages"]
+    }
+    python_packages = [p["name"] for p in workspace["packages"] if p["type"] == "python"]
+    node_packages = [p["name"] for p in workspace["packages"] if p["type"] in NODE_TYPES]
+    typescript_packages = [p["name"] for p in workspace["packages"] if p["type"] == "typescript"]
+
+    steps = [
+        Step("directory", lambda: create_project_directory(root_dir, exist_ok=resume)),
+        Step("root_files", lambda: root_tree.write(root_dir), ("directory",), root_tree.digest()),
+    ]
+    steps += [_package_step(p, package_dirs[p["name"]]) for p in workspace["packages"]]
+
+    if python_packages:
+        venv_dir = os.path.join(root_dir, "venv")
+
+        def install_python_packages():
+            names = install_editable(venv_dir, [package_dirs[name] for name in python_packages])
+            report(f"Installed {', '.join(names)} into the shared virtual environment (editable)")
+
+        steps.append(Step("venv", lambda: create_venv(workspace["name"], root_dir), ("directory",),
+                          sys.executable))
+        steps.append(Step("editable", install_python_packages,
+                          ("venv", *(f"package:{name}" for name in python_packages)),
+                          python_packages))
+
+    if node_packages:
+        plan = build_install_plan(
+            *([PROJECT_REQUIREMENTS, DEPENDENCY_REQUIREMENTS] if typescript_packages else [])
+        )
+
+        def install_node_packages():
+            cache_hit = execute_install_plan(plan, root_dir, "pnpm",
+                                             [package_dirs[name] for name in node_packages])
+            source = "cached lockfile" if cache_hit else "fresh resolution"
+            report(f"Installed dependencies of {len(node_packages)} workspace packages with pnpm "
+                  f"({source}).")
+
+        steps.append(Step("install", install_node_packages,
+                          ("root_files", *(f"package:{name}" for name in node_packages)), plan))
+
+    if workspace["git"]:
+        journal_path = f"{JOURNAL_DIR}/{JOURNAL_FILE}"
+
+        def commit():
+            files = collect_files(root_dir, ignored_dirs=("venv", "node_modules"))
+            write_initial_commit(root_dir, [f for f in files if f[0] != journal_path])
+
+        work_steps = tuple(step.name for step in steps if step.name != "directory")
+        steps.append(Step("git_init", lambda: init_repository(root_dir), ("directory",)))
+        steps.append(Step("git_commit", commit, ("git_init", *work_steps)))
+    run_steps(steps, journal=journal)
+    journal.discard()
+
+    report(f"Workspace '{workspace['name']}' with {len(workspace['packages'])} packages "
+          "has been created successfully.")
+    report(f"cd {root_dir}")
+    if python_packages:
+        report(f"source venv/{'Scripts' if sys.platform == 'win32' else 'bin'}/activate")
+    if node_packages:
+        report("pnpm run build")
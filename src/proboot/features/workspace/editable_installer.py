@@ -0,0 +1,88 @@
+"""
+Editable Installer
+
+This module installs workspace Python packages into the shared workspace
+virtual environment in editable mode, the way `pip install -e` does for a
+src-layout project: a `.pth` file puts the package's `src` directory on
+`sys.path`, and a `.dist-info` directory with a PEP 610 `direct_url.json`
+makes pip list the package as an editable install (and able to uninstall
+it). No build backend runs, so the install needs neither network access nor
+setuptools in the environment, and it costs a few small file writes per
+package. Console scripts are not generated.
+
+Functions:
+- install_editable: Install packages into a virtual environment in editable mode
+"""
+import base64
+import hashlib
+import json
+import os
+import pathlib
+import re
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+from proboot.utils.venv_paths import site_packages_dir
+
+
+def _project_metadata(package_dir):
+    with open(os.path.join(package_dir, "pyproject.toml"), "rb") as f:
+        project = tomllib.load(f).get("project", {})
+    name = project.get("name") or os.path.basename(os.path.abspath(package_dir))
+    return name, project.get("version", "0.0.0")
+
+
+def _record_line(path, content):
+    digest = base64.urlsafe_b64encode(hashlib.sha256(content).digest()).rstrip(b"=").decode()
+    return f"{path},sha256={digest},{len(content)}"
+
+
+def install_editable(venv_dir, package_dirs):
+    """
+    Install packages into a virtual environment in editable mode.
+
+    Args:
+        venv_dir (str): The virtual environment directory.
+        package_dirs (list[str]): Directories of src-layout packages with a pyproject.toml.
+
+    Raises:
+        OSError: If the environment cannot be written.
+        ValueError: If a pyproject.toml is invalid.
+
+    Returns:
+        list[str]: The names of the installed packages.
+    """
+    site_packages = site_packages_dir(venv_dir)
+    installed = []
+    for package_dir in package_dirs:
+        try:
+            name, version = _project_metadata(package_dir)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid pyproject.toml in {package_dir}: {e}") from e
+        dist = re.sub(r"[-_.]+", "_", name).lower()
+        source_dir = os.path.abspath(os.path.join(package_dir, "src"))
+        dist_info = f"{dist}-{version}.dist-info"
+        files = {
+            f"__editable__.{dist}-{version}.pth": f"{source_dir}\n",
+            f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n",
+            f"{dist_info}/INSTALLER": "proboot\n",
+            f"{dist_info}/direct_url.json": json.dumps({
+                "url": pathlib.Path(package_dir).resolve().as_uri(),
+                "dir_info": {"editable": True},
+            }),
+        }
+        record = []
+        os.makedirs(os.path.join(site_packages, dist_info), exist_ok=True)
+        for path, text in files.items():
+            content = text.encode("utf-8")
+            with open(os.path.join(site_packages, path), "wb") as f:
+                f.write(content)
+            record.append(_record_line(path, content))
+        record.append(f"{dist_info}/RECORD,,")
+        with open(os.path.join(site_packages, dist_info, "RECORD"), "w", encoding="utf-8") as f:
+            f.write("\n".join(record) + "\n")
+        installed.append(name)
+    return installed
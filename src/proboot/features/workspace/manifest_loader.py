@@ -0,0 +1,92 @@
+"""
+Workspace Manifest Loader
+
+This module reads a TOML manifest describing a workspace: several related
+packages bootstrapped under one root that share a virtual environment and a
+pnpm workspace.
+
+    [workspace]
+    name = "platform"        # root directory, relative to the manifest
+    git = true               # optional, defaults to true
+
+    [[package]]
+    name = "billing"
+    type = "python"          # optional, defaults to "python"
+
+    [[package]]
+    name = "dashboard"
+    type = "react-typescript"
+    template_version = "5.5.2"  # optional, create-vite version
+
+Functions:
+- load_workspace_manifest: Parse and validate a workspace manifest
+"""
+import os
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+# Workspaces wire packages into the shared venv and pnpm workspace by type,
+# so only the built-in types can take part.
+WORKSPACE_TYPES = ("python", "react-typescript", "typescript")
+
+
+def load_workspace_manifest(manifest_path):
+    """
+    Load a workspace manifest.
+
+    Args:
+        manifest_path (str): Path to the TOML manifest file.
+
+    Raises:
+        OSError: If the manifest cannot be read.
+        ValueError: If the manifest is malformed or declares an invalid package.
+
+    Returns:
+        dict: The workspace, with the keys `name`, `root_dir` (an absolute
+        path), `git` and `packages`, a list of dicts with the keys `name`,
+        `type` and `template_version`.
+    """
+    with open(manifest_path, "rb") as f:
+        try:
+            manifest = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid manifest {manifest_path}: {e}") from e
+
+    workspace = manifest.get("workspace")
+    if not isinstance(workspace, dict):
+        raise ValueError(f"Manifest {manifest_path} has no [workspace] table.")
+    name = workspace.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"The [workspace] table in {manifest_path} is missing a name.")
+
+    entries = manifest.get("package", [])
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Manifest {manifest_path} does not declare any [[package]] entries.")
+    packages = []
+    seen = set()
+    for index, entry in enumerate(entries, 1):
+        package_name = entry.get("name")
+        if not isinstance(package_name, str) or not package_name.strip():
+            raise ValueError(f"Package #{index} in {manifest_path} is missing a name.")
+        if package_name in seen:
+            raise ValueError(f"Package '{package_name}' is declared more than once.")
+        seen.add(package_name)
+        package_type = entry.get("type", "python")
+        if package_type not in WORKSPACE_TYPES:
+            raise ValueError(f"Package '{package_name}' has unsupported type '{package_type}'.")
+        packages.append({
+            "name": package_name,
+            "type": package_type,
+            "template_version": entry.get("template_version"),
+        })
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    return {
+        "name": os.path.basename(os.path.normpath(name)),
+        "root_dir": os.path.normpath(os.path.join(base_dir, name)),
+        "git": bool(workspace.get("git", True)),
+        "packages": packages,
+    }
@@ -7,39 +7,61 @@ command-line and interactive modes of operation.
 
 The main components of this module are:
 - interactive_mode(): Prompts the user for project details interactively.
+- batch_mode(): Bootstraps many projects from a manifest (`proboot batch`).
+- template_mode(): Manages the local create-vite template store (`proboot template`).
+- serve_mode(): Runs the request daemon (`proboot serve`).
+- workspace_mode(): Bootstraps related packages under one root (`proboot workspace`).
+- update_mode(): Applies the current templates to existing projects (`proboot update`).
+- stats_mode(): Reports percentiles from the local timing history (`proboot stats`).
+- write_project_archive(): Streams a bootstrapped project into an archive (`--archive`).
 - main(): The entry point of the application, handling both CLI and interactive modes.
 
 Supported project types:
 - Python
 - React with TypeScript
 - Standalone TypeScript
+
+Start-up cost matters because proboot is called from wrapper scripts, so this
+module imports its dependencies lazily; see benchmarks/check_import_time.py.
 """
+import os
 import sys
 
-from proboot.cli.parser import create_parser
-from proboot.features.python_project.bootstrapper import bootstrap_python_project
-from proboot.features.react_typescript_project.bootstrapper import bootstrap_react_typescript_project
-from proboot.features.typescript_project.bootstrapper import bootstrap_typescript_project
+from proboot import __version__
+
+# Everything else is imported inside the functions that need it, so that
+# `--version`, `--help` and argument errors do not pay for loading the
+# bootstrappers, and only the selected project type's modules are imported.
 
 
-def interactive_mode():
+def interactive_mode(prework=None):
     """
     Interactively prompt the user for project details.
     
     This function asks the user to input the project name, select the project type
     from a numbered list, and choose whether to initialize a git repository.
+
+    Args:
+        prework (Prework, optional): Told about each answer as soon as it is
+            given, so it can prepare the bootstrap while the user answers the
+            remaining prompts.
     
     Returns:
         tuple: A tuple containing:
             - project_name (str): The name of the project.
-            - project_type (str): The type of the project (python, react-typescript, or typescript).
+            - project_type (str): The type of the project, one of the registered project types.
             - init_git (bool): Whether to initialize a git repository.
     """
     project_name = input("Enter the project name: ").strip()
     while not project_name:
         project_name = input("Project name cannot be empty. Please enter a valid name: ").strip()
+    if prework is not None:
+        prework.name_entered(project_name)
 
-    project_types = ["python", "react-typescript", "typescript"]
+    from proboot.utils.type_registry import project_type_names
+
+    # Archive projects need the archive path, which is given with --from-archive.
+    project_types = [ptype for ptype in project_type_names() if ptype != "archive"]
     print("Select the project type:")
     for i, ptype in enumerate(project_types, 1):
         print(f"{i}. {ptype}")
@@ -54,12 +76,212 @@ def interactive_mode():
                 print(f"Please enter a number between 1 and {len(project_types)}.")
         except ValueError:
             print("Please enter a valid number.")
+    if prework is not None:
+        prework.type_selected(project_type)
 
     init_git = input("Initialize git repository? (y/n) [default: y]: ").strip().lower()
     init_git = init_git != 'n'
 
     return project_name, project_type, init_git
 
+def batch_mode(argv):
+    """
+    Bootstrap every project listed in a manifest on a pool of worker threads.
+
+    Args:
+        argv (list[str]): The arguments following `batch` on the command line.
+
+    Returns:
+        None
+    """
+    from proboot.cli.parser import create_batch_parser
+    from proboot.features.batch.manifest_loader import load_manifest
+    from proboot.features.batch.runner import print_report, run_batch
+
+    args = create_batch_parser().parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        print("--jobs must be at least 1.")
+        sys.exit(1)
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Could not load manifest: {e}")
+        sys.exit(1)
+
+    results, elapsed = run_batch(jobs, args.jobs)
+    print_report(results, elapsed)
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+def template_mode(argv):
+    """
+    Manage the local create-vite template store.
+
+    Args:
+        argv (list[str]): The arguments following `template` on the command line.
+
+    Returns:
+        None
+    """
+    import subprocess
+
+    from proboot.cli.parser import create_template_parser
+    from proboot.features.react_typescript_project.template_store import refresh_template
+
+    args = create_template_parser().parse_args(argv)
+    if args.action == "refresh":
+        try:
+            refresh_template(args.template_version, args.from_tarball)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            print(f"Could not refresh template: {e}")
+            sys.exit(1)
+
+def serve_mode(argv):
+    """
+    Run the proboot daemon until interrupted.
+
+    Args:
+        argv (list[str]): The arguments following `serve` on the command line.
+
+    Returns:
+        None
+    """
+    from proboot.cli.parser import create_serve_parser
+    from proboot.features.daemon.protocol import daemon_supported
+
+    args = create_serve_parser().parse_args(argv)
+    if not daemon_supported():
+        print("proboot serve requires Unix domain sockets, which this platform does not support.")
+        sys.exit(1)
+    if args.jobs is not None and args.jobs < 1:
+        print("--jobs must be at least 1.")
+        sys.exit(1)
+
+    from proboot.features.daemon.server import serve
+
+    try:
+        serve(args.socket, args.jobs)
+    except OSError as e:
+        print(f"Could not start daemon: {e}")
+        sys.exit(1)
+
+def workspace_mode(argv):
+    """
+    Bootstrap a workspace of related packages sharing one venv and one pnpm workspace.
+
+    Args:
+        argv (list[str]): The arguments following `workspace` on the command line.
+
+    Returns:
+        None
+    """
+    from proboot.cli.parser import create_workspace_parser
+    from proboot.features.workspace.manifest_loader import load_workspace_manifest
+
+    args = create_workspace_parser().parse_args(argv)
+    try:
+        workspace = load_workspace_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Could not load manifest: {e}")
+        sys.exit(1)
+
+    from proboot.features.workspace.bootstrapper import bootstrap_workspace
+    from proboot.utils.directory_handler import ProjectExistsError
+    from proboot.utils.git_writer import GitIdentityError
+    from proboot.utils.timing_history import recording
+
+    try:
+        with recording("workspace"):
+            bootstrap_workspace(workspace, args.resume)
+    except (ValueError, ProjectExistsError, GitIdentityError) as e:
+        print(e)
+        sys.exit(1)
+
+def write_project_archive(project_dir, archive_path, threads=None):
+    """
+    Stream a bootstrapped project into an archive (`--archive`).
+
+    The project's virtual environment is left out: it records its absolute
+    location, so it would not work where the archive is extracted.
+
+    Args:
+        project_dir (str): The bootstrapped project in the scratch directory.
+        archive_path (str): Path of the .tar.zst, .tar.gz or .tar archive to write.
+        threads (int, optional): Compression threads. Defaults to the number of CPUs.
+
+    Returns:
+        None
+    """
+    from proboot.utils.archive_writer import archive_compression, write_archive
+
+    ignored = ["venv"] if os.path.isdir(os.path.join(project_dir, "venv")) else []
+    try:
+        files, size = write_archive(project_dir, archive_path, os.path.basename(project_dir),
+                                    threads, ignored)
+    except (OSError, ValueError) as e:
+        print(f"Could not write {archive_path}: {e}")
+        sys.exit(1)
+    compression = archive_compression(archive_path) or "uncompressed"
+    print(f"Archived {files} files to {archive_path} ({size / 1e6:.1f} MB, {compression}).")
+    if ignored:
+        print("The virtual environment was left out; create it with `python -m venv venv` "
+              "after extracting.")
+
+def update_mode(argv):
+    """
+    Apply the current templates to existing projects and report the result for each.
+
+    Args:
+        argv (list[str]): The arguments following `update` on the command line.
+
+    Returns:
+        None
+    """
+    from proboot.cli.parser import create_update_parser
+    from proboot.features.update.updater import CONFLICT_ACTIONS, print_report, update_projects
+
+    args = create_update_parser().parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        print("--jobs must be at least 1.")
+        sys.exit(1)
+
+    results, elapsed = update_projects(args.projects, args.jobs, args.dry_run)
+    print_report(results, elapsed)
+    if not all(result["ok"] for result in results) or any(
+        action in CONFLICT_ACTIONS for result in results for _, action in result["changes"]
+    ):
+        sys.exit(1)
+
+def stats_mode(argv):
+    """
+    Report per-step and per-type percentiles of the recorded bootstrap timings.
+
+    Args:
+        argv (list[str]): The arguments following `stats` on the command line.
+
+    Returns:
+        None
+    """
+    import time
+
+    from proboot.cli.parser import create_stats_parser
+    from proboot.features.stats.reporter import parse_window, print_report, summarize
+    from proboot.utils.timing_history import read_history
+
+    args = create_stats_parser().parse_args(argv)
+    try:
+        window = parse_window(args.since)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
+    records = read_history(since=None if window is None else time.time() - window)
+    if args.type:
+        records = [record for record in records if record.get("type") == args.type]
+    if args.host:
+        records = [record for record in records if record.get("host") == args.host]
+    print_report(summarize(records), "all time" if window is None else f"last {args.since}")
+
 def main():
     """
     Main function to handle the project bootstrapping process.
@@ -69,29 +291,170 @@ def main():
     bootstrapping function based on the project type.
     
     The function does the following:
-    1. Checks if command-line arguments are provided.
+    1. Checks if command-line arguments are provided, dispatching `batch` to batch_mode(),
+       `template` to template_mode(), `serve` to serve_mode(), `update` to update_mode(),
+       `stats` to stats_mode() and `workspace` to workspace_mode().
     2. If arguments are provided, it parses them using the create_parser() function.
     3. If no arguments are provided, it calls the interactive_mode() function.
-    4. Based on the project type, it calls the appropriate bootstrapping function.
+    4. If a `proboot serve` daemon is running, it forwards the request to it; otherwise
+       it calls the appropriate bootstrapping function based on the project type.
     5. If the project type is not supported, it prints an error message.
+    6. With --profile, it writes a Chrome trace and prints a step summary to stderr.
+    7. With --archive, it bootstraps the project in a scratch directory and
+       streams it into the archive.
     """
+    if sys.argv[1:] == ["--version"]:
+        print(f"proboot {__version__}")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        batch_mode(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "template":
+        template_mode(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "workspace":
+        workspace_mode(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "update":
+        update_mode(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve_mode(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "stats":
+        stats_mode(sys.argv[2:])
+        return
+
     if len(sys.argv) > 1:
+        from proboot.cli.parser import create_parser
+
         parser = create_parser()
         args = parser.parse_args()
         project_name = args.project_name
-        project_type = args.type
+        project_type = args.type or ("archive" if args.from_archive else "python")
         init_git = not args.no_git
+        template_version = args.template_version
+        package_manager = args.package_manager
+        profile_path = args.profile
+        prework = None
+        resume = args.resume
+        dependencies = list(args.deps)
+        wheelhouse = os.path.abspath(args.wheelhouse) if args.wheelhouse else None
+        template_archive = os.path.abspath(args.from_archive) if args.from_archive else None
+        compiler = {"target": args.target, "module": args.module, "strict": args.strict}
+        archive_path = os.path.abspath(args.archive) if args.archive else None
+        archive_threads = args.archive_threads
+        if archive_path:
+            from proboot.utils.archive_writer import archive_compression
+
+            try:
+                archive_compression(archive_path)
+            except ValueError as e:
+                print(e)
+                sys.exit(1)
+            if resume:
+                print("--resume cannot be combined with --archive.")
+                sys.exit(1)
+            if archive_threads is not None and archive_threads < 1:
+                print("--archive-threads must be at least 1.")
+                sys.exit(1)
+        variables = {}
+        for assignment in args.var:
+            key, separator, value = assignment.partition("=")
+            if not separator or not key:
+                print(f"Invalid --var {assignment}; expected KEY=VALUE.")
+                sys.exit(1)
+            variables[key] = value
+        if args.deps_file:
+            from proboot.features.python_project.wheelhouse import read_requirements_file
+
+            try:
+                dependencies += read_requirements_file(args.deps_file)
+            except OSError as e:
+                print(f"Could not read {args.deps_file}: {e}")
+                sys.exit(1)
     else:
-        project_name, project_type, init_git = interactive_mode()
-
-    if project_type == "python":
-        bootstrap_python_project(project_name, init_git)
-    elif project_type == "react-typescript":
-        bootstrap_react_typescript_project(project_name, init_git)
-    elif project_type == "typescript":
-        bootstrap_typescript_project(project_name, init_git)
-    else:
-        print(f"Project type {project_type} is not supported yet.")
+        from proboot.features.daemon.client import daemon_available
+
+        # A running daemon is already warm, so there is nothing to prepare.
+        prework = None
+        if not daemon_available():
+            from proboot.features.interactive.prework import Prework
+
+            prework = Prework()
+        try:
+            project_name, project_type, init_git = interactive_mode(prework)
+        except BaseException:
+            if prework is not None:
+                prework.discard()
+            raise
+        template_version = None
+        package_manager = "pnpm"
+        profile_path = None
+        resume = False
+        dependencies = []
+        wheelhouse = None
+        template_archive = None
+        compiler = {}
+        archive_path = None
+        archive_threads = None
+        variables = {}
+
+    # The daemon creates projects in the working directory, so archives are built in-process.
+    if not profile_path and not archive_path:
+        from proboot.features.daemon.client import forward_bootstrap
+
+        status = forward_bootstrap(project_name, project_type, init_git,
+                                   template_version=template_version, package_manager=package_manager,
+                                   resume=resume, dependencies=dependencies, wheelhouse=wheelhouse,
+                                   template_archive=template_archive, variables=variables,
+                                   **compiler)
+        if status is not None:
+            if status:
+                sys.exit(status)
+            return
+
+    from proboot.features.project_types import bootstrap_project
+    from proboot.utils.directory_handler import ProjectExistsError
+    from proboot.utils.git_writer import GitIdentityError
+    from proboot.utils.profiler import enable_profiling, print_summary, span, write_chrome_trace
+
+    if profile_path:
+        enable_profiling()
+    scratch_dir = None
+    if archive_path:
+        import tempfile
+
+        # Installs and git need a real directory; it is streamed into the archive afterwards.
+        scratch_dir = tempfile.mkdtemp(prefix="proboot-", dir=os.environ.get("PROBOOT_SCRATCH_DIR"))
+    try:
+        if prework is not None:
+            prework.finish()
+        with span(f"bootstrap {project_type} {project_name}", "bootstrap"):
+            bootstrap_project(project_name, project_type, init_git, scratch_dir,
+                              template_version=template_version, package_manager=package_manager,
+                              resume=resume, dependencies=dependencies, wheelhouse=wheelhouse,
+                              template_archive=template_archive, variables=variables,
+                              **compiler)
+        if archive_path:
+            write_project_archive(os.path.join(scratch_dir, project_name), archive_path,
+                                  archive_threads)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    except (ProjectExistsError, GitIdentityError) as e:
+        print(e)
+        sys.exit(1)
+    finally:
+        if prework is not None:
+            prework.discard()
+        if scratch_dir:
+            import shutil
+
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+        if profile_path:
+            write_chrome_trace(profile_path)
+            print_summary()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,166 @@
+"""
+This module streams a project directory into a compressed tar archive.
+
+The archive is written as a stream: files are read in fixed-size chunks and
+piped through the compressor, so memory use does not depend on the project
+size, and nothing but the archive itself is written to disk. Compression runs
+on several threads where the compressor supports it:
+
+- `.tar.zst` / `.tzst`: the `zstd` command with `-T<threads>`, or Python
+  3.14's compression.zstd with the same number of workers.
+- `.tar.gz` / `.tgz`: `pigz -p <threads>` when it is installed, otherwise
+  Python's gzip module on one thread.
+- `.tar`: no compression.
+
+Members are stored under a top-level directory named after the project, in
+sorted order, with owner information removed. The archive is written to a
+temporary file next to the destination and renamed into place when complete,
+so a failed bootstrap never leaves a truncated archive behind.
+
+Functions:
+- archive_compression: Return the compression of an archive, based on its file name
+- write_archive: Stream a directory into a compressed tar archive
+"""
+import contextlib
+import gzip
+import os
+import shutil
+import subprocess
+import tarfile
+
+from proboot.utils.profiler import span
+
+COMPRESSIONS = {
+    (".tar.zst", ".tzst"): "zstd",
+    (".tar.gz", ".tgz"): "gzip",
+    (".tar",): None,
+}
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+
+def archive_compression(archive_path):
+    """
+    Returns the compression of an output archive, based on its file name.
+
+    Args:
+        archive_path (str): Path of the archive to write.
+
+    Raises:
+        ValueError: If the archive type is not supported.
+
+    Returns:
+        str or None: "zstd", "gzip" or None for an uncompressed tar.
+    """
+    lower = archive_path.lower()
+    for suffixes, compression in COMPRESSIONS.items():
+        if lower.endswith(suffixes):
+            return compression
+    raise ValueError(f"Unsupported archive {archive_path}; expected .tar.zst, .tar.gz or .tar.")
+
+
+@contextlib.contextmanager
+def _piped(command, output):
+    """
+    Yields the stdin of a compressor command writing to output.
+
+    Started with Popen rather than the command runner, which cannot stream
+    binary stdin (see proboot.utils.command_runner).
+    """
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=output,
+                               stderr=subprocess.PIPE)
+    try:
+        yield process.stdin
+    finally:
+        process.stdin.close()
+        stderr = process.stderr.read().decode(errors="replace").strip()
+        process.stderr.close()
+        if process.wait() != 0:
+            raise OSError(f"{command[0]} failed: {stderr}")
+
+
+@contextlib.contextmanager
+def _compressed(output, compression, threads):
+    """
+    Yields a binary stream whose writes are compressed into output.
+    """
+    if compression == "zstd":
+        if shutil.which("zstd"):
+            with _piped(["zstd", "-q", f"-{ZSTD_LEVEL}", f"-T{threads}", "-c"], output) as stream:
+                yield stream
+            return
+        try:
+            from compression import zstd  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ValueError("Writing .tar.zst archives needs the zstd command "
+                             "(or Python 3.14).") from None
+        options = {zstd.CompressionParameter.compression_level: ZSTD_LEVEL}
+        if threads > 1:
+            options[zstd.CompressionParameter.nb_workers] = threads
+        with zstd.ZstdFile(output, "wb", options=options) as stream:
+            yield stream
+    elif compression == "gzip":
+        if threads > 1 and shutil.which("pigz"):
+            with _piped(["pigz", f"-{GZIP_LEVEL}", "-p", str(threads), "-c"], output) as stream:
+                yield stream
+            return
+        with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=GZIP_LEVEL) as stream:
+            yield stream
+    else:
+        yield output
+
+
+def _anonymize(member):
+    member.uid = member.gid = 0
+    member.uname = member.gname = ""
+    return member
+
+
+def write_archive(source_dir, archive_path, arcname, threads=None, ignored=()):
+    """
+    Streams a directory into a compressed tar archive.
+
+    Args:
+        source_dir (str): The directory to archive.
+        archive_path (str): Path of the archive to write; its suffix selects
+            the compression (see `archive_compression`).
+        arcname (str): Name of the archive's top-level directory.
+        threads (int, optional): Compression threads. Defaults to the number of CPUs.
+        ignored (Iterable[str]): Paths relative to source_dir, with forward
+            slashes, to leave out (with everything below them).
+
+    Raises:
+        ValueError: If the archive type is not supported or no compressor is available.
+        OSError: If a file cannot be read or the archive cannot be written.
+
+    Returns:
+        tuple: (files, size) — the number of files archived and the archive size in bytes.
+    """
+    compression = archive_compression(archive_path)
+    threads = max(threads or os.cpu_count() or 1, 1)
+    ignored = set(ignored)
+    tmp_path = f"{archive_path}.{os.getpid()}.tmp"
+    files = 0
+    try:
+        with span(f"archive {os.path.basename(archive_path)}", "io"), \
+                open(tmp_path, "wb") as output, \
+                _compressed(output, compression, threads) as stream, \
+                tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as archive:
+            archive.add(source_dir, arcname, recursive=False, filter=_anonymize)
+            for root, dirs, names in os.walk(source_dir):
+                relative_root = os.path.relpath(root, source_dir).replace(os.sep, "/")
+                prefix = "" if relative_root == "." else f"{relative_root}/"
+                dirs[:] = sorted(d for d in dirs if f"{prefix}{d}" not in ignored)
+                for name in sorted(dirs) + sorted(names):
+                    path = f"{prefix}{name}"
+                    if path in ignored:
+                        continue
+                    archive.add(os.path.join(root, name), f"{arcname}/{path}", recursive=False,
+                                filter=_anonymize)
+                    if name in names:
+                        files += 1
+        os.replace(tmp_path, archive_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return files, os.path.getsize(archive_path)
@@ -0,0 +1,41 @@
+"""
+This module locates proboot's per-user cache directory.
+
+The cache directory holds data that proboot can rebuild at any time, such as
+pre-built virtual environments. Its location follows platform conventions:
+
+- Linux and other POSIX systems: `$XDG_CACHE_HOME/proboot` or `~/.cache/proboot`
+- macOS: `~/Library/Caches/proboot`
+- Windows: `%LOCALAPPDATA%\\proboot\\Cache`
+
+Setting the `PROBOOT_CACHE_DIR` environment variable overrides the location.
+"""
+import os
+import sys
+
+
+def get_cache_dir(*parts):
+    """
+    Returns a directory inside the proboot cache, creating it if needed.
+
+    Args:
+        *parts (str): Path components appended to the cache root.
+
+    Returns:
+        str: The absolute path of the cache directory.
+    """
+    base = os.environ.get("PROBOOT_CACHE_DIR")
+    if not base:
+        if sys.platform == "win32":
+            local_app_data = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+            base = os.path.join(local_app_data, "proboot", "Cache")
+        elif sys.platform == "darwin":
+            base = os.path.join(os.path.expanduser("~"), "Library", "Caches", "proboot")
+        else:
+            xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+            base = os.path.join(xdg_cache_home, "proboot")
+    path = os.path.abspath(os.path.join(base, *parts))
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,54 @@
+"""
+This module serializes updates to shared parts of the proboot cache.
+
+Several proboot processes (and, in the daemon and batch runner, several
+threads of one process) may update the same cache at once. `cache_lock`
+takes an exclusive lock on a lock file in the cache directory: an flock where
+the platform has one, and a process-wide lock in any case, so the threads of
+one process also exclude each other on platforms without flock.
+
+Functions:
+- cache_lock: Hold the exclusive lock of a cache area
+"""
+import contextlib
+import os
+import threading
+
+from proboot.utils.cache_dir import get_cache_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(path, threading.Lock())
+
+
+@contextlib.contextmanager
+def cache_lock(*parts):
+    """
+    Holds the exclusive lock of a cache area, blocking until it is free.
+
+    Args:
+        *parts (str): Path components of the cache area, e.g. "snapshots".
+
+    Yields:
+        None
+    """
+    path = os.path.join(get_cache_dir(*parts), ".lock")
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
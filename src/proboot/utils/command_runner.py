@@ -0,0 +1,141 @@
+"""
+This module runs the external tools proboot depends on (git, npm, pnpm, npx).
+
+Commands run on asyncio subprocesses. Their output is reported line by line
+(see proboot.utils.progress) with a `[tool]` prefix, so the output of commands running at the same time
+(for example `git init` while dependencies install) stays readable. Commands
+support timeouts and are killed when the awaiting task is cancelled.
+
+`run_command` is the synchronous entry point used by the bootstrap steps; it
+runs the command on a private event loop, so it can be called from the step
+graph's worker threads. Async callers use `run_command_async` directly.
+
+Every command is recorded by the profiler with its exit code.
+
+The one exception are the `zstd` and `pigz` filters of
+proboot.utils.archive_writer and the archive extractor: their binary stdin or
+stdout is a stream that tarfile reads or writes while the process runs, which
+this line-oriented runner cannot provide. They are started with
+subprocess.Popen, and their failures are raised from their stderr.
+"""
+import asyncio
+import functools
+import os
+import shutil
+import subprocess
+
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name, path):
+    return shutil.which(name, path=path) or name
+
+
+def resolve_executable(name):
+    """
+    Returns the full path of an executable on PATH, resolving it once per PATH.
+
+    Args:
+        name (str): The executable name, e.g. "pnpm".
+
+    Returns:
+        str: The resolved path, or name unchanged if it is not on PATH.
+    """
+    return _which(name, os.environ.get("PATH"))
+
+
+async def _pump(stream, prefix, sink, chunks):
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        if chunks is not None:
+            chunks.append(line)
+        elif sink is not None:
+            report(f"{prefix}{line.decode('utf-8', errors='replace')}", "output", sink)
+
+
+async def run_command_async(args, cwd=None, check=True, timeout=None, capture_output=False,
+                            quiet=False, env=None):
+    """
+    Runs an external command on an asyncio subprocess.
+
+    Args:
+        args (list[str]): The command and its arguments.
+        cwd (str, optional): Working directory of the command.
+        check (bool): Raise if the command exits with a non-zero status.
+        timeout (float, optional): Seconds after which the command is killed.
+        capture_output (bool): Return stdout and stderr instead of streaming them.
+        quiet (bool): Discard stdout instead of streaming it.
+        env (dict, optional): Environment of the command. Defaults to os.environ.
+
+    Raises:
+        subprocess.CalledProcessError: If check is set and the command fails.
+        subprocess.TimeoutExpired: If the command does not finish within timeout.
+        asyncio.CancelledError: If the awaiting task is cancelled; the command is killed.
+
+    Returns:
+        subprocess.CompletedProcess: The finished process; stdout and stderr are
+        text when capture_output is set and None otherwise.
+    """
+    prefix = f"[{os.path.basename(args[0])}] "
+    with span(" ".join(args), "command", cwd=cwd) as command_span:
+        process = await asyncio.create_subprocess_exec(
+            resolve_executable(args[0]), *args[1:],
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout_chunks = [] if capture_output else None
+        stderr_chunks = [] if capture_output else None
+        pumps = asyncio.gather(
+            _pump(process.stdout, prefix, None if quiet else "stdout", stdout_chunks),
+            _pump(process.stderr, prefix, "stderr", stderr_chunks),
+            process.wait(),
+        )
+        try:
+            await asyncio.wait_for(pumps, timeout)
+        except asyncio.TimeoutError:
+            _kill(process)
+            await process.wait()
+            command_span.set(exit_code=process.returncode, timed_out=True)
+            raise subprocess.TimeoutExpired(args, timeout) from None
+        except asyncio.CancelledError:
+            _kill(process)
+            await process.wait()
+            raise
+        command_span.set(exit_code=process.returncode)
+
+    stdout = stderr = None
+    if capture_output:
+        stdout = b"".join(stdout_chunks).decode("utf-8", errors="replace")
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    result = subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+    if check:
+        result.check_returncode()
+    return result
+
+
+def _kill(process):
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+def run_command(args, cwd=None, check=True, timeout=None, capture_output=False, quiet=False,
+                env=None):
+    """
+    Runs an external command and waits for it to finish.
+
+    See `run_command_async` for the arguments, exceptions and return value.
+    """
+    return asyncio.run(
+        run_command_async(args, cwd=cwd, check=check, timeout=timeout,
+                          capture_output=capture_output, quiet=quiet, env=env)
+    )
@@ -5,28 +5,56 @@ It provides utility functions for creating and managing project directories
 during the bootstrapping process. The main functionality includes:
 
 - Creating new project directories
-- Handling existing directory conflicts
+- Handling existing directory conflicts, including resuming an interrupted bootstrap
 - Providing informative output about directory operations
 
 This module is part of the proboot utility package and is used to ensure
 proper directory setup when initializing new projects.
 """
 import os
-import sys
 
-def create_project_directory(project_name):
+from proboot.utils.progress import report
+from proboot.utils.step_journal import JOURNAL_DIR, JOURNAL_FILE
+
+
+class ProjectExistsError(FileExistsError):
+    """
+    Raised when the project directory already exists and is not being resumed.
+
+    Attributes:
+        resumable (bool): Whether the directory holds the journal of an
+            unfinished bootstrap that can be resumed.
+    """
+
+    def __init__(self, message, resumable=False):
+        super().__init__(message)
+        self.resumable = resumable
+
+
+def create_project_directory(project_name, exist_ok=False):
     """
     Creates a new project directory with the given name.
     
     Args:
         project_name (str): The name of the project directory to create.
+        exist_ok (bool): Whether an existing directory is reused, as when
+            resuming an interrupted bootstrap.
     
     Raises:
-        FileExistsError: If the project directory already exists.
+        ProjectExistsError: If the project directory already exists and exist_ok is False.
     """
     try:
         os.makedirs(project_name)
-        print(f"Created project directory: {project_name}")
+        report(f"Created project directory: {project_name}")
     except FileExistsError:
-        print(f"Directory {project_name} already exists.")
-        sys.exit(1)
+        if exist_ok:
+            report(f"Resuming in existing project directory: {project_name}")
+            return
+        message = f"Directory {project_name} already exists."
+        if os.path.isfile(os.path.join(project_name, JOURNAL_DIR, JOURNAL_FILE)):
+            raise ProjectExistsError(
+                f"{message}\nA previous bootstrap did not finish; "
+                "run again with --resume to continue it.",
+                resumable=True,
+            ) from None
+        raise ProjectExistsError(message) from None
@@ -0,0 +1,85 @@
+"""
+This module copies files cheaply by sharing data blocks where possible.
+
+Files are cloned with the cheapest mechanism the filesystem supports, in order:
+
+- Reflink (copy-on-write clone) via the Linux FICLONE ioctl
+- Hardlink
+- Regular copy
+
+Reflinks and copies give the destination its own identity; hardlinks share the
+inode with the source, so callers must only hardlink from sources that are
+never modified in place (for example, proboot's caches).
+
+Whether reflinks work depends on the filesystem, so it is remembered per
+device: once a filesystem rejects a reflink, later clones from it go straight
+to the next mechanism, while clones on other filesystems still try reflinks.
+"""
+import errno
+import os
+import shutil
+import sys
+
+_FICLONE = 0x40049409
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EINVAL, errno.ENOTTY, errno.EOPNOTSUPP, errno.EMLINK}
+# Errors meaning the filesystem cannot reflink at all. Others, such as EXDEV for
+# a destination on another filesystem, only affect the file at hand.
+_UNSUPPORTED_ERRNOS = {errno.EINVAL, errno.ENOTTY, errno.EOPNOTSUPP}
+_REFLINK_PLATFORM = sys.platform.startswith("linux")
+# Devices (st_dev) whose filesystem rejected a reflink.
+_reflink_unsupported_devices = set()
+
+
+def _reflink(src, dst):
+    """
+    Clones src to dst with the FICLONE ioctl.
+
+    Raises:
+        OSError: If the filesystem does not support reflinks.
+    """
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    with open(src, "rb") as src_file:
+        device = os.fstat(src_file.fileno()).st_dev
+        if device in _reflink_unsupported_devices:
+            raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this filesystem", src)
+        with open(dst, "wb") as dst_file:
+            try:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            except OSError as e:
+                dst_file.close()
+                os.unlink(dst)
+                if e.errno in _UNSUPPORTED_ERRNOS:
+                    _reflink_unsupported_devices.add(device)
+                raise
+    shutil.copymode(src, dst)
+
+
+def clone_file(src, dst, allow_hardlink=True):
+    """
+    Copies a regular file, preferring a reflink, then a hardlink, then a copy.
+
+    Args:
+        src (str): Path of the source file.
+        dst (str): Path of the destination file. It must not exist.
+        allow_hardlink (bool): Whether the destination may share the source's inode.
+
+    Returns:
+        str: The method used: "reflink", "hardlink" or "copy".
+    """
+    if _REFLINK_PLATFORM:
+        try:
+            _reflink(src, dst)
+            return "reflink"
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS and e.errno != errno.EBADF:
+                raise
+    if allow_hardlink:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+    shutil.copy2(src, dst)
+    return "copy"
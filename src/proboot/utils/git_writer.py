@@ -0,0 +1,414 @@
+"""
+This module creates a project's initial git commit without `git add`/`git commit`.
+
+Instead of re-walking the project with `git add .`, proboot writes the blob,
+tree and commit objects for the files it just generated directly into the
+repository, together with the branch ref, reflog and an index whose stat data
+matches the working tree. Only `git init` and a single `git var` call (to
+resolve the author and committer identity exactly as git would) are spawned,
+so the cost stays constant no matter how many files were scaffolded.
+
+Repositories that need more than plain objects are committed with `git add`
+and `git commit` instead: when `commit.gpgsign` is set, when a commit hook is
+installed (from `init.templateDir` or `core.hooksPath`), or when the
+repository uses SHA-256 object names (`extensions.objectFormat`). These are
+detected from the configuration printed by the same `git var` call.
+
+Compressed blobs are kept in the proboot cache and hardlinked into new
+repositories, so static template files are hashed and compressed once across
+runs. Using a cached blob refreshes its modification time, and the cache is
+bounded: when a commit added blobs to it and it was last checked more than
+`EVICTION_INTERVAL_SECONDS` ago, the least recently used blobs are removed
+until it fits `PROBOOT_GIT_OBJECTS_CACHE_MB` (default 256). A blob evicted
+while a repository is being written is simply written again.
+"""
+import hashlib
+import os
+import stat
+import struct
+import time
+import uuid
+import zlib
+
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.cache_lock import cache_lock
+from proboot.utils.command_runner import run_command
+from proboot.utils.file_cloner import clone_file
+from proboot.utils.profiler import span
+from proboot.utils.progress import report
+
+MAX_CACHED_BLOB_SIZE = 256 * 1024
+DEFAULT_CACHE_BUDGET_MB = 256
+EVICTION_INTERVAL_SECONDS = 3600
+_EVICTION_STAMP = ".evicted"
+COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit",
+                "reference-transaction")
+
+
+class GitIdentityError(Exception):
+    """Raised when git cannot determine the author or committer identity."""
+
+
+def init_repository(project_dir):
+    """
+    Initializes an empty Git repository with `main` as the initial branch.
+
+    Args:
+        project_dir (str): The project directory.
+
+    Raises:
+        subprocess.CalledProcessError: If `git init` fails.
+
+    Returns:
+        None
+    """
+    run_command(["git", "init", "--initial-branch=main"], cwd=project_dir, check=True)
+
+
+def collect_files(project_dir, ignored_dirs=()):
+    """
+    Reads the files of a project from disk for the initial commit.
+
+    Args:
+        project_dir (str): The project directory.
+        ignored_dirs (Iterable[str]): Directory names to skip at any depth,
+            in addition to `.git`.
+
+    Returns:
+        list[tuple]: (path, content, mode) for every regular file, with
+        forward-slash paths relative to project_dir.
+    """
+    return list(iter_files(project_dir, ignored_dirs))
+
+
+def iter_files(project_dir, ignored_dirs=()):
+    """
+    Reads the files of a project from disk one at a time.
+
+    Like `collect_files`, but only one file's content is held in memory at a
+    time, for projects too large to read at once.
+
+    Args:
+        project_dir (str): The project directory.
+        ignored_dirs (Iterable[str]): Directory names to skip at any depth,
+            in addition to `.git`.
+
+    Yields:
+        tuple: (path, content, mode) for every regular file, with forward-slash
+        paths relative to project_dir.
+    """
+    skipped = {".git", *ignored_dirs}
+    for root, dirs, names in os.walk(project_dir):
+        dirs[:] = [d for d in dirs if d not in skipped]
+        for name in names:
+            full_path = os.path.join(root, name)
+            if not os.path.isfile(full_path) or os.path.islink(full_path):
+                continue
+            with open(full_path, "rb") as f:
+                content = f.read()
+            path = os.path.relpath(full_path, project_dir).replace(os.sep, "/")
+            yield path, content, os.stat(full_path).st_mode
+
+
+def _git_variables(project_dir):
+    """
+    Returns git's logical variables and configuration, as printed by `git var -l`.
+
+    Config keys are printed lower-cased; of repeated keys the last one wins.
+    """
+    output = run_command(
+        ["git", "var", "-l"], cwd=project_dir, check=True, capture_output=True
+    ).stdout
+    variables = {}
+    for line in output.splitlines():
+        key, _, value = line.partition("=")
+        variables[key] = value
+    return variables
+
+
+def _identities(variables):
+    """
+    Returns the author and committer identity the way `git commit` would resolve them.
+
+    Raises:
+        GitIdentityError: If git cannot determine a usable identity.
+    """
+    for key in ("GIT_AUTHOR_IDENT", "GIT_COMMITTER_IDENT"):
+        ident = variables.get(key, "")
+        if not ident or "(none)>" in ident or "<>" in ident:
+            raise GitIdentityError(
+                "Git identity unknown; set user.name and user.email with git config."
+            )
+    return variables["GIT_AUTHOR_IDENT"], variables["GIT_COMMITTER_IDENT"]
+
+
+def _git_commit_reason(project_dir, variables):
+    """
+    Returns why the commit must be made by `git commit`, or None if it can be written directly.
+    """
+    if variables.get("commit.gpgsign", "false").lower() in ("true", "yes", "on", "1"):
+        return "commit.gpgsign is set"
+    if variables.get("extensions.objectformat", "sha1").lower() != "sha1":
+        return f"the repository uses {variables['extensions.objectformat']} object names"
+    hooks_dir = os.path.join(project_dir, ".git", "hooks")
+    if variables.get("core.hookspath"):
+        hooks_dir = os.path.join(project_dir, os.path.expanduser(variables["core.hookspath"]))
+    for hook in COMMIT_HOOKS:
+        hook_path = os.path.join(hooks_dir, hook)
+        if os.path.isfile(hook_path) and os.access(hook_path, os.X_OK):
+            return f"the {hook} hook is installed"
+    return None
+
+
+def _git_commit(project_dir, files, message):
+    """
+    Commits the given files with `git add` and `git commit` and returns the commit's hex name.
+    """
+    pathspec_path = os.path.join(project_dir, ".git", "proboot-pathspec")
+    with open(pathspec_path, "wb") as f:
+        for path, _, _ in files:
+            f.write(path.encode("utf-8") + b"\0")
+    try:
+        run_command(["git", "add", "--pathspec-from-file=.git/proboot-pathspec",
+                     "--pathspec-file-nul"], cwd=project_dir, check=True)
+    finally:
+        os.remove(pathspec_path)
+    run_command(["git", "commit", "--quiet", "-m", message], cwd=project_dir, check=True)
+    return run_command(
+        ["git", "rev-parse", "HEAD"], cwd=project_dir, check=True, capture_output=True
+    ).stdout.strip()
+
+
+def _write_object(git_dir, obj_type, content, cache_dir=None, cached=None):
+    """
+    Writes a loose object and returns its binary SHA-1.
+
+    Blobs written to cache_dir are appended to the cached list, if given.
+    """
+    data = b"%s %d\0" % (obj_type, len(content)) + content
+    sha = hashlib.sha1(data).digest()
+    hex_sha = sha.hex()
+    object_dir = os.path.join(git_dir, "objects", hex_sha[:2])
+    object_path = os.path.join(object_dir, hex_sha[2:])
+    if os.path.exists(object_path):
+        return sha
+    os.makedirs(object_dir, exist_ok=True)
+
+    cached_path = None
+    if cache_dir is not None and len(content) <= MAX_CACHED_BLOB_SIZE:
+        cached_path = os.path.join(cache_dir, hex_sha[:2], hex_sha[2:])
+        try:
+            os.utime(cached_path)
+            clone_file(cached_path, object_path)
+            return sha
+        except FileNotFoundError:
+            # Not cached yet, or evicted meanwhile.
+            pass
+
+    target = cached_path or object_path
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f"{target}.{uuid.uuid4().hex}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(zlib.compress(data, 1))
+    os.chmod(temp_path, 0o444)
+    os.replace(temp_path, target)
+    if cached_path:
+        if cached is not None:
+            cached.append(hex_sha)
+        try:
+            clone_file(cached_path, object_path)
+        except FileNotFoundError:
+            return _write_object(git_dir, obj_type, content)
+    return sha
+
+
+def _cache_budget_bytes():
+    try:
+        return int(os.environ.get("PROBOOT_GIT_OBJECTS_CACHE_MB", DEFAULT_CACHE_BUDGET_MB)) \
+            * 1024 * 1024
+    except ValueError:
+        return DEFAULT_CACHE_BUDGET_MB * 1024 * 1024
+
+
+def evict_cached_blobs(budget_bytes=None, force=False):
+    """
+    Removes the least recently used blobs until the blob cache fits its budget.
+
+    Runs under the cache lock, and at most once per `EVICTION_INTERVAL_SECONDS`
+    unless forced, since it has to stat every cached blob. Repositories keep
+    their own link or copy of every blob, so eviction never affects them.
+
+    Args:
+        budget_bytes (int, optional): Size budget. Defaults to `PROBOOT_GIT_OBJECTS_CACHE_MB`.
+        force (bool): Check the cache even if it was checked recently.
+
+    Returns:
+        int: The number of blobs removed.
+    """
+    budget_bytes = _cache_budget_bytes() if budget_bytes is None else budget_bytes
+    cache_dir = get_cache_dir("git-objects")
+    stamp_path = os.path.join(cache_dir, _EVICTION_STAMP)
+    with cache_lock("git-objects"):
+        try:
+            checked = os.path.getmtime(stamp_path)
+        except FileNotFoundError:
+            checked = None
+        if not force and checked is not None and checked > time.time() - EVICTION_INTERVAL_SECONDS:
+            return 0
+        with open(stamp_path, "w", encoding="utf-8"):
+            pass
+
+        blobs = []
+        for prefix in os.listdir(cache_dir):
+            prefix_dir = os.path.join(cache_dir, prefix)
+            if len(prefix) != 2 or not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(prefix_dir, name)
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                blobs.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in blobs)
+        blobs.sort()
+        removed = 0
+        for _, size, path in blobs:
+            if total <= budget_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+
+def _tree_sort_key(entry):
+    name, mode, _ = entry
+    return name + b"/" if mode == b"40000" else name
+
+
+def _write_tree(git_dir, node):
+    """
+    Recursively writes tree objects for a nested {name: sha | dict} mapping.
+    """
+    entries = []
+    for name, value in node.items():
+        if isinstance(value, dict):
+            entries.append((name, b"40000", _write_tree(git_dir, value)))
+        else:
+            mode, sha = value
+            entries.append((name, mode, sha))
+    entries.sort(key=_tree_sort_key)
+    content = b"".join(b"%s %s\0%s" % (mode, name, sha) for name, mode, sha in entries)
+    return _write_object(git_dir, b"tree", content)
+
+
+def _index_entry(path, full_path, mode, sha):
+    st = os.stat(full_path)
+    flags = min(len(path), 0xFFF)
+    entry = struct.pack(
+        ">10I20sH",
+        int(st.st_ctime) & 0xFFFFFFFF,
+        st.st_ctime_ns % 1_000_000_000,
+        int(st.st_mtime) & 0xFFFFFFFF,
+        st.st_mtime_ns % 1_000_000_000,
+        st.st_dev & 0xFFFFFFFF,
+        st.st_ino & 0xFFFFFFFF,
+        mode,
+        st.st_uid & 0xFFFFFFFF,
+        st.st_gid & 0xFFFFFFFF,
+        st.st_size & 0xFFFFFFFF,
+        sha,
+        flags,
+    )
+    entry += path
+    return entry + b"\0" * (8 - (len(entry) % 8))
+
+
+def write_initial_commit(project_dir, files, message="Initial commit"):
+    """
+    Writes the initial commit of a freshly initialized repository in-process.
+
+    The files must already exist in project_dir with the given content, so
+    the index can record their stat data and `git status` reports a clean tree.
+    If the repository needs a signed commit, has commit hooks or uses SHA-256,
+    the files are committed with `git commit` instead.
+
+    Args:
+        project_dir (str): The project directory containing an empty repository.
+        files (Iterable[tuple]): (path, content, mode) for every file to commit,
+            e.g. a ProjectTree or the result of `collect_files`.
+        message (str): The commit message.
+
+    Raises:
+        GitIdentityError: If the author or committer identity is unknown.
+        subprocess.CalledProcessError: If `git var` or the `git commit` fallback fails.
+        OSError: If the repository cannot be written.
+
+    Returns:
+        str: The hexadecimal name of the commit.
+    """
+    variables = _git_variables(project_dir)
+    author, committer = _identities(variables)
+    reason = _git_commit_reason(project_dir, variables)
+    if reason is not None:
+        report(f"Committing with git commit, since {reason}.")
+        return _git_commit(project_dir, files, message)
+    with span("write initial commit", "io") as commit_span:
+        commit_hex, bytes_written = _write_initial_commit(
+            project_dir, files, message, author, committer
+        )
+        commit_span.set(bytes_written=bytes_written)
+    return commit_hex
+
+
+def _write_initial_commit(project_dir, files, message, author, committer):
+    git_dir = os.path.join(project_dir, ".git")
+    cache_dir = get_cache_dir("git-objects")
+    cached = []
+    bytes_committed = 0
+
+    root = {}
+    index_entries = []
+    for path, content, mode in files:
+        git_mode = 0o100755 if mode & stat.S_IXUSR else 0o100644
+        sha = _write_object(git_dir, b"blob", content, cache_dir, cached)
+        bytes_committed += len(content)
+        path_bytes = path.encode("utf-8")
+        *parents, name = path_bytes.split(b"/")
+        node = root
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = (b"%o" % git_mode, sha)
+        index_entries.append(
+            (path_bytes, _index_entry(path_bytes, os.path.join(project_dir, path), git_mode, sha))
+        )
+
+    tree_sha = _write_tree(git_dir, root)
+    commit = (
+        b"tree %s\nauthor %s\ncommitter %s\n\n%s\n"
+        % (tree_sha.hex().encode(), author.encode(), committer.encode(), message.encode())
+    )
+    commit_hex = _write_object(git_dir, b"commit", commit).hex()
+
+    index_entries.sort()
+    index = b"DIRC" + struct.pack(">II", 2, len(index_entries))
+    index += b"".join(entry for _, entry in index_entries)
+    with open(os.path.join(git_dir, "index"), "wb") as f:
+        f.write(index + hashlib.sha1(index).digest())
+
+    with open(os.path.join(git_dir, "refs", "heads", "main"), "w", encoding="utf-8") as f:
+        f.write(commit_hex + "\n")
+    reflog = f"{'0' * 40} {commit_hex} {committer}\tcommit (initial): {message}\n"
+    os.makedirs(os.path.join(git_dir, "logs", "refs", "heads"), exist_ok=True)
+    for log_path in (("logs", "HEAD"), ("logs", "refs", "heads", "main")):
+        with open(os.path.join(git_dir, *log_path), "a", encoding="utf-8") as f:
+            f.write(reflog)
+    if cached:
+        evict_cached_blobs()
+    return commit_hex, bytes_committed
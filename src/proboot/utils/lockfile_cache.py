@@ -0,0 +1,93 @@
+"""
+This module caches resolved dependency lockfiles in the proboot cache.
+
+Resolving a dependency graph is the slowest part of a package install. Once a
+set of dependencies has been resolved, the resulting lockfile (and any related
+files, such as the resolved version specifiers) is stored under a key derived
+from the inputs, so later installs with the same inputs can run frozen and
+offline against the package manager's store.
+"""
+import hashlib
+import os
+import shutil
+import uuid
+
+from proboot.utils.cache_dir import get_cache_dir
+
+
+def lockfile_cache_key(*parts):
+    """
+    Derives a cache key from the inputs that determine a resolution.
+
+    Args:
+        *parts (str | bytes): Inputs such as the package manager and dependency set.
+
+    Returns:
+        str: A hexadecimal key.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:32]
+
+
+def load_cached_lockfile(key):
+    """
+    Returns the cached files for a key.
+
+    Args:
+        key (str): A key from `lockfile_cache_key`.
+
+    Returns:
+        dict[str, bytes] | None: File names mapped to their content, or None on a miss.
+    """
+    entry_dir = os.path.join(get_cache_dir("lockfiles"), key)
+    if not os.path.isdir(entry_dir):
+        return None
+    files = {}
+    for name in os.listdir(entry_dir):
+        with open(os.path.join(entry_dir, name), "rb") as f:
+            files[name] = f.read()
+    return files
+
+
+def store_cached_lockfile(key, files):
+    """
+    Stores files under a key, replacing any previous entry atomically.
+
+    Args:
+        key (str): A key from `lockfile_cache_key`.
+        files (dict[str, bytes]): File names mapped to their content.
+
+    Returns:
+        None
+    """
+    cache_dir = get_cache_dir("lockfiles")
+    staging_dir = os.path.join(cache_dir, f".{key}.{uuid.uuid4().hex}")
+    os.mkdir(staging_dir)
+    try:
+        for name, content in files.items():
+            with open(os.path.join(staging_dir, name), "wb") as f:
+                f.write(content)
+        entry_dir = os.path.join(cache_dir, key)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(staging_dir, entry_dir)
+    except OSError:
+        # Another process stored the same entry concurrently; either copy is valid.
+        pass
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def discard_cached_lockfile(key):
+    """
+    Removes a cache entry, e.g. after it failed a frozen install.
+
+    Args:
+        key (str): A key from `lockfile_cache_key`.
+
+    Returns:
+        None
+    """
+    shutil.rmtree(os.path.join(get_cache_dir("lockfiles"), key), ignore_errors=True)
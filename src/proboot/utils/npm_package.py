@@ -0,0 +1,51 @@
+"""
+This module provides helpers for the package metadata of Node projects.
+
+It converts project names to valid npm package names the way create-vite
+does, and renames a generated project by rewriting the name recorded in
+`package.json` and, for npm projects, `package-lock.json`.
+"""
+import json
+import os
+import re
+
+
+def to_valid_package_name(project_name):
+    """
+    Converts a project name to a valid npm package name.
+
+    Args:
+        project_name (str): The name of the project.
+
+    Returns:
+        str: The name lowercased, with whitespace and invalid characters replaced by "-".
+    """
+    name = re.sub(r"\s+", "-", project_name.strip().lower())
+    name = re.sub(r"^[._]", "", name)
+    return re.sub(r"[^a-z\d\-~]+", "-", name)
+
+
+def set_package_name(project_dir, project_name):
+    """
+    Records a project's package name in package.json and package-lock.json.
+
+    Args:
+        project_dir (str): Directory of the project.
+        project_name (str): The name of the project; converted with `to_valid_package_name`.
+
+    Returns:
+        None
+    """
+    package_name = to_valid_package_name(project_name)
+    for file_name in ("package.json", "package-lock.json"):
+        path = os.path.join(project_dir, file_name)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["name"] = package_name
+        root_package = data.get("packages", {}).get("")
+        if isinstance(root_package, dict) and "name" in root_package:
+            root_package["name"] = package_name
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2) + "\n")
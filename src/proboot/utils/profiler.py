@@ -0,0 +1,173 @@
+"""
+This module records a timeline of bootstrap steps and external commands.
+
+When profiling is enabled with `enable_profiling`, every `span` records its
+start and end time, thread, and optional arguments such as exit codes or bytes
+written. The timeline can be written as Chrome trace / Perfetto JSON (open it
+in chrome://tracing or https://ui.perfetto.dev) and summarized as a table.
+
+When profiling is disabled, `span` returns a shared no-op context manager, so
+instrumented code pays only a global lookup per span.
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+_recorder = None
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **args):
+        """Ignores span arguments while profiling is disabled."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, recorder, name, category, args):
+        self._recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+        self.end = None
+        self.thread_id = threading.get_ident()
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args.setdefault("error", f"{exc_type.__name__}: {exc}")
+        self._recorder.add(self)
+        return False
+
+    def set(self, **args):
+        """
+        Attaches arguments, such as exit_code or bytes_written, to the span.
+        """
+        self.args.update(args)
+
+
+class _Recorder:
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.spans = []
+        self.thread_names = {}
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+            self.thread_names.setdefault(span.thread_id, threading.current_thread().name)
+
+
+def enable_profiling():
+    """
+    Starts recording spans for the rest of the process.
+
+    Returns:
+        None
+    """
+    global _recorder  # pylint: disable=global-statement
+    _recorder = _Recorder()
+
+
+def profiling_enabled():
+    """
+    Returns whether spans are currently being recorded.
+
+    Returns:
+        bool: True if profiling is enabled.
+    """
+    return _recorder is not None
+
+
+def span(name, category="step", **args):
+    """
+    Returns a context manager that records the enclosed block as one span.
+
+    Args:
+        name (str): Name of the span, e.g. a step or command.
+        category (str): Category of the span, e.g. "step", "command" or "io".
+        **args: Extra values to attach to the span.
+
+    Returns:
+        A context manager whose value supports `set(**args)`.
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name, category, args)
+
+
+def write_chrome_trace(path):
+    """
+    Writes the recorded spans as Chrome trace / Perfetto JSON.
+
+    Args:
+        path (str): Output file path.
+
+    Returns:
+        None
+    """
+    if _recorder is None:
+        return
+    pid = os.getpid()
+    thread_ids = {}
+    events = []
+    for thread_ident, thread_name in _recorder.thread_names.items():
+        tid = thread_ids.setdefault(thread_ident, len(thread_ids) + 1)
+        events.append({
+            "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+            "args": {"name": thread_name},
+        })
+    for recorded in sorted(_recorder.spans, key=lambda s: s.start):
+        events.append({
+            "name": recorded.name,
+            "cat": recorded.category,
+            "ph": "X",
+            "ts": (recorded.start - _recorder.origin) / 1000,
+            "dur": (recorded.end - recorded.start) / 1000,
+            "pid": pid,
+            "tid": thread_ids[recorded.thread_id],
+            "args": recorded.args,
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+
+def print_summary(stream=None):
+    """
+    Prints a table of the recorded spans in start order.
+
+    Args:
+        stream (file, optional): Output stream. Defaults to stderr.
+
+    Returns:
+        None
+    """
+    if _recorder is None:
+        return
+    stream = stream or sys.stderr
+    print(f"{'Span':<40} {'Category':<8} {'Start ms':>9} {'Dur ms':>9} {'Exit':>5} {'Bytes':>10}",
+          file=stream)
+    for recorded in sorted(_recorder.spans, key=lambda s: s.start):
+        exit_code = recorded.args.get("exit_code", "")
+        bytes_written = recorded.args.get("bytes_written", "")
+        print(
+            f"{recorded.name[:40]:<40} {recorded.category:<8} "
+            f"{(recorded.start - _recorder.origin) / 1e6:>9.1f} "
+            f"{(recorded.end - recorded.start) / 1e6:>9.1f} {exit_code!s:>5} {bytes_written!s:>10}",
+            file=stream,
+        )
@@ -0,0 +1,104 @@
+"""
+This module reports the progress of a bootstrap.
+
+Library code reports progress with `report` instead of printing. Without a
+listener, messages are printed exactly as before, so the command-line output
+does not change. A caller that wants structured progress, such as the public
+API, installs a listener with `listening`. Listeners are held in a context
+variable, so concurrent bootstraps on different threads each receive only
+their own events, and the steps started by `run_steps` (which run in a copy
+of the caller's context) report to their caller's listener.
+
+Functions:
+- report: Report a message, tool output or step transition
+- listening: Send the progress reported in the current context to a callback
+- in_step: Attribute the progress reported in the current context to a step
+"""
+import contextlib
+import contextvars
+import sys
+import threading
+from collections import namedtuple
+
+ProgressEvent = namedtuple("ProgressEvent", ["kind", "message", "step", "stream"])
+ProgressEvent.__doc__ = """
+A progress event passed to a listener.
+
+Attributes:
+    kind (str): "message" for a progress message, "output" for a line of
+        output from an external tool, or "step_started", "step_finished" or
+        "step_skipped" for a step transition.
+    message (str or None): The message or output line (output lines keep
+        their newline); None for step transitions that are not printed.
+    step (str or None): The bootstrap step that reported the event, if any.
+    stream (str): "stdout" or "stderr", where the event is printed without
+        a listener.
+"""
+
+_listener = contextvars.ContextVar("proboot_progress_listener", default=None)
+_step = contextvars.ContextVar("proboot_progress_step", default=None)
+_output_lock = threading.Lock()
+
+
+def report(message, kind="message", stream="stdout"):
+    """
+    Reports a progress event to the current listener, or prints it.
+
+    Args:
+        message (str or None): The message; messages are printed with a
+            trailing newline, output lines as they are. None prints nothing.
+        kind (str): The event kind, see `ProgressEvent`.
+        stream (str): "stdout" or "stderr".
+
+    Returns:
+        None
+    """
+    listener = _listener.get()
+    if listener is not None:
+        listener(ProgressEvent(kind, message, _step.get(), stream))
+        return
+    if message is None:
+        return
+    sink = sys.stderr if stream == "stderr" else sys.stdout
+    if kind != "output":
+        message += "\n"
+    # Steps and tools running at the same time write whole lines, not interleaved ones.
+    with _output_lock:
+        sink.write(message)
+        sink.flush()
+
+
+@contextlib.contextmanager
+def listening(callback):
+    """
+    Sends the progress reported in the current context to a callback.
+
+    Args:
+        callback (callable): Called with a `ProgressEvent` for every event.
+
+    Yields:
+        None
+    """
+    token = _listener.set(callback)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
+
+
+@contextlib.contextmanager
+def in_step(name):
+    """
+    Attributes the progress reported in the current context to a step.
+
+    Args:
+        name (str): The step name.
+
+    Yields:
+        None
+    """
+    token = _step.set(name)
+    try:
+        yield
+    finally:
+        _step.reset(token)
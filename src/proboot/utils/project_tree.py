@@ -0,0 +1,172 @@
+"""
+This module provides an in-memory project tree that is written to disk in one pass.
+
+Generators contribute files to a `ProjectTree` as (path, bytes, mode) entries
+instead of opening and writing files themselves. The tree is then flushed with
+each directory created exactly once and each file written with a single
+open/write/close, optionally into a staging directory that is atomically
+renamed into place so a half-written project is never visible.
+
+Paths are relative and use forward slashes, e.g. "src/main.py".
+"""
+import hashlib
+import os
+import shutil
+import uuid
+
+from proboot.utils.profiler import span
+
+
+class ProjectTree:
+    """
+    An in-memory manifest of the files and directories of a project.
+    """
+
+    def __init__(self):
+        self._files = {}
+        self._dirs = set()
+
+    @staticmethod
+    def _normalize(path):
+        parts = [part for part in path.replace("\\", "/").split("/") if part not in ("", ".")]
+        if not parts or path.startswith("/") or ".." in parts:
+            raise ValueError(f"Invalid project tree path: {path!r}")
+        return "/".join(parts)
+
+    def add_file(self, path, content, mode=0o644):
+        """
+        Adds a file to the tree, replacing any previous content at the same path.
+
+        Args:
+            path (str): Relative path of the file.
+            content (str | bytes): File content; strings are encoded as UTF-8.
+            mode (int): Permission bits of the file.
+
+        Returns:
+            None
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self._files[self._normalize(path)] = (content, mode)
+
+    def add_dir(self, path):
+        """
+        Adds an (possibly empty) directory to the tree.
+
+        Args:
+            path (str): Relative path of the directory.
+
+        Returns:
+            None
+        """
+        self._dirs.add(self._normalize(path))
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, path):
+        return self._normalize(path) in self._files
+
+    def __iter__(self):
+        """
+        Yields (path, content, mode) for every file, sorted by path.
+        """
+        for path in sorted(self._files):
+            content, mode = self._files[path]
+            yield path, content, mode
+
+    def digest(self):
+        """
+        Returns a digest of every file's path, mode and content.
+
+        Returns:
+            str: A hexadecimal digest that changes whenever the rendered tree does.
+        """
+        digest = hashlib.sha256()
+        for path, content, mode in self:
+            digest.update(b"%s\0%o\0%d\0" % (path.encode("utf-8"), mode, len(content)))
+            digest.update(content)
+        return digest.hexdigest()[:32]
+
+    def get(self, path):
+        """
+        Returns the content of a file in the tree.
+
+        Args:
+            path (str): Relative path of the file.
+
+        Raises:
+            KeyError: If the file is not in the tree.
+
+        Returns:
+            bytes: The file content.
+        """
+        return self._files[self._normalize(path)][0]
+
+    def directories(self):
+        """
+        Returns every directory of the tree, parents before children.
+
+        Returns:
+            list[str]: Relative directory paths.
+        """
+        dirs = set(self._dirs)
+        for path in list(self._files) + list(self._dirs):
+            parent = os.path.dirname(path)
+            while parent and parent not in dirs:
+                dirs.add(parent)
+                parent = os.path.dirname(parent)
+        return sorted(dirs, key=lambda d: (d.count("/"), d))
+
+    def _flush(self, root):
+        with span("write project tree", "io", files=len(self._files)) as write_span:
+            for directory in self.directories():
+                try:
+                    os.mkdir(os.path.join(root, directory))
+                except FileExistsError:
+                    pass
+            bytes_written = 0
+            for path, content, mode in self:
+                fd = os.open(os.path.join(root, path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+                try:
+                    view = memoryview(content)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                bytes_written += len(content)
+            write_span.set(bytes_written=bytes_written)
+
+    def write(self, root, staging=False):
+        """
+        Writes the tree below root.
+
+        Args:
+            root (str): The project directory. Without staging it may already
+                exist and existing files at the same paths are overwritten.
+            staging (bool): Write into a sibling staging directory and rename it
+                to root once complete. root must not exist or must be empty.
+
+        Raises:
+            OSError: If the tree cannot be written.
+
+        Returns:
+            None
+        """
+        if not staging:
+            os.makedirs(root, exist_ok=True)
+            self._flush(root)
+            return
+
+        root = os.path.abspath(root)
+        staging_dir = os.path.join(
+            os.path.dirname(root), f".{os.path.basename(root)}.staging-{uuid.uuid4().hex}"
+        )
+        os.mkdir(staging_dir)
+        try:
+            self._flush(staging_dir)
+            if os.path.isdir(root) and not os.listdir(root):
+                os.rmdir(root)
+            os.rename(staging_dir, root)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
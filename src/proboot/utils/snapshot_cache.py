@@ -0,0 +1,377 @@
+"""
+This module caches fully generated projects as content-addressed snapshots.
+
+After a successful bootstrap, the project tree (without `.git`) is stored in
+the proboot cache: every file's content goes to `snapshots/objects/` under its
+SHA-256 (plus an executable-bit suffix), and a manifest listing paths,
+objects, symlinks and empty directories goes to `snapshots/manifests/`.
+Identical files are stored once across all snapshots.
+
+A later bootstrap with the same key materializes the manifest instead of
+generating the project: files are reflinked where the filesystem supports it
+and copied otherwise. Files below directories the caller marks as immutable
+dependency trees (such as `node_modules`) may also be hardlinked, as package
+managers do themselves; project source files never share an inode with the
+cache, so editing them cannot corrupt it.
+
+The cache is bounded: when it grows beyond `PROBOOT_SNAPSHOT_CACHE_MB`
+(default 4096) the least recently used snapshots are evicted and objects no
+longer referenced are removed. Set `PROBOOT_NO_SNAPSHOT_CACHE=1` to disable it.
+
+Stores and evictions may run concurrently in several processes and threads.
+Publishing a manifest and evicting happen under the cache lock, and an
+eviction never removes objects written or touched since the oldest store
+still in flight began. A snapshot whose objects have gone missing is not
+restored; the caller creates the project normally instead.
+"""
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+import uuid
+
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.cache_lock import cache_lock
+from proboot.utils.file_cloner import clone_file
+from proboot.utils.profiler import span
+from proboot.utils.timing_history import record_cache
+
+DEFAULT_BUDGET_MB = 4096
+_HASH_CHUNK_SIZE = 1024 * 1024
+# In-flight markers older than this belong to a store that was killed.
+STALE_INFLIGHT_SECONDS = 3600
+
+
+def snapshot_cache_enabled():
+    """
+    Returns whether generated projects should be stored and restored as snapshots.
+
+    Returns:
+        bool: True unless `PROBOOT_NO_SNAPSHOT_CACHE` is set.
+    """
+    return os.environ.get("PROBOOT_NO_SNAPSHOT_CACHE", "") in ("", "0")
+
+
+def snapshot_key(*parts):
+    """
+    Derives a snapshot key from everything that determines the generated tree.
+
+    Args:
+        *parts (str | None): E.g. project type, proboot version, template version, options.
+
+    Returns:
+        str: A hexadecimal key.
+    """
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _objects_dir():
+    return get_cache_dir("snapshots", "objects")
+
+
+def _manifests_dir():
+    return get_cache_dir("snapshots", "manifests")
+
+
+def _inflight_dir():
+    return get_cache_dir("snapshots", "inflight")
+
+
+def _object_path(object_name):
+    return os.path.join(_objects_dir(), object_name[:2], object_name[2:])
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _in_dirs(path, dir_names):
+    return any(part in dir_names for part in path.split("/")[:-1])
+
+
+def find_snapshot(key):
+    """
+    Returns the manifest stored for a key and marks it as recently used.
+
+    Args:
+        key (str): A key from `snapshot_key`.
+
+    Returns:
+        dict | None: The snapshot manifest, or None on a miss.
+    """
+    manifest_path = os.path.join(_manifests_dir(), f"{key}.json")
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        os.utime(manifest_path)
+    except (OSError, json.JSONDecodeError):
+        record_cache("snapshot", False)
+        return None
+    record_cache("snapshot", True)
+    return manifest
+
+
+def _top_level(paths):
+    return {path.split("/", 1)[0] for path in paths}
+
+
+def restore_snapshot(manifest, project_dir):
+    """
+    Materializes a snapshot into an existing project directory.
+
+    The manifest's objects are checked before anything is written. If one is
+    missing, e.g. because it was evicted, or the tree cannot be written, the
+    files restored so far are removed again, so the caller can create the
+    project normally instead.
+
+    Files in `.bin` directories that mention the directory the snapshot was
+    stored from, such as pnpm's shims with their absolute NODE_PATH, are
+    rewritten to point at project_dir.
+
+    Args:
+        manifest (dict): A manifest as returned by `find_snapshot`.
+        project_dir (str): The project directory.
+
+    Returns:
+        bool: True if the snapshot was restored; False if it was incomplete or
+        could not be written, with the project directory left as it was.
+    """
+    hardlink_dirs = set(manifest.get("hardlink_dirs", ()))
+    old_prefix = manifest.get("prefix", "").encode()
+    new_prefix = os.path.abspath(project_dir).encode()
+    if not all(os.path.isfile(_object_path(object_name)) for _, object_name in manifest["files"]):
+        record_cache("snapshot", False)
+        return False
+    try:
+        with span("restore snapshot", "io", files=len(manifest["files"])):
+            for directory in manifest["dirs"]:
+                os.makedirs(os.path.join(project_dir, directory), exist_ok=True)
+            for path, object_name in manifest["files"]:
+                object_path = _object_path(object_name)
+                target_path = os.path.join(project_dir, path)
+                if old_prefix and _in_dirs(path, (".bin",)):
+                    with open(object_path, "rb") as f:
+                        content = f.read()
+                    if old_prefix in content:
+                        with open(target_path, "wb") as f:
+                            f.write(content.replace(old_prefix, new_prefix))
+                        shutil.copymode(object_path, target_path)
+                        continue
+                clone_file(object_path, target_path, allow_hardlink=_in_dirs(path, hardlink_dirs))
+            for path, target in manifest["symlinks"]:
+                os.symlink(target, os.path.join(project_dir, path))
+    except OSError:
+        paths = manifest["dirs"] + [path for path, _ in manifest["files"] + manifest["symlinks"]]
+        for name in _top_level(paths):
+            full_path = os.path.join(project_dir, name)
+            if os.path.isdir(full_path) and not os.path.islink(full_path):
+                shutil.rmtree(full_path, ignore_errors=True)
+            elif os.path.lexists(full_path):
+                os.remove(full_path)
+        record_cache("snapshot", False)
+        return False
+    return True
+
+
+def _store_object(full_path, object_path, allow_hardlink):
+    """
+    Stores a file as an object, or marks an existing object as in use.
+
+    Objects touched by a store are newer than its in-flight marker, so a
+    concurrent eviction leaves them alone.
+    """
+    try:
+        os.utime(object_path)
+        return
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+    temp_path = f"{object_path}.{uuid.uuid4().hex}.tmp"
+    clone_file(full_path, temp_path, allow_hardlink=allow_hardlink)
+    os.utime(temp_path)
+    os.replace(temp_path, object_path)
+
+
+def store_snapshot(key, project_dir, exclude_dirs=(".git",), hardlink_dirs=("node_modules",)):
+    """
+    Stores a freshly generated project as the snapshot for a key.
+
+    Objects are written without holding the cache lock, while an in-flight
+    marker keeps concurrent evictions from removing them. The manifest is
+    published under the lock, after any object evicted in the meantime has
+    been stored again.
+
+    Args:
+        key (str): A key from `snapshot_key`.
+        project_dir (str): The generated project directory.
+        exclude_dirs (Iterable[str]): Directory names left out of the snapshot.
+        hardlink_dirs (Iterable[str]): Directory names whose files are immutable
+            dependencies that may be hardlinked to and from the cache.
+
+    Raises:
+        OSError: If the snapshot cannot be stored.
+
+    Returns:
+        None
+    """
+    excluded = set(exclude_dirs)
+    hardlinked = set(hardlink_dirs)
+    manifest = {
+        "key": key,
+        "created": time.time(),
+        "prefix": os.path.abspath(project_dir),
+        "hardlink_dirs": sorted(hardlinked),
+        "dirs": [],
+        "files": [],
+        "symlinks": [],
+    }
+    sources = {}
+    marker_path = os.path.join(_inflight_dir(), uuid.uuid4().hex)
+    with open(marker_path, "w", encoding="utf-8"):
+        pass
+    try:
+        with span("store snapshot", "io"):
+            for root, dirs, files in os.walk(project_dir):
+                relative_root = os.path.relpath(root, project_dir).replace(os.sep, "/")
+                relative_root = "" if relative_root == "." else relative_root + "/"
+                for name in list(dirs):
+                    full_path = os.path.join(root, name)
+                    if name in excluded:
+                        dirs.remove(name)
+                    elif os.path.islink(full_path):
+                        manifest["symlinks"].append([relative_root + name, os.readlink(full_path)])
+                        dirs.remove(name)
+                    else:
+                        manifest["dirs"].append(relative_root + name)
+                for name in files:
+                    full_path = os.path.join(root, name)
+                    path = relative_root + name
+                    if os.path.islink(full_path):
+                        manifest["symlinks"].append([path, os.readlink(full_path)])
+                        continue
+                    mode = os.stat(full_path).st_mode
+                    object_name = _file_digest(full_path) + ("x" if mode & stat.S_IXUSR else "")
+                    _store_object(full_path, _object_path(object_name), _in_dirs(path, hardlinked))
+                    sources[object_name] = (full_path, _in_dirs(path, hardlinked))
+                    manifest["files"].append([path, object_name])
+
+            with cache_lock("snapshots"):
+                for object_name, (full_path, allow_hardlink) in sources.items():
+                    _store_object(full_path, _object_path(object_name), allow_hardlink)
+                manifest_path = os.path.join(_manifests_dir(), f"{key}.json")
+                temp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f)
+                os.replace(temp_path, manifest_path)
+    finally:
+        os.remove(marker_path)
+    evict_snapshots()
+
+
+def _budget_bytes():
+    try:
+        return int(os.environ.get("PROBOOT_SNAPSHOT_CACHE_MB", DEFAULT_BUDGET_MB)) * 1024 * 1024
+    except ValueError:
+        return DEFAULT_BUDGET_MB * 1024 * 1024
+
+
+def _oldest_inflight_store():
+    """
+    Returns the start time of the oldest store still writing objects, or None.
+    """
+    inflight_dir = _inflight_dir()
+    oldest = None
+    for name in os.listdir(inflight_dir):
+        path = os.path.join(inflight_dir, name)
+        try:
+            started = os.path.getmtime(path)
+        except FileNotFoundError:
+            continue
+        if started < time.time() - STALE_INFLIGHT_SECONDS:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        elif oldest is None or started < oldest:
+            oldest = started
+    return oldest
+
+
+def evict_snapshots(budget_bytes=None):
+    """
+    Evicts least recently used snapshots until the cache fits its size budget.
+
+    Runs under the cache lock. Objects written or touched since the oldest
+    in-flight store started are never removed, since that store's manifest
+    may still come to reference them.
+
+    Args:
+        budget_bytes (int, optional): Size budget. Defaults to `PROBOOT_SNAPSHOT_CACHE_MB`.
+
+    Returns:
+        int: The number of snapshots evicted.
+    """
+    budget_bytes = _budget_bytes() if budget_bytes is None else budget_bytes
+    with cache_lock("snapshots"):
+        return _evict(budget_bytes)
+
+
+def _evict(budget_bytes):
+    objects_dir = _objects_dir()
+    protected_since = _oldest_inflight_store()
+    object_sizes = {}
+    object_mtimes = {}
+    for prefix in os.listdir(objects_dir):
+        for name in os.listdir(os.path.join(objects_dir, prefix)):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                info = os.stat(os.path.join(objects_dir, prefix, name))
+            except FileNotFoundError:
+                continue
+            object_sizes[prefix + name] = info.st_size
+            object_mtimes[prefix + name] = info.st_mtime
+    total = sum(object_sizes.values())
+    if total <= budget_bytes:
+        return 0
+
+    manifests_dir = _manifests_dir()
+    manifests = []
+    for name in os.listdir(manifests_dir):
+        if name.endswith(".json"):
+            path = os.path.join(manifests_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    objects = {object_name for _, object_name in json.load(f)["files"]}
+                manifests.append((os.path.getmtime(path), path, objects))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, KeyError):
+                _remove(path)
+    manifests.sort()
+
+    evicted = 0
+    while manifests and total > budget_bytes:
+        _, path, _ = manifests.pop(0)
+        _remove(path)
+        evicted += 1
+        referenced = set().union(*(objects for _, _, objects in manifests))
+        for object_name in [name for name in object_sizes if name not in referenced]:
+            if protected_since is not None and object_mtimes[object_name] >= protected_since:
+                continue
+            _remove(_object_path(object_name))
+            total -= object_sizes.pop(object_name)
+    return evicted
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
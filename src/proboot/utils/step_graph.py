@@ -0,0 +1,157 @@
+"""
+This module runs bootstrap steps as a dependency graph.
+
+Bootstrappers declare their work as a list of steps, each naming the steps it
+depends on. `run_steps` executes every step whose dependencies have finished
+on a thread pool, so independent steps (for example writing project files and
+creating a virtual environment) overlap and the total time approaches that of
+the longest dependency chain rather than the sum of all steps.
+
+Steps must not change process-global state such as the working directory,
+since they share the process with each other. Each step runs in a copy of the
+caller's context, so context variables (such as the daemon's per-request
+output target) are visible inside steps.
+
+Given a `StepJournal`, completed steps are recorded as they finish, and steps
+recorded by a previous, failed run are skipped if their inputs are unchanged
+and none of their dependencies has to run again.
+
+Steps report "step_started" and "step_finished" progress events, and the
+progress reported inside a step is attributed to it. The duration of every
+completed step is recorded in the timing history.
+"""
+import contextvars
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from proboot.utils.profiler import span
+from proboot.utils.progress import in_step, report
+from proboot.utils.step_journal import step_digest
+from proboot.utils.timing_history import record_step
+
+Step = namedtuple("Step", ["name", "func", "depends_on", "inputs"], defaults=[(), None])
+Step.__doc__ = """
+A unit of bootstrap work.
+
+Attributes:
+    name (str): Unique name of the step.
+    func (callable): Called with no arguments to perform the step.
+    depends_on (tuple[str]): Names of the steps that must finish first.
+    inputs (object): JSON-serializable description of everything the step's
+        result depends on besides its dependencies, used by the step journal
+        to decide whether a completed step is still valid.
+"""
+
+
+def _validate(steps):
+    """
+    Checks that step names are unique, dependencies exist and there are no cycles.
+
+    Raises:
+        ValueError: If the graph is invalid.
+    """
+    names = [step.name for step in steps]
+    if len(names) != len(set(names)):
+        raise ValueError("Step names must be unique.")
+    known = set(names)
+    for step in steps:
+        missing = set(step.depends_on) - known
+        if missing:
+            raise ValueError(f"Step {step.name} depends on unknown steps: {sorted(missing)}")
+
+    remaining = {step.name: set(step.depends_on) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Steps form a dependency cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _plan_resume(steps, journal):
+    """
+    Returns the names of the steps a journal allows skipping.
+
+    A step is skipped if it completed with the same inputs and all of its
+    dependencies are skipped too. The journal entries of every other step are
+    invalidated before anything runs, so an interrupted resume never leaves a
+    stale entry behind a step that ran again.
+    """
+    digests = {step.name: step_digest(step) for step in steps}
+    skipped = set()
+    changed = True
+    while changed:
+        changed = False
+        for step in steps:
+            if (step.name not in skipped and skipped.issuperset(step.depends_on)
+                    and journal.is_complete(step.name, digests[step.name])):
+                skipped.add(step.name)
+                changed = True
+    journal.invalidate(name for name in digests if name not in skipped)
+    return skipped
+
+
+def _run_step(step):
+    with in_step(step.name), span(step.name, "step"):
+        report(None, "step_started")
+        start = time.perf_counter()
+        step.func()
+        record_step(step.name, time.perf_counter() - start)
+        report(None, "step_finished")
+
+
+def run_steps(steps, max_workers=None, journal=None):
+    """
+    Runs steps concurrently, starting each one as soon as its dependencies finish.
+
+    If a step raises, no further steps are started, the running ones are
+    allowed to finish and the first exception is re-raised.
+
+    Args:
+        steps (list[Step]): The steps to run.
+        max_workers (int, optional): Maximum number of steps running at once.
+            Defaults to the number of steps.
+        journal (StepJournal, optional): Journal recording completed steps.
+            Steps it lists as completed with unchanged inputs are skipped.
+
+    Raises:
+        ValueError: If the step graph is invalid.
+        Exception: The first exception raised by a step.
+
+    Returns:
+        None
+    """
+    _validate(steps)
+    done = _plan_resume(steps, journal) if journal is not None else set()
+    for name in sorted(done):
+        with in_step(name):
+            report(f"Skipping step {name} (completed by a previous run)", "step_skipped")
+    steps_by_name = {step.name: step for step in steps}
+    pending = {name: step for name, step in steps_by_name.items() if name not in done}
+    error = None
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(steps), 1)) as executor:
+        running = {}
+        while pending or running:
+            if error is None:
+                for name, step in list(pending.items()):
+                    if done.issuperset(step.depends_on):
+                        context = contextvars.copy_context()
+                        running[executor.submit(context.run, _run_step, step)] = name
+                        del pending[name]
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                exception = future.exception()
+                if exception is not None:
+                    error = error or exception
+                else:
+                    done.add(name)
+                    if journal is not None:
+                        journal.record(name, step_digest(steps_by_name[name]))
+    if error is not None:
+        raise error
@@ -0,0 +1,148 @@
+"""
+This module records which bootstrap steps of a project have completed.
+
+While a project is bootstrapped, every finished step is recorded in a journal
+inside the project directory (`.proboot/journal.json`) together with a digest
+of the step's inputs. The journal is removed once the bootstrap succeeds, so
+it only remains behind a failed or interrupted run. Resuming such a run skips
+every step whose recorded digest still matches and whose dependencies were
+skipped as well; all other steps, and everything that depends on them, run
+again.
+
+A journal written by a different proboot version is ignored, since steps may
+produce different output across versions.
+"""
+import hashlib
+import json
+import os
+import uuid
+
+from proboot import __version__
+from proboot.utils.progress import report
+
+JOURNAL_DIR = ".proboot"
+JOURNAL_FILE = "journal.json"
+
+
+def step_digest(step):
+    """
+    Returns the digest identifying a step and its inputs.
+
+    Args:
+        step (Step): The step; its `inputs` must be JSON-serializable.
+
+    Returns:
+        str: A hexadecimal digest.
+    """
+    payload = json.dumps([step.name, step.inputs], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class StepJournal:
+    """
+    The completed steps of one project's bootstrap.
+    """
+
+    def __init__(self, project_dir, steps=None):
+        self._dir = os.path.join(project_dir, JOURNAL_DIR)
+        self._steps = dict(steps or {})
+
+    @classmethod
+    def open(cls, project_dir, resume=False):
+        """
+        Returns the journal for a bootstrap of project_dir.
+
+        Args:
+            project_dir (str): The project directory.
+            resume (bool): Whether to continue a previous bootstrap. If the
+                project directory does not exist yet, the bootstrap starts
+                from scratch.
+
+        Raises:
+            ValueError: If resuming a project directory that has no journal.
+
+        Returns:
+            StepJournal: The loaded journal, or an empty one.
+        """
+        if not resume or not os.path.isdir(project_dir):
+            return cls(project_dir)
+        path = os.path.join(project_dir, JOURNAL_DIR, JOURNAL_FILE)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(
+                f"{project_dir} has no bootstrap journal; there is nothing to resume."
+            ) from None
+        except (OSError, ValueError) as e:
+            report(f"Ignoring unreadable bootstrap journal ({e}); running every step again")
+            return cls(project_dir)
+        if data.get("version") != __version__:
+            report(f"Bootstrap journal was written by proboot {data.get('version')}; "
+                  "running every step again")
+            return cls(project_dir)
+        return cls(project_dir, data.get("steps"))
+
+    def is_complete(self, name, digest):
+        """
+        Checks whether a step completed with the given input digest.
+
+        Args:
+            name (str): The step name.
+            digest (str): The digest from `step_digest`.
+
+        Returns:
+            bool: True if the step can be skipped.
+        """
+        return self._steps.get(name) == digest
+
+    def invalidate(self, names):
+        """
+        Forgets steps that are about to run again.
+
+        Args:
+            names (Iterable[str]): The step names.
+
+        Returns:
+            None
+        """
+        removed = [self._steps.pop(name) for name in names if name in self._steps]
+        if removed:
+            self._save()
+
+    def record(self, name, digest):
+        """
+        Records a completed step.
+
+        Args:
+            name (str): The step name.
+            digest (str): The digest from `step_digest`.
+
+        Returns:
+            None
+        """
+        self._steps[name] = digest
+        self._save()
+
+    def discard(self):
+        """
+        Removes the journal after a successful bootstrap.
+
+        Returns:
+            None
+        """
+        try:
+            os.unlink(os.path.join(self._dir, JOURNAL_FILE))
+            # The directory also holds other proboot metadata, such as the
+            # template baseline, in which case it stays.
+            os.rmdir(self._dir)
+        except OSError:
+            pass
+
+    def _save(self):
+        os.makedirs(self._dir, exist_ok=True)
+        path = os.path.join(self._dir, JOURNAL_FILE)
+        temp_path = f"{path}.{uuid.uuid4().hex}"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": __version__, "steps": self._steps}, f, indent=2)
+        os.replace(temp_path, path)
@@ -0,0 +1,151 @@
+"""
+This module records the template output a project was last synced with.
+
+When proboot generates a project it stores a baseline in
+`.proboot/baseline.json`: the project type, name and the template options it
+was rendered with (such as its dependencies), the proboot version and,
+for every generated file, its content and SHA-256 hash. `proboot update`
+compares the current templates against this baseline and the files on disk to
+tell template changes from user edits, and uses the baseline content as the
+common ancestor of a three-way merge. The baseline is committed with the
+project, so every clone of it can be updated.
+
+Contents are stored as text; bytes that are not valid UTF-8 are preserved
+with surrogate escapes.
+"""
+import hashlib
+import json
+import os
+import uuid
+
+from proboot import __version__
+
+BASELINE_PATH = ".proboot/baseline.json"
+
+
+def content_hash(content):
+    """
+    Returns the hash used to compare file contents.
+
+    Args:
+        content (bytes): The file content.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def baseline_entry(content):
+    """
+    Returns the baseline record of one generated file.
+
+    Args:
+        content (bytes): The generated content.
+
+    Returns:
+        dict: The file's hash and content.
+    """
+    return {
+        "sha256": content_hash(content),
+        "content": content.decode("utf-8", errors="surrogateescape"),
+    }
+
+
+def entry_content(entry):
+    """
+    Returns the content stored in a baseline record.
+
+    Args:
+        entry (dict): A record as returned by `baseline_entry`.
+
+    Returns:
+        bytes: The generated content.
+    """
+    return entry["content"].encode("utf-8", errors="surrogateescape")
+
+
+def render_baseline(project_type, project_name, files, options=None):
+    """
+    Serializes a baseline.
+
+    Args:
+        project_type (str): The project type.
+        project_name (str): The project name the templates were rendered with.
+        files (dict[str, dict]): Records as returned by `baseline_entry`, by path.
+        options (dict, optional): Other template inputs, such as "dependencies".
+
+    Returns:
+        bytes: The content of the baseline file.
+    """
+    baseline = {
+        "version": __version__,
+        "type": project_type,
+        "project_name": project_name,
+    }
+    if options:
+        baseline["options"] = options
+    baseline["files"] = dict(sorted(files.items()))
+    return (json.dumps(baseline, indent=2) + "\n").encode("utf-8")
+
+
+def add_baseline(tree, project_type, project_name, options=None):
+    """
+    Adds the baseline of a freshly rendered project to its tree.
+
+    Args:
+        tree (ProjectTree): The rendered project files.
+        project_type (str): The project type.
+        project_name (str): The project name.
+        options (dict, optional): Other template inputs, such as "dependencies".
+
+    Returns:
+        None
+    """
+    files = {path: baseline_entry(content) for path, content, _ in tree}
+    tree.add_file(BASELINE_PATH, render_baseline(project_type, project_name, files, options))
+
+
+def load_baseline(project_dir):
+    """
+    Reads a project's baseline.
+
+    Args:
+        project_dir (str): The project directory.
+
+    Raises:
+        ValueError: If the baseline file is corrupt.
+
+    Returns:
+        dict | None: The baseline, or None if the project has none.
+    """
+    try:
+        with open(os.path.join(project_dir, BASELINE_PATH), encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        return None
+    if not isinstance(baseline, dict) or not isinstance(baseline.get("files"), dict):
+        raise ValueError(f"{BASELINE_PATH} in {project_dir} is corrupt")
+    return baseline
+
+
+def write_baseline(project_dir, project_type, project_name, files, options=None):
+    """
+    Replaces a project's baseline atomically.
+
+    Args:
+        project_dir (str): The project directory.
+        project_type (str): The project type.
+        project_name (str): The project name.
+        files (dict[str, dict]): Records as returned by `baseline_entry`, by path.
+        options (dict, optional): Other template inputs, such as "dependencies".
+
+    Returns:
+        None
+    """
+    path = os.path.join(project_dir, BASELINE_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}"
+    with open(temp_path, "wb") as f:
+        f.write(render_baseline(project_type, project_name, files, options))
+    os.replace(temp_path, path)
@@ -0,0 +1,47 @@
+"""
+This module merges two edits of a file against their common ancestor.
+
+The merge is delegated to `git merge-file`, which proboot can rely on because
+it already needs git to initialize repositories. Conflicts are marked with
+the usual `<<<<<<<`/`=======`/`>>>>>>>` markers.
+"""
+import os
+import subprocess
+import tempfile
+
+from proboot.utils.command_runner import run_command
+
+
+def merge_three_way(current, base, new, labels=("current", "base", "new")):
+    """
+    Merges the changes from base to new into current.
+
+    Args:
+        current (bytes): The local version of the file.
+        base (bytes): The common ancestor.
+        new (bytes): The incoming version of the file.
+        labels (tuple[str, str, str]): Conflict marker labels for the three versions.
+
+    Raises:
+        subprocess.CalledProcessError: If `git merge-file` fails.
+
+    Returns:
+        tuple: A tuple containing:
+            - merged (bytes): The merged content, with conflict markers if any.
+            - conflicts (int): The number of conflicting hunks.
+    """
+    with tempfile.TemporaryDirectory(prefix="proboot-merge-") as temp_dir:
+        paths = []
+        for name, content in zip(("current", "base", "new"), (current, base, new)):
+            path = os.path.join(temp_dir, name)
+            with open(path, "wb") as f:
+                f.write(content)
+            paths.append(path)
+        args = ["git", "merge-file", "-p"]
+        for label in labels:
+            args += ["-L", label]
+        result = run_command(args + paths, capture_output=True, check=False)
+    # The exit status is the number of conflicts, or negative (>127) on error.
+    if not 0 <= result.returncode <= 127:
+        raise subprocess.CalledProcessError(result.returncode, args, result.stdout, result.stderr)
+    return result.stdout.encode("utf-8"), result.returncode
@@ -0,0 +1,189 @@
+"""
+This module keeps a local history of bootstrap timings.
+
+Every bootstrap appends one record to `history/timings.jsonl` in the cache
+directory. Each record holds the project type, the host, whether the bootstrap
+succeeded, its total time, the time of every step that ran and the outcome of
+each cache it consulted (golden venv, snapshot, lockfile, template), e.g.:
+
+    {"time":1760000000.0,"type":"python","host":"ci-7","version":"0.5.0","ok":true,
+     "total":0.412,"steps":{"directory":0.0004,"venv":0.21},"cache":{"venv":"hit"}}
+
+Records are written with a single append, so concurrent bootstraps, whether on
+threads or in separate processes, never interleave lines. When the file grows
+past `MAX_HISTORY_BYTES` it is rotated to `timings.jsonl.1`, keeping the
+history bounded. Rotation happens under the cache lock and re-checks the size
+first, so concurrent bootstraps rotate once instead of overwriting the rotated
+file with a nearly empty one. Set `PROBOOT_NO_HISTORY=1` to disable recording.
+
+Steps and caches report to the record of the bootstrap they run in, which is
+held in a context variable like the progress listener, so concurrent
+bootstraps each record only their own timings. Outside `recording`, the
+`record_*` functions do nothing.
+
+Functions:
+- history_enabled: Whether bootstrap timings should be recorded
+- recording: Record the timings of the bootstrap run in the current context
+- record_step: Record the duration of a step
+- record_cache: Record whether a cache lookup hit
+- read_history: Read the recorded bootstraps, oldest first
+"""
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+
+from proboot import __version__
+from proboot.utils.cache_dir import get_cache_dir
+from proboot.utils.cache_lock import cache_lock
+
+HISTORY_FILE = "timings.jsonl"
+MAX_HISTORY_BYTES = 32 * 1024 * 1024
+
+_record = contextvars.ContextVar("proboot_timing_record", default=None)
+_record_lock = threading.Lock()
+
+
+def history_enabled():
+    """
+    Returns whether bootstrap timings should be recorded.
+
+    Returns:
+        bool: False if the `PROBOOT_NO_HISTORY` environment variable is set.
+    """
+    return not os.environ.get("PROBOOT_NO_HISTORY")
+
+
+def _history_path():
+    return os.path.join(get_cache_dir("history"), HISTORY_FILE)
+
+
+def _append(record):
+    """
+    Appends a record to the history file; failures only lose the record.
+    """
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    try:
+        path = _history_path()
+        try:
+            if os.path.getsize(path) + len(line) > MAX_HISTORY_BYTES:
+                with cache_lock("history"):
+                    if os.path.getsize(path) + len(line) > MAX_HISTORY_BYTES:
+                        os.replace(path, f"{path}.1")
+        except OSError:
+            pass
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+@contextlib.contextmanager
+def recording(project_type):
+    """
+    Records the timings of the bootstrap run in the current context.
+
+    The record is appended to the history when the block exits, also when it
+    raises (as a failed bootstrap).
+
+    Args:
+        project_type (str): The project type, e.g. "python" or "workspace".
+
+    Yields:
+        None
+    """
+    if not history_enabled() or _record.get() is not None:
+        yield
+        return
+    # pylint: disable=import-outside-toplevel
+    import socket
+
+    record = {
+        "time": round(time.time(), 3),
+        "type": project_type,
+        "host": socket.gethostname(),
+        "version": __version__,
+        "ok": False,
+        "total": None,
+        "steps": {},
+        "cache": {},
+    }
+    token = _record.set(record)
+    start = time.perf_counter()
+    try:
+        yield
+        record["ok"] = True
+    finally:
+        _record.reset(token)
+        record["total"] = round(time.perf_counter() - start, 4)
+        _append(record)
+
+
+def record_step(name, seconds):
+    """
+    Records the duration of a step of the current bootstrap.
+
+    Args:
+        name (str): The step name.
+        seconds (float): The step's wall time.
+
+    Returns:
+        None
+    """
+    record = _record.get()
+    if record is not None:
+        with _record_lock:
+            record["steps"][name] = round(seconds, 4)
+
+
+def record_cache(name, hit):
+    """
+    Records whether a cache lookup of the current bootstrap hit.
+
+    Args:
+        name (str): The cache, e.g. "venv", "snapshot", "lockfile" or "template".
+        hit (bool): Whether the cached result was used.
+
+    Returns:
+        None
+    """
+    record = _record.get()
+    if record is not None:
+        with _record_lock:
+            record["cache"][name] = "hit" if hit else "miss"
+
+
+def read_history(since=None):
+    """
+    Reads the recorded bootstraps, oldest first.
+
+    Lines that cannot be parsed, e.g. the last one of a file being written
+    concurrently, are skipped.
+
+    Args:
+        since (float, optional): Only return bootstraps started at or after
+            this Unix time.
+
+    Returns:
+        list[dict]: The records.
+    """
+    path = _history_path()
+    records = []
+    for file_path in (f"{path}.1", path):
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict) and (since is None or record.get("time", 0) >= since):
+                        records.append(record)
+        except OSError:
+            continue
+    return records
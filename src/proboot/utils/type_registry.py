@@ -0,0 +1,196 @@
+"""
+This module keeps the registry of project types that proboot can bootstrap.
+
+Project types are discovered through the `proboot.project_types` entry point
+group, so third-party packages can ship their own bootstrappers:
+
+    [project.entry-points."proboot.project_types"]
+    django = "proboot_django:bootstrap"
+
+The entry point names a callable that is invoked as
+`bootstrap(project_name, init_git, parent_dir=..., resume=..., **options)`,
+where options are the keyword arguments among `template_version`,
+`package_manager`, `dependencies`, `wheelhouse`, `template_archive`,
+`variables`, `target`, `module` and `strict` that its signature accepts.
+The built-in types are always registered; a plugin registering the same name
+replaces the built-in one.
+
+Scanning the installed distributions for entry points means reading every
+dist-info on sys.path, which would make start-up grow with the size of the
+environment. The scan result is therefore stored in a small index file in the
+cache directory, keyed by the modification times of the sys.path directories
+(installing or removing a distribution touches its directory). A warm start
+reads that one file and stats each sys.path entry, however many plugins are
+installed, and no plugin is imported until its type is selected.
+
+Functions:
+- project_type_names: List the names of all registered project types
+- load_bootstrapper: Import and return the bootstrapper of a project type
+"""
+import os
+import sys
+
+from proboot import __version__
+from proboot.utils.cache_dir import get_cache_dir
+
+ENTRY_POINT_GROUP = "proboot.project_types"
+INDEX_FORMAT = "proboot-project-types 1"
+
+BUILTIN_TYPES = {
+    "python": "proboot.features.python_project.bootstrapper:bootstrap_python_project",
+    "react-typescript": (
+        "proboot.features.react_typescript_project.bootstrapper:"
+        "bootstrap_react_typescript_project"
+    ),
+    "typescript": "proboot.features.typescript_project.bootstrapper:bootstrap_typescript_project",
+    "archive": "proboot.features.archive_project.bootstrapper:bootstrap_archive_project",
+}
+
+_registry = None
+
+
+def _index_key():
+    """
+    Returns a string that changes whenever distributions on sys.path change.
+
+    The current directory is left out: it is on sys.path when proboot runs as
+    `python -m proboot`, and bootstrapping a project changes its mtime.
+    """
+    cwd = os.getcwd()
+    parts = [__version__, sys.prefix]
+    for entry in sys.path:
+        path = os.path.abspath(entry or ".")
+        if path == cwd:
+            continue
+        try:
+            parts.append(f"{path}={os.stat(path).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}=-")
+    return "\x1f".join(parts)
+
+
+def _index_path():
+    """
+    Returns the index file of the running interpreter's environment.
+    """
+    # pylint: disable=import-outside-toplevel
+    from zlib import crc32
+
+    return os.path.join(get_cache_dir(), f"project-types-{crc32(sys.prefix.encode()):08x}.idx")
+
+
+def _read_index(path, key):
+    """
+    Reads an index file, returning None if it is missing or stale.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    except OSError:
+        return None
+    if len(lines) < 2 or lines[0] != INDEX_FORMAT or lines[1] != key:
+        return None
+    registry = {}
+    for line in lines[2:]:
+        name, _, value = line.partition("\t")
+        if name and value:
+            registry[name] = value
+    return registry
+
+
+def _scan_entry_points():
+    """
+    Scans the installed distributions for project type entry points.
+    """
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import entry_points
+
+    registry = dict(BUILTIN_TYPES)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        registry[entry_point.name] = entry_point.value
+    return registry
+
+
+def _write_index(path, key, registry):
+    """
+    Writes an index file atomically; failures only cost a rescan next time.
+    """
+    lines = [INDEX_FORMAT, key]
+    lines.extend(f"{name}\t{value}" for name, value in registry.items()
+                 if "\t" not in name and "\n" not in name + value)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_registry(rescan=False):
+    """
+    Returns the registry {name: "module:attribute"}, from the index if it is current.
+    """
+    global _registry  # pylint: disable=global-statement
+    if _registry is not None and not rescan:
+        return _registry
+    key = _index_key()
+    try:
+        path = _index_path()
+    except OSError:
+        path = None
+    registry = None if rescan or path is None else _read_index(path, key)
+    if registry is None:
+        registry = _scan_entry_points()
+        if path is not None:
+            _write_index(path, key, registry)
+    _registry = registry
+    return registry
+
+
+def project_type_names():
+    """
+    Lists the names of all registered project types.
+
+    Returns:
+        list[str]: The built-in types first, then plugin types in name order.
+    """
+    registry = _load_registry()
+    plugins = sorted(name for name in registry if name not in BUILTIN_TYPES)
+    return [*BUILTIN_TYPES, *plugins]
+
+
+def load_bootstrapper(project_type):
+    """
+    Imports and returns the bootstrapper of a project type.
+
+    Args:
+        project_type (str): The name of the project type.
+
+    Raises:
+        ValueError: If the type is not registered or its bootstrapper cannot
+            be imported.
+
+    Returns:
+        callable: The project type's bootstrap function.
+    """
+    # pylint: disable=import-outside-toplevel
+    from importlib import import_module
+
+    value = _load_registry().get(project_type)
+    if value is None:
+        # The index may predate a plugin installed into an unchanged directory.
+        value = _load_registry(rescan=True).get(project_type)
+        if value is None:
+            raise ValueError(f"Project type {project_type} is not supported yet.")
+    module_name, _, attribute = value.partition(":")
+    try:
+        bootstrapper = import_module(module_name.strip())
+        for part in attribute.strip().split("."):
+            bootstrapper = getattr(bootstrapper, part)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Project type {project_type} could not be loaded from {value}: {e}") from e
+    return bootstrapper
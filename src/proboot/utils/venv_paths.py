@@ -0,0 +1,38 @@
+"""
+This module locates the directories inside a virtual environment.
+
+The layout depends on the platform and on the interpreter that created the
+environment; proboot only creates environments with the running interpreter.
+"""
+import os
+import sys
+
+
+def scripts_dir(venv_dir):
+    """
+    Returns the directory holding the environment's executables.
+
+    Args:
+        venv_dir (str): The virtual environment directory.
+
+    Returns:
+        str: `Scripts` on Windows, `bin` elsewhere.
+    """
+    return os.path.join(venv_dir, "Scripts" if sys.platform == "win32" else "bin")
+
+
+def site_packages_dir(venv_dir):
+    """
+    Returns the site-packages directory of an environment created by the
+    running interpreter.
+
+    Args:
+        venv_dir (str): The virtual environment directory.
+
+    Returns:
+        str: The site-packages directory.
+    """
+    if sys.platform == "win32":
+        return os.path.join(venv_dir, "Lib", "site-packages")
+    python = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    return os.path.join(venv_dir, "lib", python, "site-packages")